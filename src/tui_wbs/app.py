@@ -4,8 +4,12 @@ from __future__ import annotations
 
 import os
 import uuid
+from collections import deque
+from collections.abc import Callable
 from dataclasses import replace
 from datetime import date
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 
 from textual.app import App, ComposeResult
@@ -29,6 +33,8 @@ from tui_wbs.models import (
     days_to_duration,
     duration_to_days,
     has_incomplete_dependencies,
+    preorder_nodes,
+    roots_changed,
 )
 from tui_wbs.parser import parse_project
 from tui_wbs.screens.confirm_screen import ConfirmScreen
@@ -57,6 +63,7 @@ _KOREAN_TO_LATIN: dict[str, str] = {
 }
 
 _AUTOSAVE_DELAY = 2.0  # seconds
+_UNDO_LIMIT = 50
 
 
 def _build_sample_content(name: str = "My Project") -> str:
@@ -226,9 +233,14 @@ class WBSApp(App):
         self._search_query: str = ""
         self._search_matches: list[str] = []  # node IDs
         self._search_index: int = -1
-        self._undo_stack: list[list[WBSDocument]] = []
+        self._undo_stack: deque[list[WBSDocument]] = deque(maxlen=_UNDO_LIMIT)
         self._redo_stack: list[list[WBSDocument]] = []
         self._kanban_selected_id: str = ""
+        # Filtered/sorted roots from the last _refresh_ui, the source roots
+        # and view settings they were computed from
+        self._displayed_roots: list[WBSNode] = []
+        self._displayed_source: tuple[WBSNode, ...] = ()
+        self._displayed_key: tuple | None = None
         self._autosave_timer: object | None = None
         self._settings: dict = {}
         self._scroll_syncing: bool = False
@@ -307,14 +319,8 @@ class WBSApp(App):
         if self.project:
             for node in self.project.all_nodes():
                 self._node_map[node.id] = node
-
-            def _walk(node: WBSNode) -> None:
                 for child in node.children:
                     self._parent_map[child.id] = node.id
-                    _walk(child)
-
-            for root in self.project.all_root_nodes():
-                _walk(root)
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -333,12 +339,7 @@ class WBSApp(App):
 
     def _build_title_map(self) -> dict[str, WBSNode]:
         """Build a mapping from node title to node (first occurrence wins)."""
-        title_map: dict[str, WBSNode] = {}
-        if self.project:
-            for node in self.project.all_nodes():
-                if node.title not in title_map:
-                    title_map[node.title] = node
-        return title_map
+        return self.project.title_index() if self.project else {}
 
     # ── Filter & Sort ──
 
@@ -369,86 +370,148 @@ class WBSApp(App):
             return node.custom_fields.get(field, "")
 
     @staticmethod
-    def _node_matches_filter(node: WBSNode, filt: FilterConfig) -> bool:
-        """Check if a node matches a single filter condition."""
-        value = WBSApp._get_node_field_value(node, filt.field).lower()
-        target = filt.value.lower()
-        if filt.operator == "eq":
+    def _get_node_field_value_lower(node: WBSNode, field: str) -> str:
+        """Lowercased field value; title and assignee are cached on the node."""
+        if field == "title":
+            return node._title_lower
+        elif field == "assignee":
+            return node._assignee_lower
+        return WBSApp._get_node_field_value(node, field).lower()
+
+    @staticmethod
+    def _compile_filters(filters: list[FilterConfig]) -> list[tuple[str, str, str]]:
+        """Return (field, operator, lowercased target) per filter for one pass."""
+        return [(f.field, f.operator, f.value.lower()) for f in filters]
+
+    @staticmethod
+    def _matches_compiled_filter(node: WBSNode, field: str, operator: str, target: str) -> bool:
+        value = WBSApp._get_node_field_value_lower(node, field)
+        if operator == "eq":
             return value == target
-        elif filt.operator == "neq":
+        elif operator == "neq":
             return value != target
-        elif filt.operator == "contains":
+        elif operator == "contains":
             return target in value
         return True
 
     @staticmethod
-    def _filter_node_tree(node: WBSNode, filters: list[FilterConfig]) -> WBSNode | None:
-        """Recursively filter a node tree. Keep parent if any child matches."""
-        # Filter children first
-        filtered_children: list[WBSNode] = []
+    def _node_matches_filter(node: WBSNode, filt: FilterConfig) -> bool:
+        """Check if a node matches a single filter condition."""
+        return WBSApp._matches_compiled_filter(
+            node, filt.field, filt.operator, filt.value.lower()
+        )
+
+    # Sort fields whose key is a precomputed attribute on the node
+    _SORT_KEY_ATTRS = {
+        "status": "_status_order",
+        "priority": "_priority_order",
+        "title": "_title_lower",
+        "assignee": "_assignee_lower",
+    }
+
+    @staticmethod
+    def _sort_key(node: WBSNode, field: str) -> tuple:
+        """Generate a sort key for a node by field."""
+        if field == "status":
+            return (node._status_order,)
+        elif field == "priority":
+            return (node._priority_order,)
+        else:
+            return (WBSApp._get_node_field_value_lower(node, field),)
+
+    @staticmethod
+    def _sort_key_func(field: str) -> Callable[[WBSNode], object]:
+        """Return the cheapest sort key callable for *field*."""
+        attr = WBSApp._SORT_KEY_ATTRS.get(field)
+        if attr is not None:
+            return attrgetter(attr)
+        return partial(WBSApp._sort_key, field=field)
+
+    @staticmethod
+    def _filter_sort_node_tree(
+        node: WBSNode,
+        filters: list[tuple[str, str, str]],
+        key: Callable[[WBSNode], object] | None,
+        reverse: bool,
+    ) -> WBSNode | None:
+        """Filter and sort a node tree in one post-order pass.
+
+        A node is kept if it matches all (compiled) filters or any descendant
+        does; surviving children are sorted by *key* (unsorted if None).
+        """
+        kept: list[WBSNode] = []
         for child in node.children:
-            result = WBSApp._filter_node_tree(child, filters)
+            result = WBSApp._filter_sort_node_tree(child, filters, key, reverse)
             if result is not None:
-                filtered_children.append(result)
+                kept.append(result)
 
-        # Check if this node itself matches all filters
-        self_matches = all(WBSApp._node_matches_filter(node, f) for f in filters)
+        if not kept and not all(WBSApp._matches_compiled_filter(node, *f) for f in filters):
+            return None
 
-        if self_matches or filtered_children:
-            if tuple(filtered_children) != node.children:
-                return replace(node, children=tuple(filtered_children))
-            return node
-        return None
+        if key is not None:
+            kept.sort(key=key, reverse=reverse)
+        if len(kept) != len(node.children) or any(
+            a is not b for a, b in zip(kept, node.children)
+        ):
+            return replace(node, children=tuple(kept))
+        return node
 
     @staticmethod
-    def _apply_filters(root_nodes: list[WBSNode], filters: list[FilterConfig]) -> list[WBSNode]:
-        """Apply filters to root nodes list."""
-        if not filters:
+    def _apply_filters_and_sort(
+        root_nodes: list[WBSNode], filters: list[FilterConfig], sort: SortConfig | None
+    ) -> list[WBSNode]:
+        """Filter and sort root nodes and their descendants in a single walk."""
+        if not filters and sort is None:
             return root_nodes
+        if sort is not None:
+            key = WBSApp._sort_key_func(sort.field)
+            reverse = sort.order == "desc"
+        else:
+            key, reverse = None, False
+        compiled = WBSApp._compile_filters(filters)
         result: list[WBSNode] = []
         for node in root_nodes:
-            filtered = WBSApp._filter_node_tree(node, filters)
-            if filtered is not None:
-                result.append(filtered)
+            kept = WBSApp._filter_sort_node_tree(node, compiled, key, reverse)
+            if kept is not None:
+                result.append(kept)
+        if key is not None:
+            result.sort(key=key, reverse=reverse)
         return result
 
-    _STATUS_SORT_ORDER = {"TODO": 0, "IN_PROGRESS": 1, "DONE": 2}
-    _PRIORITY_SORT_ORDER = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
-
     @staticmethod
-    def _sort_key(node: WBSNode, field: str) -> tuple:
-        """Generate a sort key for a node by field."""
-        if field == "status":
-            return (WBSApp._STATUS_SORT_ORDER.get(node.status.value, 99),)
-        elif field == "priority":
-            return (WBSApp._PRIORITY_SORT_ORDER.get(node.priority.value, 99),)
-        else:
-            return (WBSApp._get_node_field_value(node, field).lower(),)
-
-    @staticmethod
-    def _sort_node_tree(node: WBSNode, sort: SortConfig) -> WBSNode:
-        """Recursively sort children at each level."""
-        if not node.children:
-            return node
-        sorted_children = sorted(
-            node.children, key=lambda n: WBSApp._sort_key(n, sort.field),
-            reverse=(sort.order == "desc"),
-        )
-        sorted_children = tuple(
-            WBSApp._sort_node_tree(c, sort) for c in sorted_children
-        )
-        if sorted_children != node.children:
-            return replace(node, children=sorted_children)
-        return node
+    def _apply_filters(root_nodes: list[WBSNode], filters: list[FilterConfig]) -> list[WBSNode]:
+        """Apply filters to root nodes list."""
+        if not filters:
+            return root_nodes
+        return WBSApp._apply_filters_and_sort(root_nodes, filters, None)
 
     @staticmethod
     def _apply_sort(root_nodes: list[WBSNode], sort: SortConfig) -> list[WBSNode]:
         """Sort root nodes and their descendants."""
-        sorted_roots = sorted(
-            root_nodes, key=lambda n: WBSApp._sort_key(n, sort.field),
-            reverse=(sort.order == "desc"),
-        )
-        return [WBSApp._sort_node_tree(n, sort) for n in sorted_roots]
+        return WBSApp._apply_filters_and_sort(root_nodes, [], sort)
+
+    def _filtered_sorted_roots(self, root_nodes: list[WBSNode], view: ViewConfig | None) -> list[WBSNode]:
+        """Apply the view's filters and sort, reusing the previous result if
+        neither the roots nor the view settings changed since then."""
+        if view is None:
+            key = None
+        else:
+            key = (
+                tuple(self._compile_filters(view.filters)),
+                (view.sort.field, view.sort.order) if view.sort else None,
+            )
+        if key != self._displayed_key or roots_changed(root_nodes, self._displayed_source):
+            self._displayed_source = tuple(root_nodes)
+            self._displayed_key = key
+            self._displayed_roots = (
+                root_nodes if view is None
+                else self._apply_filters_and_sort(root_nodes, view.filters, view.sort)
+            )
+        return self._displayed_roots
+
+    def displayed_nodes(self) -> list[WBSNode]:
+        """Return every node shown by the current view, in display order."""
+        return preorder_nodes(self._displayed_roots)
 
     def _refresh_ui(self) -> None:
         try:
@@ -471,11 +534,7 @@ class WBSApp(App):
         view_type = view.type if view else "table"
         root_nodes = self.project.all_root_nodes() if self.project else []
 
-        # Apply filters and sort
-        if view:
-            if view.filters:
-                root_nodes = self._apply_filters(root_nodes, view.filters)
-            root_nodes = self._apply_sort(root_nodes, view.sort)
+        root_nodes = self._filtered_sorted_roots(root_nodes, view)
 
         title_map = self._build_title_map()
 
@@ -511,13 +570,8 @@ class WBSApp(App):
                 # Use highlighted_node_id to find the correct row index
                 # instead of dt.cursor_row which may be stale after rebuild
                 highlighted_id = table.highlighted_node_id
-                row_idx = 0
-                if highlighted_id:
-                    for idx, (n, _, _) in enumerate(table._flat_rows):
-                        if n.id == highlighted_id:
-                            row_idx = idx
-                            break
-                gantt_view._highlighted_row = row_idx
+                row_idx = table.row_index(highlighted_id) if highlighted_id else None
+                gantt_view._highlighted_row = row_idx or 0
                 gantt_view.refresh()
             except Exception:
                 pass
@@ -717,22 +771,26 @@ class WBSApp(App):
 
     # ── Helpers for node mutation ──
 
+    def _snapshot_documents(self) -> list[WBSDocument]:
+        """Copy the project's documents for the undo/redo stacks.
+
+        Nodes are immutable, so snapshots share node trees with the live
+        project (and its serialization cache); only the lists are copied.
+        """
+        return [
+            replace(
+                doc,
+                root_nodes=list(doc.root_nodes),
+                parse_warnings=list(doc.parse_warnings),
+            )
+            for doc in self.project.documents
+        ]
+
     def _save_undo_state(self) -> None:
         if self.project:
-            snapshot = [
-                WBSDocument(
-                    file_path=doc.file_path,
-                    root_nodes=list(doc.root_nodes),
-                    raw_content=doc.raw_content,
-                    modified=doc.modified,
-                    parse_warnings=list(doc.parse_warnings),
-                )
-                for doc in self.project.documents
-            ]
-            self._undo_stack.append(snapshot)
+            # The deque's maxlen drops the oldest entry past _UNDO_LIMIT
+            self._undo_stack.append(self._snapshot_documents())
             self._redo_stack.clear()
-            if len(self._undo_stack) > 50:
-                self._undo_stack.pop(0)
 
     def _get_highlighted_node_id(self) -> str | None:
         try:
@@ -745,10 +803,14 @@ class WBSApp(App):
         """Update a node in the project tree by ID."""
         if not self.project:
             return
-        self._save_undo_state()
         old_node = self._node_map.get(node_id)
         if not old_node:
             return
+        # Writing back the current values changes nothing: skip the undo
+        # entry, the tree splice and the redraw
+        if all(getattr(old_node, key) == value for key, value in kwargs.items()):
+            return
+        self._save_undo_state()
         new_node = replace(old_node, _meta_modified=True, **kwargs)
 
         for doc in self.project.documents:
@@ -768,88 +830,108 @@ class WBSApp(App):
         self._refresh_ui()
 
     def _propagate_dates_to_parents(self, node_id: str) -> None:
-        """Propagate start/end dates upward from node to its ancestors."""
+        """Propagate start/end dates upward from node to its ancestors.
+
+        The updated ancestors are chained in memory while walking up and
+        spliced into the tree once, so the tree and node maps are rebuilt
+        once per edit rather than once per ancestor. The walk stops at the
+        first ancestor whose dates already cover its children.
+        """
         if not self.project:
             return
+        node_map = self._node_map
+        parent_map = self._parent_map
         visited: set[str] = set()
         current_id = node_id
-        while current_id in self._parent_map:
-            parent_id = self._parent_map[current_id]
-            if parent_id in visited:
+        top: WBSNode | None = None  # highest ancestor updated so far
+        while True:
+            parent_id = parent_map.get(current_id)
+            if parent_id is None or parent_id in visited:
                 break
             visited.add(parent_id)
-            parent = self._node_map.get(parent_id)
-            if not parent or not parent.children:
+            # _parent_map and _node_map are rebuilt together, so a mapped
+            # parent is always present
+            parent = node_map[parent_id]
+            if not parent.children:
                 break
+            children = parent.children
+            if top is not None:
+                children = tuple(top if c.id == current_id else c for c in children)
             # Compute min start, max end from children
             min_start: date | None = None
             max_end: date | None = None
-            for child in parent.children:
+            for child in children:
                 if child.start is not None:
                     if min_start is None or child.start < min_start:
                         min_start = child.start
                 if child.end is not None:
                     if max_end is None or child.end > max_end:
                         max_end = child.end
-            # Check if parent needs updating
-            changed = False
             kwargs: dict = {}
             if min_start is not None and min_start != parent.start:
                 kwargs["start"] = min_start
-                changed = True
             if max_end is not None and max_end != parent.end:
                 kwargs["end"] = max_end
-                changed = True
-            if not changed:
+            if not kwargs:
                 break
-            # Apply update without triggering undo (already saved by caller)
-            new_parent = replace(parent, _meta_modified=True, **kwargs)
-            for doc in self.project.documents:
-                new_roots = []
-                doc_changed = False
-                for root in doc.root_nodes:
-                    new_root = self._replace_in_tree(root, parent_id, new_parent)
-                    if new_root is not root:
-                        doc_changed = True
-                    new_roots.append(new_root)
-                if doc_changed:
-                    doc.root_nodes = new_roots
-                    doc.modified = True
-            # Rebuild both maps from the updated tree
-            self._node_map = {}
-            self._parent_map = {}
-            for node in self.project.all_nodes():
-                self._node_map[node.id] = node
-
-            def _walk_prop(n: WBSNode) -> None:
-                for c in n.children:
-                    self._parent_map[c.id] = n.id
-                    _walk_prop(c)
-
-            for root in self.project.all_root_nodes():
-                _walk_prop(root)
+            top = replace(parent, children=children, _meta_modified=True, **kwargs)
             current_id = parent_id
+        if top is None:
+            return
+        # Apply update without triggering undo (already saved by caller)
+        for doc in self.project.documents:
+            new_roots = []
+            doc_changed = False
+            for root in doc.root_nodes:
+                new_root = self._replace_in_tree(root, current_id, top)
+                if new_root is not root:
+                    doc_changed = True
+                new_roots.append(new_root)
+            if doc_changed:
+                doc.root_nodes = new_roots
+                doc.modified = True
+        self._rebuild_node_map()
 
     def _replace_in_tree(
         self, node: WBSNode, target_id: str, replacement: WBSNode
     ) -> WBSNode:
+        """Return *node* with its descendant *target_id* swapped for *replacement*.
+
+        The path from *node* down to the target is read from ``_parent_map``,
+        so only the ancestors on that path are copied; other subtrees are
+        neither walked nor reallocated. *node* is returned unchanged when the
+        target is not beneath it.
+        """
         if node.id == target_id:
             return replacement
-        new_children = tuple(
-            self._replace_in_tree(c, target_id, replacement) for c in node.children
-        )
-        if new_children != node.children:
-            return replace(node, children=new_children)
-        return node
+        path = [target_id]
+        while path[-1] != node.id:
+            parent_id = self._parent_map.get(path[-1])
+            if parent_id is None:
+                return node
+            path.append(parent_id)
+        # Descend along the path to collect the current ancestors
+        ancestors = [node]
+        for child_id in reversed(path[1:-1]):
+            child = next((c for c in ancestors[-1].children if c.id == child_id), None)
+            if child is None:
+                return node
+            ancestors.append(child)
+        new_node = replacement
+        child_id = target_id
+        for ancestor in reversed(ancestors):
+            new_node = ancestor.replace_child(child_id, new_node)
+            child_id = ancestor.id
+        return new_node
 
     def _add_node_to_parent(self, parent_id: str, new_node: WBSNode) -> None:
         """Add a child node to a parent."""
         if not self.project:
             return
-        self._save_undo_state()
         parent = self._node_map.get(parent_id)
         if not parent:
             return
+        self._save_undo_state()
         new_parent = parent.with_child(new_node)
         for doc in self.project.documents:
             new_roots = []
@@ -1751,13 +1833,9 @@ class WBSApp(App):
             self._update_status_bar()
             return
         q = query.lower()
-        for node in self.project.all_nodes():
-            if (
-                q in node.title.lower()
-                or q in node.memo.lower()
-                or q in node.assignee.lower()
-            ):
-                self._search_matches.append(node.id)
+        self._search_matches = [
+            node_id for text, node_id in self.project.search_haystack() if q in text
+        ]
         if self._search_matches:
             self._search_index = 0
             self._jump_to_search_match()
@@ -1775,10 +1853,7 @@ class WBSApp(App):
             pass
 
     def _find_row_index(self, table: WBSTable, node_id: str) -> int:
-        for i, (node, _, _) in enumerate(table._flat_rows):
-            if node.id == node_id:
-                return i
-        return 0
+        return table.row_index(node_id) or 0
 
     def action_search_next(self) -> None:
         if self._search_matches:
@@ -1920,16 +1995,7 @@ class WBSApp(App):
             self.notify("Nothing to undo", severity="warning")
             return
         # Save current state to redo
-        current = [
-            WBSDocument(
-                file_path=doc.file_path,
-                root_nodes=list(doc.root_nodes),
-                raw_content=doc.raw_content,
-                modified=doc.modified,
-                parse_warnings=list(doc.parse_warnings),
-            )
-            for doc in self.project.documents
-        ]
+        current = self._snapshot_documents()
         self._redo_stack.append(current)
         prev = self._undo_stack.pop()
         self.project.documents = prev
@@ -1942,16 +2008,7 @@ class WBSApp(App):
         if not self._redo_stack or not self.project:
             self.notify("Nothing to redo", severity="warning")
             return
-        current = [
-            WBSDocument(
-                file_path=doc.file_path,
-                root_nodes=list(doc.root_nodes),
-                raw_content=doc.raw_content,
-                modified=doc.modified,
-                parse_warnings=list(doc.parse_warnings),
-            )
-            for doc in self.project.documents
-        ]
+        current = self._snapshot_documents()
         self._undo_stack.append(current)
         next_state = self._redo_stack.pop()
         self.project.documents = next_state
@@ -29,6 +29,7 @@ _KOREAN_TO_LATIN: dict[str, str] = {
     "ㅃ": "Q", "ㅉ": "W", "ㄲ": "E", "ㅆ": "R",
     "ㅒ": "O", "ㅖ": "P",
 }
+_KOREAN_TRANSLATE_TABLE = str.maketrans(_KOREAN_TO_LATIN)
 
 COMMANDS: list[CommandDef] = [
     # -- File --
@@ -84,7 +85,19 @@ COMMANDS: list[CommandDef] = [
 
 def transliterate_korean(text: str) -> str:
     """Convert Korean jamo characters to their Latin key equivalents."""
-    return "".join(_KOREAN_TO_LATIN.get(ch, ch) for ch in text)
+    return text.translate(_KOREAN_TRANSLATE_TABLE)
+
+
+# (command, transliterated "display help category", lowercased display),
+# built once so palette queries don't re-lower every command per keystroke
+_SEARCH_INDEX: list[tuple[CommandDef, str, str]] = [
+    (
+        cmd,
+        transliterate_korean(f"{cmd.display} {cmd.help} {cmd.category}".lower()),
+        cmd.display.lower(),
+    )
+    for cmd in COMMANDS
+]
 
 
 class WBSCommandProvider(Provider):
@@ -118,16 +131,13 @@ class WBSCommandProvider(Provider):
         # Transliterate Korean jamo in query
         latin_query = transliterate_korean(query).lower()
 
-        for cmd in COMMANDS:
+        for cmd, latin_searchable, display_lower in _SEARCH_INDEX:
             if cmd.context and cmd.context != view_type:
                 continue
 
             # Match against display name, help text, and category
-            searchable = f"{cmd.display} {cmd.help} {cmd.category}".lower()
-            latin_searchable = transliterate_korean(searchable)
-
             if self._fuzzy_match(latin_query, latin_searchable):
-                score = self._score(latin_query, cmd.display.lower())
+                score = self._score(latin_query, display_lower)
                 yield Hit(
                     score,
                     cmd.display,
@@ -1,14 +1,18 @@
-"""Project configuration management using tomlkit."""
+"""Project configuration management.
+
+Config is read with the stdlib ``tomllib`` parser and written with tomlkit,
+which keeps the formatting of the generated file.
+"""
 
 from __future__ import annotations
 
+import tomllib
 from datetime import date
 from pathlib import Path
 from typing import Any
 
 import tomlkit
 import yaml
-from tomlkit.items import Table as TomlTable
 
 from tui_wbs.models import (
     ColumnDef,
@@ -38,7 +42,7 @@ def load_config(project_dir: Path) -> ProjectConfig:
 
     try:
         content = config_path.read_text(encoding="utf-8")
-        doc = tomlkit.parse(content)
+        doc = tomllib.loads(content)
     except Exception:
         config.ensure_default_view()
         return config
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field, replace
 from datetime import date
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -38,6 +40,19 @@ PRIORITY_ICONS = {
     Priority.LOW: "▽",
 }
 
+# Sort rank per enum member (lower sorts first)
+STATUS_ORDER = {
+    Status.TODO: 0,
+    Status.IN_PROGRESS: 1,
+    Status.DONE: 2,
+}
+
+PRIORITY_ORDER = {
+    Priority.HIGH: 0,
+    Priority.MEDIUM: 1,
+    Priority.LOW: 2,
+}
+
 MILESTONE_ICON = "◇"
 LOCK_ICON = "🔒"
 
@@ -53,8 +68,12 @@ DATE_FORMAT_PRESETS: dict[str, str] = {
 DEFAULT_DATE_FORMAT = "MM-DD"
 
 
+@lru_cache(maxsize=4096)
 def format_date(d: date | None, date_format: str = DEFAULT_DATE_FORMAT) -> str:
-    """Format a date for display. Returns empty string for None."""
+    """Format a date for display. Returns empty string for None.
+
+    Memoized: tables format the same few dates across many rows.
+    """
     if d is None:
         return ""
     fmt = DATE_FORMAT_PRESETS.get(date_format)
@@ -103,10 +122,30 @@ class WBSNode:
 
     def all_nodes(self) -> list[WBSNode]:
         """Return a flat list of this node and all descendants."""
-        result = [self]
-        for child in self.children:
-            result.extend(child.all_nodes())
-        return result
+        return preorder_nodes((self,))
+
+    # Lowercased copies for case-insensitive filter/sort; safe to cache since
+    # nodes are immutable.
+    @cached_property
+    def _title_lower(self) -> str:
+        return self.title.lower()
+
+    @cached_property
+    def _assignee_lower(self) -> str:
+        return self.assignee.lower()
+
+    @cached_property
+    def _status_order(self) -> int:
+        return STATUS_ORDER.get(self.status, len(STATUS_ORDER))
+
+    @cached_property
+    def _priority_order(self) -> int:
+        return PRIORITY_ORDER.get(self.priority, len(PRIORITY_ORDER))
+
+    @cached_property
+    def _search_text(self) -> str:
+        # Newline-separated so a single-line query cannot span two fields.
+        return f"{self.title}\n{self.assignee}\n{self.memo}".lower()
 
     @property
     def status_icon(self) -> str:
@@ -174,6 +213,16 @@ def adjust_duration(duration: str, delta: int) -> str:
     return f"{new_value}{unit}"
 
 
+# Calendar days per duration unit; hours are converted separately (8h = 1d)
+_DAYS_PER_UNIT = {
+    "d": 1, "day": 1, "days": 1,
+    "w": 7, "week": 7, "weeks": 7,
+    "m": 30, "month": 30, "months": 30,
+}
+_HOUR_UNITS = frozenset({"h", "hour", "hours"})
+
+
+@lru_cache(maxsize=1024)
 def duration_to_days(duration_str: str) -> int | None:
     """Convert a duration string to days. '5d'→5, '2w'→14, '8h'→1. Returns None on failure."""
     parsed = parse_duration(duration_str)
@@ -181,15 +230,9 @@ def duration_to_days(duration_str: str) -> int | None:
         return None
     value, unit = parsed
     unit = unit.lower()
-    if unit in ("d", "day", "days", ""):
-        return max(1, int(value))
-    elif unit in ("w", "week", "weeks"):
-        return max(1, int(value * 7))
-    elif unit in ("h", "hour", "hours"):
+    if unit in _HOUR_UNITS:
         return max(1, int(value / 8)) if value > 0 else 0
-    elif unit in ("m", "month", "months"):
-        return max(1, int(value * 30))
-    return max(1, int(value))
+    return max(1, int(value * _DAYS_PER_UNIT.get(unit, 1)))
 
 
 def days_to_duration(days: int) -> str:
@@ -201,13 +244,53 @@ def days_to_duration(days: int) -> str:
 
 def has_incomplete_dependencies(node: WBSNode, title_map: dict[str, WBSNode]) -> bool:
     """Return True if any dependency of the node is not DONE."""
-    for dep_title in node.depends_list:
+    return _any_incomplete(node.depends_list, title_map)
+
+
+def _any_incomplete(dep_titles: Iterable[str], title_map: dict[str, WBSNode]) -> bool:
+    for dep_title in dep_titles:
         dep_node = title_map.get(dep_title)
         if dep_node is None or dep_node.status != Status.DONE:
             return True
     return False
 
 
+def compute_lock_states(nodes: Iterable[WBSNode], title_map: dict[str, WBSNode]) -> dict[str, bool]:
+    """Return ``{node_id: locked}`` for every node, in a single pass.
+
+    Each node's ``depends`` string is parsed at most once, and nodes without
+    dependencies skip parsing entirely.
+    """
+    states: dict[str, bool] = {}
+    for n in nodes:
+        states[n.id] = bool(n.depends) and _any_incomplete(n.depends_list, title_map)
+    return states
+
+
+def preorder_nodes(roots: Iterable[WBSNode]) -> list[WBSNode]:
+    """Return *roots* and all their descendants as one flat pre-order list.
+
+    Walks the tree with an explicit stack, so deep hierarchies neither
+    recurse nor copy an intermediate list per subtree.
+    """
+    result: list[WBSNode] = []
+    stack = list(roots)
+    stack.reverse()
+    while stack:
+        node = stack.pop()
+        result.append(node)
+        if node.children:
+            stack.extend(reversed(node.children))
+    return result
+
+
+def roots_changed(roots: Sequence[WBSNode], built_from: Sequence[WBSNode]) -> bool:
+    """True unless *roots* are exactly the node objects a cache was built from."""
+    return len(roots) != len(built_from) or any(
+        a is not b for a, b in zip(roots, built_from)
+    )
+
+
 @dataclass
 class ParseWarning:
     """A warning generated during parsing."""
@@ -230,12 +313,15 @@ class WBSDocument:
     modified: bool = False
     parse_warnings: list[ParseWarning] = field(default_factory=list)
 
+    # Serialized subtree text from the last save, keyed by id(node). Nodes
+    # are immutable, so an entry stays valid while it holds the same object.
+    _subtree_text: dict[int, tuple[WBSNode, str]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
     def all_nodes(self) -> list[WBSNode]:
         """Return a flat list of all nodes in this document."""
-        result: list[WBSNode] = []
-        for root in self.root_nodes:
-            result.extend(root.all_nodes())
-        return result
+        return preorder_nodes(self.root_nodes)
 
 
 @dataclass
@@ -352,12 +438,16 @@ class WBSProject:
     config: ProjectConfig = field(default_factory=ProjectConfig)
     parse_warnings: list[ParseWarning] = field(default_factory=list)
 
+    # title_index() cache and the root nodes it was built from
+    _title_index: dict[str, WBSNode] = field(default_factory=dict, repr=False, compare=False)
+    _title_index_roots: tuple[WBSNode, ...] = field(default=(), repr=False, compare=False)
+    # search_haystack() cache and the root nodes it was built from
+    _search_haystack: list[tuple[str, str]] = field(default_factory=list, repr=False, compare=False)
+    _search_haystack_roots: tuple[WBSNode, ...] = field(default=(), repr=False, compare=False)
+
     def all_nodes(self) -> list[WBSNode]:
         """Return a flat list of all nodes across all documents."""
-        result: list[WBSNode] = []
-        for doc in self.documents:
-            result.extend(doc.all_nodes())
-        return result
+        return preorder_nodes(self.all_root_nodes())
 
     def all_root_nodes(self) -> list[WBSNode]:
         """Return all root nodes from all documents."""
@@ -366,9 +456,36 @@ class WBSProject:
             result.extend(doc.root_nodes)
         return result
 
+    def title_index(self) -> dict[str, WBSNode]:
+        """Return a mapping from title to the first node with that title.
+
+        Any edit replaces the root of the edited tree, so the index is only
+        rebuilt when some root node is no longer the one it was built from.
+        The returned dict is shared; do not mutate it.
+        """
+        roots = self.all_root_nodes()
+        if roots_changed(roots, self._title_index_roots):
+            index: dict[str, WBSNode] = {}
+            for node in preorder_nodes(roots):
+                index.setdefault(node.title, node)
+            self._title_index = index
+            self._title_index_roots = tuple(roots)
+        return self._title_index
+
+    def search_haystack(self) -> list[tuple[str, str]]:
+        """Return (lowercased title/assignee/memo, node id) pairs in tree order.
+
+        Cached like title_index(); after an edit only the replaced nodes
+        compute new search text, the rest reuse their cached strings.
+        """
+        roots = self.all_root_nodes()
+        if roots_changed(roots, self._search_haystack_roots):
+            self._search_haystack = [
+                (node._search_text, node.id) for node in preorder_nodes(roots)
+            ]
+            self._search_haystack_roots = tuple(roots)
+        return self._search_haystack
+
     def find_node_by_title(self, title: str) -> WBSNode | None:
         """Find the first node with the given title."""
-        for node in self.all_nodes():
-            if node.title == title:
-                return node
-        return None
+        return self.title_index().get(title)
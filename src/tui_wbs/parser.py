@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from datetime import date
 from pathlib import Path
 
@@ -20,6 +21,11 @@ HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
 META_TABLE_ROW_RE = re.compile(r"^\|(.+)\|\s*$")
 META_TABLE_SEP_RE = re.compile(r"^\|[\s\-:|]+\|\s*$")
 
+_BUILTIN_FIELDS = frozenset({
+    "status", "assignee", "duration", "priority", "depends",
+    "start", "end", "milestone", "progress",
+})
+
 
 def _parse_date(value: str, file_path: str, line_num: int, warnings: list[ParseWarning]) -> date | None:
     """Parse a YYYY-MM-DD date string."""
@@ -71,7 +77,9 @@ def _parse_table_metadata(
     data_match = META_TABLE_ROW_RE.match(data_line.strip())
     if not header_match or not data_match:
         return result
-    keys = [k.strip().lower() for k in header_match.group(1).split("|")]
+    # Column names repeat on every node; intern them so each metadata dict
+    # shares one copy per name
+    keys = [sys.intern(k.strip().lower()) for k in header_match.group(1).split("|")]
     values = [v.strip() for v in data_match.group(1).split("|")]
     for key, value in zip(keys, values):
         if key:
@@ -92,11 +100,6 @@ def _build_node(
     known_custom_fields: set[str] | None = None,
 ) -> WBSNode:
     """Build a WBSNode from parsed components."""
-    builtin_fields = {
-        "status", "assignee", "duration", "priority", "depends",
-        "start", "end", "milestone", "progress",
-    }
-
     status = _parse_status(meta_dict.get("status", "TODO"), file_path, line_num, warnings)
     priority = _parse_priority(meta_dict.get("priority", "MEDIUM"), file_path, line_num, warnings)
     start = _parse_date(meta_dict.get("start", ""), file_path, line_num, warnings)
@@ -114,7 +117,7 @@ def _build_node(
     # Collect custom fields
     custom_fields: dict[str, str] = {}
     for key, value in meta_dict.items():
-        if key not in builtin_fields:
+        if key not in _BUILTIN_FIELDS:
             if known_custom_fields and key in known_custom_fields:
                 custom_fields[key] = value
             elif known_custom_fields is not None:
@@ -130,8 +133,9 @@ def _build_node(
         title=title,
         level=level,
         status=status,
-        assignee=meta_dict.get("assignee", "").strip(),
-        duration=meta_dict.get("duration", "").strip(),
+        # A handful of assignees and durations repeat across many nodes
+        assignee=sys.intern(meta_dict.get("assignee", "").strip()),
+        duration=sys.intern(meta_dict.get("duration", "").strip()),
         priority=priority,
         depends=meta_dict.get("depends", "").strip(),
         start=start,
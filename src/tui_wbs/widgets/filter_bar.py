@@ -97,9 +97,12 @@ class FilterBar(Container):
         self._rendering = False
 
     def compose(self) -> ComposeResult:
-        yield Static("[dim]No filters  (f: add)[/dim]", id="filter-bar-hint")
-        yield Horizontal(id="filter-bar-container")
-        yield Static("", id="filter-bar-sort")
+        self._hint = Static("[dim]No filters  (f: add)[/dim]", id="filter-bar-hint")
+        yield self._hint
+        self._container = Horizontal(id="filter-bar-container")
+        yield self._container
+        self._sort_widget = Static("", id="filter-bar-sort")
+        yield self._sort_widget
 
     def on_mount(self) -> None:
         self.border_title = "[2] Filters"
@@ -126,28 +129,22 @@ class FilterBar(Container):
             return
         self._rendering = True
         try:
-            try:
-                container = self.query_one("#filter-bar-container", Horizontal)
-                hint = self.query_one("#filter-bar-hint", Static)
-                sort_widget = self.query_one("#filter-bar-sort", Static)
-            except Exception:
-                return
-            await container.remove_children()
+            await self._container.remove_children()
 
             # Update sort display independently
             if self._sort:
-                sort_widget.update(f"Sort: {self._sort.field} {self._sort.order.upper()}")
-                sort_widget.display = True
+                self._sort_widget.update(f"Sort: {self._sort.field} {self._sort.order.upper()}")
+                self._sort_widget.display = True
             else:
-                sort_widget.update("")
-                sort_widget.display = False
+                self._sort_widget.update("")
+                self._sort_widget.display = False
 
             has_content = bool(self._filters) or bool(self._sort)
             if has_content:
-                hint.display = False
+                self._hint.display = False
                 self.add_class("has-filters")
             else:
-                hint.display = True
+                self._hint.display = True
                 self.remove_class("has-filters")
                 return
 
@@ -170,7 +167,7 @@ class FilterBar(Container):
                             classes="chip-remove",
                         )
                     )
-                await container.mount(*widgets)
+                await self._container.mount(*widgets)
         finally:
             self._rendering = False
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 from datetime import date, timedelta
+from functools import lru_cache
+from itertools import groupby
 
 from textual.app import ComposeResult
 from textual.containers import Container
@@ -33,6 +35,15 @@ COL_WIDTH_MAP: dict[str, int] = {
 
 
 
+@lru_cache(maxsize=32)
+def _bg_style(color: str) -> Style:
+    """Return a background-only Style for *color*, shared across repaints.
+
+    Keyed by the color string so a theme switch naturally picks up new styles.
+    """
+    return Style(bgcolor=color)
+
+
 def _band_bg(char_col: int, band_style: Style, base_style: Style, col_width: int = COL_WIDTH) -> Style:
     """홀수 컬럼(col_width 단위)이면 band_style 반환, 짝수면 base_style."""
     if (char_col // col_width) % 2 == 1:
@@ -78,6 +89,136 @@ def _is_holiday_col(char_col: int, date_start: date, scale: str, col_width: int,
     return False
 
 
+def _detail_layout(start_ord: int, end_ord: int, days_per_col: int, col_width: int, width: int) -> list[tuple[int, int]]:
+    """Return ``(char_col, date_ordinal)`` for every detail-row cell that fits in *width*.
+
+    Pure integer arithmetic: no date objects are created per column.
+    """
+    if end_ord < start_ord:
+        return []
+    count = min(-(-width // col_width), (end_ord - start_ord) // days_per_col + 1)
+    return [(i * col_width, start_ord + i * days_per_col) for i in range(count)]
+
+
+@lru_cache(maxsize=512)
+def _iso_week_from_ord(ordinal: int) -> int:
+    """Return the ISO week number for a date ordinal.
+
+    ISO weeks belong to the year containing their Thursday, so the week number
+    is the Thursday's day-of-year divided by 7.  Cached per ordinal because the
+    header only ever asks for a small window of dates.
+    """
+    thursday = ordinal - (ordinal + 6) % 7 + 3
+    year_start = date(date.fromordinal(thursday).year, 1, 1).toordinal()
+    return (thursday - year_start) // 7 + 1
+
+
+@lru_cache(maxsize=2048)
+def _detail_label(scale: str, ordinal: int, col_width: int) -> str:
+    """Return the centered detail-row label for the column starting at *ordinal*."""
+    cur = date.fromordinal(ordinal)
+    if scale == "day":
+        label = cur.strftime("%d")
+    elif scale == "week":
+        return f"W{_iso_week_from_ord(ordinal)}".center(col_width)
+    elif scale == "month":
+        label = cur.strftime("%b")
+    elif scale == "quarter":
+        label = f"Q{(cur.month - 1) // 3 + 1}"
+    else:
+        label = cur.strftime("%Y")
+    return label[:col_width].center(col_width)
+
+
+# Background kinds for a character column (see GanttView._col_kinds)
+BG_BASE = 0
+BG_BAND = 1
+BG_WEEKEND = 2
+BG_HOLIDAY = 3
+
+
+# Foreground roles for glyph overlays (see _build_render_ctx)
+FG_DEPENDENCY = 0
+FG_TODAY = 1
+FG_MILESTONE = 2
+FG_BAR_DONE = 3
+FG_BAR_IN_PROGRESS = 4
+FG_BAR_TODO = 5
+
+_STATUS_FG = {Status.DONE: FG_BAR_DONE, Status.IN_PROGRESS: FG_BAR_IN_PROGRESS}
+
+
+@lru_cache(maxsize=4)
+def _build_render_ctx(
+    base_bg: str,
+    band_bg: str,
+    weekend_bg: str,
+    holiday_bg: str,
+    dependency: str,
+    today: str,
+    milestone: str,
+    bar_done: str,
+    bar_in_progress: str,
+    bar_todo: str,
+) -> tuple[tuple[tuple[Style, ...], dict[tuple[int, int], Style]], ...]:
+    """Pre-combine every foreground role with every background kind.
+
+    Returns one ``(bg_styles, combined)`` pair per row parity (even rows use
+    base/band, odd rows swap them), so the render loop only does dict lookups.
+    """
+    fg_styles = {
+        FG_DEPENDENCY: Style(color=dependency),
+        FG_TODAY: Style(color=today),
+        FG_MILESTONE: Style(color=milestone, bold=True),
+        FG_BAR_DONE: Style(color=bar_done),
+        FG_BAR_IN_PROGRESS: Style(color=bar_in_progress),
+        FG_BAR_TODO: Style(color=bar_todo, dim=True),
+    }
+    base, band = _bg_style(base_bg), _bg_style(band_bg)
+    weekend, holiday = _bg_style(weekend_bg), _bg_style(holiday_bg)
+    ctx = []
+    for bg_styles in ((base, band, weekend, holiday), (band, base, weekend, holiday)):
+        combined = {
+            (fg_id, kind): fg + bg
+            for fg_id, fg in fg_styles.items()
+            for kind, bg in enumerate(bg_styles)
+        }
+        ctx.append((bg_styles, combined))
+    return tuple(ctx)
+
+
+def _overlay_segments(
+    runs: list[tuple[int, int, int]],
+    overlays: list[tuple[int, int, str, int]],
+    bg_styles: tuple[Style, ...],
+    combined: dict[tuple[int, int], Style],
+) -> list[Segment]:
+    """Merge background runs with glyph overlays into as few segments as possible.
+
+    *runs* are ``(start, end, bg_kind)`` spans covering the row; *overlays* are
+    sorted, non-overlapping ``(start, end, glyph, fg_role)`` spans.  Each output
+    segment covers a stretch where both the background and the glyph are constant.
+    """
+    segments: list[Segment] = []
+    oi = 0
+    n_overlays = len(overlays)
+    for start, end, kind in runs:
+        bg = bg_styles[kind]
+        c = start
+        while c < end:
+            while oi < n_overlays and overlays[oi][1] <= c:
+                oi += 1
+            if oi < n_overlays and overlays[oi][0] <= c:
+                _, o_end, glyph, fg_id = overlays[oi]
+                stop = min(end, o_end)
+                segments.append(Segment(glyph * (stop - c), combined[fg_id, kind]))
+            else:
+                stop = min(end, overlays[oi][0]) if oi < n_overlays else end
+                segments.append(Segment(" " * (stop - c), bg))
+            c = stop
+    return segments
+
+
 # Scale configurations: (label_format, column_width_days)
 SCALE_CONFIG = {
     "day": 1,
@@ -207,11 +348,11 @@ class GanttHeader(Widget):
 
     @property
     def _band_style(self) -> Style:
-        return Style(bgcolor=theme.GANTT_BAND_BG)
+        return _bg_style(theme.GANTT_BAND_BG)
 
     @property
     def _base_style(self) -> Style:
-        return Style(bgcolor=theme.APP_BASE_BG)
+        return _bg_style(theme.APP_BASE_BG)
 
     def render_line(self, y: int) -> Strip:
         width = max(self.size.width, self._chart_width)
@@ -280,48 +421,29 @@ class GanttHeader(Widget):
     def _render_detail_row(self, width: int) -> Strip:
         """Row 1: detailed date labels (day/week number only, since group row shows month/year)."""
         segments: list[Segment] = []
-        cur = self._date_start
-        col = 0
         header_style = Style(bold=True, color=theme.GANTT_HEADER)
-        weekend_bg = Style(bgcolor=theme.GANTT_WEEKEND_BG)
+        weekend_bg = _bg_style(theme.GANTT_WEEKEND_BG)
         band = self._band_style
         base = self._base_style
         cw = self._col_width
-        _DAY_ABBR = "MTWTFSS"  # Mon=0..Sun=6
-
-        while col < width and cur <= self._date_end:
-            if self._scale == "day":
-                label = cur.strftime("%d")
-                label = label[:cw].center(cw)
-                if _is_weekend_col(col, self._date_start, self._scale, cw, self._days_per_col):
-                    bg = weekend_bg
-                else:
-                    bg = _band_bg(col, band, base, cw)
-                segments.append(Segment(label, header_style + bg))
-            elif self._scale == "week":
-                label = f"W{cur.isocalendar()[1]}"
-                padded = label.center(cw)
-                bg = _band_bg(col, band, base, cw)
-                segments.append(Segment(padded, header_style + bg))
-            elif self._scale == "month":
-                label = cur.strftime("%b")
-                label = label[:cw].center(cw)
-                bg = _band_bg(col, band, base, cw)
-                segments.append(Segment(label, header_style + bg))
-            elif self._scale == "quarter":
-                q = (cur.month - 1) // 3 + 1
-                label = f"Q{q}"
-                label = label[:cw].center(cw)
-                bg = _band_bg(col, band, base, cw)
-                segments.append(Segment(label, header_style + bg))
+        scale = self._scale
+        # Weekend shading only applies when each 2-char block is one day
+        mark_weekend = scale == "day" and cw == 2
+
+        layout = _detail_layout(
+            self._date_start.toordinal(),
+            self._date_end.toordinal(),
+            self._days_per_col,
+            cw,
+            width,
+        )
+        for col, ordinal in layout:
+            # date.weekday() == (ordinal + 6) % 7; 5=Sat, 6=Sun
+            if mark_weekend and (ordinal + 6) % 7 >= 5:
+                bg = weekend_bg
             else:
-                label = cur.strftime("%Y")
-                label = label[:cw].center(cw)
                 bg = _band_bg(col, band, base, cw)
-                segments.append(Segment(label, header_style + bg))
-
-            col += cw
-            cur += timedelta(days=self._days_per_col)
+            segments.append(Segment(_detail_label(scale, ordinal, cw), header_style + bg))
 
         rendered = sum(len(s.text) for s in segments)
         if rendered < width:
@@ -407,6 +529,8 @@ class GanttChart(Container):
     def update_rows(self, flat_rows: list[tuple[WBSNode, int, str]]) -> None:
         """Accept flat rows from the table (node, depth, hier_id) → (node, depth)."""
         self._flat_rows = [(node, depth) for node, depth, _ in flat_rows]
+        # One date lookup per refresh, shared by the view and header
+        self._today = date.today()
         self._push_to_view()
 
     def update_config(self, view_config: ViewConfig) -> None:
@@ -441,6 +565,7 @@ class GanttChart(Container):
         self._push_to_view()
 
     def go_to_today(self) -> None:
+        self._today = date.today()
         self._scroll_offset = 0
         self._push_to_view()
 
@@ -527,9 +652,23 @@ class GanttView(ScrollView):
         self._col_width: int = COL_WIDTH
         self._highlighted_row: int = -1
         self._holidays: set[date] = set()
+        # Per-row render fields, parallel to _rows (dates as ordinals, -1 = unset)
+        self._row_starts: list[int] = []
+        self._row_ends: list[int] = []
+        self._row_progress: list[int] = []
+        self._row_status: list[Status] = []
+        self._row_has_deps: list[bool] = []
+        self._row_milestone: list[bool] = []
+        # Background kind per character column, rebuilt lazily for the current range
+        self._col_kind: list[int] = []
+        self._bg_runs: list[tuple[int, int, int]] = []
+        # Rendered bar rows keyed by (row, width, border); cleared on any data change
+        self._line_cache: dict[tuple[int, int, bool], Strip] = {}
 
     def set_holidays(self, holidays: set[date]) -> None:
         self._holidays = holidays
+        self._col_kind = []
+        self._line_cache.clear()
 
     def update_gantt(
         self,
@@ -547,26 +686,27 @@ class GanttView(ScrollView):
         base_cw = COL_WIDTH_MAP.get(scale, COL_WIDTH)
         self._col_width = max(1, int(base_cw * width_ratio))
 
+        self._row_starts = [node.start.toordinal() if node.start else -1 for node, _ in rows]
+        self._row_ends = [node.end.toordinal() if node.end else -1 for node, _ in rows]
+        self._row_progress = [node.progress or 0 for node, _ in rows]
+        self._row_status = [node.status for node, _ in rows]
+        self._row_has_deps = [bool(node.depends_list) for node, _ in rows]
+        self._row_milestone = [node.milestone for node, _ in rows]
+
         # Calculate date range from all nodes
-        all_dates: list[date] = [today]
-        for node, _ in rows:
-            if node.start:
-                all_dates.append(node.start)
-            if node.end:
-                all_dates.append(node.end)
-
-        if all_dates:
-            self._date_start = min(all_dates) - timedelta(days=self._days_per_col * 2)
-            self._date_end = max(all_dates) + timedelta(days=self._days_per_col * 4)
-
-            # week 스케일: 블록이 ISO 주(월-일)와 일치하도록 월요일 정렬
-            if self._scale == "week":
-                days_since_monday = self._date_start.weekday()  # 0=Mon, 6=Sun
-                if days_since_monday != 0:
-                    self._date_start -= timedelta(days=days_since_monday)
-        else:
-            self._date_start = today - timedelta(days=30)
-            self._date_end = today + timedelta(days=60)
+        today_ord = today.toordinal()
+        known = [o for o in self._row_starts if o >= 0]
+        known.extend(o for o in self._row_ends if o >= 0)
+        first_ord = min(known, default=today_ord)
+        last_ord = max(known, default=today_ord)
+        self._date_start = date.fromordinal(min(first_ord, today_ord)) - timedelta(days=self._days_per_col * 2)
+        self._date_end = date.fromordinal(max(last_ord, today_ord)) + timedelta(days=self._days_per_col * 4)
+
+        # week 스케일: 블록이 ISO 주(월-일)와 일치하도록 월요일 정렬
+        if self._scale == "week":
+            days_since_monday = self._date_start.weekday()  # 0=Mon, 6=Sun
+            if days_since_monday != 0:
+                self._date_start -= timedelta(days=days_since_monday)
 
         # Apply scroll offset
         offset_days = scroll_offset * self._days_per_col
@@ -576,6 +716,9 @@ class GanttView(ScrollView):
         total_days = (self._date_end - self._date_start).days
         self._chart_width = max(40, total_days * self._col_width // max(1, self._days_per_col))
 
+        self._col_kind = []
+        self._line_cache.clear()
+
         # Data rows only (no header offset)
         # Use max of rows and visible height so empty area gets themed bg
         self.virtual_size = Size(self._chart_width + 2, max(len(rows), self.size.height))
@@ -611,103 +754,111 @@ class GanttView(ScrollView):
             segments = [Segment(" ", _band_bg(c, band, base, cw)) for c in range(width)]
             return Strip(segments)
 
-        node, depth = self._rows[virtual_y]
-        return self._render_bar(node, depth, chart_w, virtual_y)
+        return self._render_bar(virtual_y, chart_w)
 
     @property
     def _band_style(self) -> Style:
-        return Style(bgcolor=theme.GANTT_BAND_BG)
+        return _bg_style(theme.GANTT_BAND_BG)
 
     @property
     def _base_style(self) -> Style:
-        return Style(bgcolor=theme.APP_BASE_BG)
-
-    def _resolve_bg(self, c: int, band: Style, base: Style, cw: int, weekend_style: Style | None) -> Style:
-        """Resolve background style for a character column, with holiday/weekend overlay."""
-        bg = _band_bg(c, band, base, cw)
-        # Holiday takes priority over weekend
-        if self._holidays and _is_holiday_col(c, self._date_start, self._scale, cw, self._days_per_col, self._holidays):
-            return Style(bgcolor=theme.GANTT_HOLIDAY_BG)
-        if weekend_style and _is_weekend_col(c, self._date_start, self._scale, cw, self._days_per_col):
-            return weekend_style
-        return bg
-
-    def _render_bar(self, node: WBSNode, depth: int, width: int, row_y: int = 0) -> Strip:
-        segments: list[Segment] = []
-        band = self._band_style
-        base = self._base_style
-        cw = self._col_width
-        dep_style = Style(color=theme.GANTT_DEPENDENCY_ARROW)
-        today_col = self._date_to_col(self._today)
-        today_style = Style(color=theme.GANTT_TODAY_MARKER)
-        weekend_style = Style(bgcolor=theme.GANTT_WEEKEND_BG)
+        return _bg_style(theme.APP_BASE_BG)
 
-        # Row banding: odd rows get band, even rows get base (swap roles)
-        row_band = (row_y % 2 == 1)
-        if row_band:
-            band, base = base, band
+    def _col_kinds(self, width: int) -> list[tuple[int, int, int]]:
+        """Return ``(start, end, bg_kind)`` runs for the first *width* columns.
 
+        Holiday takes priority over weekend, which takes priority over banding.
+        Cached until the date range, scale or holidays change.
+        """
+        if len(self._col_kind) < width:
+            cw = self._col_width
+            kinds: list[int] = []
+            for c in range(width):
+                if self._holidays and _is_holiday_col(c, self._date_start, self._scale, cw, self._days_per_col, self._holidays):
+                    kinds.append(BG_HOLIDAY)
+                elif _is_weekend_col(c, self._date_start, self._scale, cw, self._days_per_col):
+                    kinds.append(BG_WEEKEND)
+                else:
+                    kinds.append(BG_BAND if (c // cw) % 2 == 1 else BG_BASE)
+            self._col_kind = kinds
+            runs: list[tuple[int, int, int]] = []
+            c = 0
+            for kind, group in groupby(kinds):
+                n = sum(1 for _ in group)
+                runs.append((c, c + n, kind))
+                c += n
+            self._bg_runs = runs
+        if len(self._col_kind) == width:
+            return self._bg_runs
+        clipped: list[tuple[int, int, int]] = []
+        for start, end, kind in self._bg_runs:
+            if start >= width:
+                break
+            clipped.append((start, min(end, width), kind))
+        return clipped
+
+    def _render_bar(self, row_y: int, width: int) -> Strip:
         # Highlight border for cursor row (underline-only, no overline)
         hl_row = self._highlighted_row
         needs_border = (
             hl_row >= 0
             and row_y in (hl_row - 1, hl_row)  # 항상 2줄만: 위 1행 + 커서 행
         )
+        key = (row_y, width, needs_border)
+        strip = self._line_cache.get(key)
+        if strip is None:
+            strip = self._line_cache[key] = self._build_bar(row_y, width, needs_border)
+        return strip
+
+    def _render_ctx(self) -> tuple[tuple[tuple[Style, ...], dict[tuple[int, int], Style]], ...]:
+        return _build_render_ctx(
+            theme.APP_BASE_BG,
+            theme.GANTT_BAND_BG,
+            theme.GANTT_WEEKEND_BG,
+            theme.GANTT_HOLIDAY_BG,
+            theme.GANTT_DEPENDENCY_ARROW,
+            theme.GANTT_TODAY_MARKER,
+            theme.GANTT_MILESTONE,
+            theme.GANTT_BAR_DONE,
+            theme.GANTT_BAR_IN_PROGRESS,
+            theme.GANTT_BAR_TODO,
+        )
 
-        if node.milestone and node.start:
-            ms_col = self._date_to_col(node.start)
-            ms_style = Style(color=theme.GANTT_MILESTONE, bold=True)
-            for c in range(width):
-                bg = self._resolve_bg(c, band, base, cw, weekend_style)
-                if c == ms_col:
-                    segments.append(Segment("◆", ms_style + bg))
-                elif c == today_col:
-                    segments.append(Segment("│", today_style + bg))
-                else:
-                    segments.append(Segment(" ", bg))
-        elif not node.start:
-            segments = []
-            for c in range(width):
-                bg = self._resolve_bg(c, band, base, cw, weekend_style)
-                if c == today_col:
-                    segments.append(Segment("│", today_style + bg))
-                else:
-                    segments.append(Segment(" ", bg))
-        else:
-            start_col = self._date_to_col(node.start)
-            end_date = node.end or (node.start + timedelta(days=1))
-            end_col = self._date_to_col(end_date)
+    def _build_bar(self, row_y: int, width: int, needs_border: bool) -> Strip:
+        start_ord = self._row_starts[row_y]
+        today_col = self._date_to_col(self._today)
+
+        # Row banding: odd rows get band, even rows get base (swap roles)
+        bg_styles, combined = self._render_ctx()[row_y % 2]
+
+        # Glyph overlays as (start, end, glyph, fg_role); earlier entries win on overlap
+        overlays: list[tuple[int, int, str, int]] = []
+        if self._row_milestone[row_y] and start_ord >= 0:
+            ms_col = self._ord_to_col(start_ord)
+            overlays.append((ms_col, ms_col + 1, "◆", FG_MILESTONE))
+        elif start_ord >= 0:
+            start_col = self._ord_to_col(start_ord)
+            end_ord = self._row_ends[row_y]
+            end_col = self._ord_to_col(end_ord if end_ord >= 0 else start_ord + 1)
             bar_len = max(1, end_col - start_col)
 
             # Color by status
-            if node.status == Status.DONE:
-                bar_style = Style(color=theme.GANTT_BAR_DONE)
-            elif node.status == Status.IN_PROGRESS:
-                bar_style = Style(color=theme.GANTT_BAR_IN_PROGRESS)
-            else:
-                bar_style = Style(color=theme.GANTT_BAR_TODO, dim=True)
+            bar_fg = _STATUS_FG.get(self._row_status[row_y], FG_BAR_TODO)
 
             # Progress fill
-            progress = node.progress or 0
+            progress = self._row_progress[row_y]
             filled = int(bar_len * progress / 100) if progress else 0
 
             # Dependency arrow: show → before bar start
-            has_deps = bool(node.depends_list)
+            if self._row_has_deps[row_y] and start_col > 0:
+                overlays.append((start_col - 1, start_col, "→", FG_DEPENDENCY))
+            overlays.append((start_col, start_col + filled, "█", bar_fg))
+            overlays.append((start_col + filled, start_col + bar_len, "░", bar_fg))
+        if not any(o_start <= today_col < o_end for o_start, o_end, _, _ in overlays):
+            overlays.append((today_col, today_col + 1, "│", FG_TODAY))
+        overlays = sorted((o for o in overlays if o[0] < o[1] and o[0] < width), key=lambda o: o[0])
 
-            for c in range(width):
-                bg = self._resolve_bg(c, band, base, cw, weekend_style)
-                if has_deps and c == start_col - 1 and start_col > 0:
-                    segments.append(Segment("→", dep_style + bg))
-                elif start_col <= c < start_col + bar_len:
-                    pos = c - start_col
-                    if pos < filled:
-                        segments.append(Segment("█", bar_style + bg))
-                    else:
-                        segments.append(Segment("░", bar_style + bg))
-                elif c == today_col:
-                    segments.append(Segment("│", today_style + bg))
-                else:
-                    segments.append(Segment(" ", bg))
+        segments = _overlay_segments(self._col_kinds(width), overlays, bg_styles, combined)
 
         # 공통 후처리: 커서 주변 행에 underline 테두리 적용
         if needs_border:
@@ -726,7 +877,10 @@ class GanttView(ScrollView):
         return Strip(segments)
 
     def _date_to_col(self, d: date) -> int:
-        days = (d - self._date_start).days
+        return self._ord_to_col(d.toordinal())
+
+    def _ord_to_col(self, ordinal: int) -> int:
+        days = ordinal - self._date_start.toordinal()
         col_index = days // self._days_per_col
         base_col = col_index * self._col_width
         # Sub-column offset for week scale (1 day = 1 char within 7-char column)
@@ -2,16 +2,100 @@
 
 from __future__ import annotations
 
+import operator
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from functools import lru_cache
+from itertools import accumulate
+
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
+from textual.content import Content
 from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Static
 
-from tui_wbs.models import LOCK_ICON, Status, WBSNode, ViewConfig, has_incomplete_dependencies
+from tui_wbs.models import LOCK_ICON, Priority, Status, WBSNode, ViewConfig, compute_lock_states
 from tui_wbs import theme
 
 
+_STATUS_ORDER = tuple(Status)
+_STATUS_INDEX = {s: i for i, s in enumerate(_STATUS_ORDER)}
+
+# Viewport culling: cards are only mounted near the visible part of a column
+_CULL_OVERSCAN = 3  # extra cards mounted above/below the viewport
+_CULL_DEFAULT_HEIGHT = 50  # viewport rows assumed before the first layout
+
+
+def card_height(node: WBSNode, width: int = 0, locked: bool = False, chrome: int = 0) -> int:
+    """Rows a card occupies in its column.
+
+    *width* is the space available to the card text; every label line wraps
+    within it. *chrome* is the card's vertical border, padding and margin.
+    Before the column has been laid out (width 0) each line counts as one row.
+    """
+    lock_prefix = f"{LOCK_ICON} " if locked else ""
+    rows = _wrapped_rows(f"{lock_prefix}{node.priority_icon} {node.title}", width)
+    if node.assignee:
+        rows += _wrapped_rows(f"  {node.assignee}", width)
+    if node.milestone:
+        rows += _wrapped_rows("  ◇ Milestone", width)
+    return rows + chrome
+
+
+@lru_cache(maxsize=4096)
+def _wrapped_rows(line: str, width: int) -> int:
+    if width <= 0:
+        return 1
+    return max(1, len(Content(line).wrap(width)))
+
+
+@lru_cache(maxsize=256)
+def _assignee_text(name: str) -> Text:
+    """Parsed ``assignee`` line, shared by every card with that assignee."""
+    return Text.from_markup(f"\n  [dim]{name}[/dim]")
+
+
+@lru_cache(maxsize=8)
+def _milestone_text(color: str) -> Text:
+    """Parsed ``◇ Milestone`` line; keyed by color so theme switches still apply."""
+    return Text.from_markup(f"\n  [{color}]◇ Milestone[/{color}]")
+
+
+@lru_cache(maxsize=4096)
+def _card_label(
+    title: str,
+    priority_icon: str,
+    assignee: str,
+    milestone: bool,
+    locked: bool,
+    milestone_color: str,
+) -> Text:
+    """Build (and cache) the card label for the given display fields.
+
+    Nodes are immutable, so the label is keyed by the fields it shows; an edited
+    node simply maps to a different key. The markup lines are parsed once per
+    assignee / milestone color and assembled here.
+    """
+    lock_prefix = f"{LOCK_ICON} " if locked else ""
+    return Text.assemble(
+        f"{lock_prefix}{priority_icon} {title}",
+        _assignee_text(assignee) if assignee else "",
+        _milestone_text(milestone_color) if milestone else "",
+    )
+
+
+def _same_groups(a: dict[str, list[WBSNode]], b: dict[str, list[WBSNode]]) -> bool:
+    """True when both groupings hold the same node objects in the same order."""
+    if list(a) != list(b):
+        return False
+    return all(
+        len(x) == len(y) and all(map(operator.is_, x, y))
+        for x, y in zip(a.values(), b.values())
+    )
+
+
 class KanbanCard(Static):
     """A single card on the Kanban board."""
 
@@ -31,21 +115,39 @@ class KanbanCard(Static):
     }
     """
 
-    def __init__(self, node: WBSNode, title_map: dict[str, WBSNode] | None = None, **kwargs) -> None:
-        lock_prefix = ""
-        if title_map and node.depends_list and has_incomplete_dependencies(node, title_map):
-            lock_prefix = f"{LOCK_ICON} "
-        label = f"{lock_prefix}{node.priority_icon} {node.title}"
-        if node.assignee:
-            label += f"\n  [dim]{node.assignee}[/dim]"
-        if node.milestone:
-            label += f"\n  [{theme.MILESTONE}]◇ Milestone[/{theme.MILESTONE}]"
+    def __init__(
+        self, node: WBSNode, locked: bool = False, milestone_color: str | None = None, **kwargs
+    ) -> None:
+        self._label = self._build_label(node, locked, milestone_color)
         classes = kwargs.pop("classes", "")
         if node.milestone:
             classes = f"{classes} card-milestone".strip()
-        super().__init__(label, classes=classes, **kwargs)
+        super().__init__(self._label, classes=classes, **kwargs)
         self.node_id = node.id
 
+    @staticmethod
+    def _build_label(node: WBSNode, locked: bool, milestone_color: str | None = None) -> Text:
+        return _card_label(
+            node.title,
+            node.priority_icon,
+            node.assignee,
+            node.milestone,
+            locked,
+            milestone_color or theme.MILESTONE,
+        )
+
+    def set_node(self, node: WBSNode, locked: bool = False, milestone_color: str | None = None) -> None:
+        """Refresh this card in place for an updated version of its node.
+
+        Callers refreshing many cards can pass the current ``theme.MILESTONE``
+        once instead of having every card look it up.
+        """
+        label = self._build_label(node, locked, milestone_color)
+        if label is not self._label:
+            self._label = label
+            self.update(label)
+        self.set_class(node.milestone, "card-milestone")
+
 
 class KanbanColumn(Container):
     """A single column in the Kanban board."""
@@ -63,21 +165,147 @@ class KanbanColumn(Container):
         height: 1;
         margin-bottom: 1;
     }
+    KanbanColumn .card-spacer {
+        height: 0;
+        margin: 0;
+    }
     """
 
-    def __init__(self, title: str, cards: list[WBSNode], title_map: dict[str, WBSNode] | None = None, **kwargs) -> None:
+    def __init__(self, title: str, cards: list[WBSNode], lock_states: dict[str, bool] | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self._title = title
         self._cards = cards
-        self._title_map = title_map or {}
+        self._lock_states = lock_states or {}
+        self._card_widgets: dict[str, KanbanCard] = {}
+        # Width available to card text and rows of card border/padding/margin,
+        # measured from a mounted card once the column is laid out
+        self._text_width: int = 0
+        self._card_chrome: int = 0
+        # Row offset of each card's top edge; _offsets[-1] is the total height
+        self._offsets: list[int] = []
+        self._compute_offsets()
+        self._syncing: bool = False
+        self._sync_pending: bool = False
+
+    def _header_text(self) -> str:
+        return f"[bold]{self._title}[/bold] ({len(self._cards)})"
+
+    def _compute_offsets(self) -> None:
+        width, chrome = self._text_width, self._card_chrome
+        locks = self._lock_states
+        heights = (card_height(node, width, locks.get(node.id, False), chrome) for node in self._cards)
+        self._offsets = list(accumulate(heights, initial=0))
+
+    def _measure_cards(self, scroll: VerticalScroll) -> bool:
+        """Take the card geometry from a mounted card's styles.
+
+        Recomputes the offsets and returns True when the text width or chrome
+        changed, e.g. on the first layout, a resize or a CSS change.
+        """
+        card = next((w for w in self._card_widgets.values() if w.is_mounted), None)
+        if card is None:
+            return False
+        styles = card.styles
+        gutter, margin = styles.gutter, styles.margin
+        width = max(0, scroll.scrollable_content_region.width - gutter.width - margin.width)
+        chrome = gutter.height + margin.height
+        if (width, chrome) == (self._text_width, self._card_chrome):
+            return False
+        self._text_width, self._card_chrome = width, chrome
+        self._compute_offsets()
+        return True
+
+    def _visible_range(self, scroll_y: float, height: int) -> tuple[int, int]:
+        """Return the ``[start, end)`` card indexes to mount for this viewport."""
+        top = int(scroll_y)
+        start = max(0, bisect_right(self._offsets, top) - 1 - _CULL_OVERSCAN)
+        end = min(len(self._cards), bisect_left(self._offsets, top + height) + _CULL_OVERSCAN)
+        return start, end
 
     def compose(self) -> ComposeResult:
-        yield Static(
-            f"[bold]{self._title}[/bold] ({len(self._cards)})", id="col-header"
-        )
+        start, end = self._visible_range(0, _CULL_DEFAULT_HEIGHT)
+        milestone_color = theme.MILESTONE
+        yield Static(self._header_text(), id="col-header")
         with VerticalScroll():
-            for node in self._cards:
-                yield KanbanCard(node, title_map=self._title_map, id=f"card-{node.id}")
+            yield Static(classes="card-spacer")
+            for node in self._cards[start:end]:
+                card = KanbanCard(node, self._lock_states.get(node.id, False), milestone_color)
+                self._card_widgets[node.id] = card
+                yield card
+            yield Static(classes="card-spacer")
+
+    def on_mount(self) -> None:
+        scroll = self.query_one(VerticalScroll)
+        self._set_spacers(scroll, *self._visible_range(0, _CULL_DEFAULT_HEIGHT))
+        self.watch(scroll, "scroll_y", self._schedule_sync, init=False)
+        self._schedule_sync()
+
+    def on_resize(self) -> None:
+        self._schedule_sync()
+
+    def _schedule_sync(self, *_args) -> None:
+        self.call_later(self._sync_window)
+
+    def _set_spacers(self, scroll: VerticalScroll, start: int, end: int) -> None:
+        top, bottom = scroll.children[0], scroll.children[-1]
+        top.styles.height = self._offsets[start]
+        bottom.styles.height = self._offsets[-1] - self._offsets[end]
+
+    async def set_cards(self, cards: list[WBSNode], lock_states: dict[str, bool] | None = None) -> None:
+        """Replace the column's cards, touching only the mounted widgets that changed."""
+        self._cards = cards
+        self._lock_states = lock_states or {}
+        self._compute_offsets()
+        self.query_one("#col-header", Static).update(self._header_text())
+        await self._sync_window()
+
+    async def _sync_window(self) -> None:
+        """Mount the cards intersecting the viewport and drop the rest."""
+        if self._syncing:
+            self._sync_pending = True
+            return
+        self._syncing = True
+        try:
+            scroll = self.query_one(VerticalScroll)
+            self._measure_cards(scroll)
+            start, end = self._visible_range(scroll.scroll_y, scroll.size.height or _CULL_DEFAULT_HEIGHT)
+            window = self._cards[start:end]
+
+            wanted = {node.id for node in window}
+            stale = [w for nid, w in self._card_widgets.items() if nid not in wanted]
+            if stale:
+                for w in stale:
+                    del self._card_widgets[w.node_id]
+                await scroll.remove_children(stale)
+
+            added: list[KanbanCard] = []
+            milestone_color = theme.MILESTONE
+            for node in window:
+                card = self._card_widgets.get(node.id)
+                locked = self._lock_states.get(node.id, False)
+                if card is None:
+                    card = KanbanCard(node, locked, milestone_color)
+                    self._card_widgets[node.id] = card
+                    added.append(card)
+                else:
+                    card.set_node(node, locked, milestone_color)
+            if added:
+                await scroll.mount_all(added, before=scroll.children[-1])
+                if self._measure_cards(scroll):
+                    # First cards of this column: the window was picked from estimates
+                    self._sync_pending = True
+
+            # Restore board order (index 0 is the top spacer); move only misplaced cards
+            for index, node in enumerate(window, 1):
+                card = self._card_widgets[node.id]
+                if scroll.children[index] is not card:
+                    scroll.move_child(card, before=index)
+            self._set_spacers(scroll, start, end)
+        finally:
+            self._syncing = False
+            if self._sync_pending:
+                self._sync_pending = False
+                self._schedule_sync()
 
 
 class KanbanBoard(Container):
@@ -113,6 +341,20 @@ class KanbanBoard(Container):
         self._group_by: str = "status"
         self._selected_card_id: str = ""
         self._rebuild_timer = None
+        self._rebuild_in_flight: bool = False
+        self._rebuild_pending: bool = False
+        self._req_id: int = 0
+        # Mounted columns keyed by group title, reused across rebuilds
+        self._columns: dict[str, KanbanColumn] = {}
+        # Flattened _wbs_nodes, valid while _flat_source is the current list
+        self._flat_cache: list[WBSNode] = []
+        self._flat_source: list[WBSNode] | None = None
+        self._node_index: dict[str, WBSNode] = {}
+        # Grouping prepared synchronously ahead of the async mount phase
+        self._prepared: tuple[dict[str, list[WBSNode]], dict[str, bool]] | None = None
+        self._prepared_key: tuple[int, str] | None = None
+        # (groups, lock_states, milestone color) of the last completed sync
+        self._mounted: tuple[dict[str, list[WBSNode]], dict[str, bool], str] | None = None
 
     def compose(self) -> ComposeResult:
         yield Horizontal(id="kanban-columns")
@@ -129,74 +371,150 @@ class KanbanBoard(Container):
             self._group_by = view_config.group_by
         if title_map is not None:
             self._title_map = title_map
+        self._req_id += 1
         self._schedule_rebuild()
 
     def _schedule_rebuild(self) -> None:
         """Debounce rebuild to avoid DuplicateIds from async remove_children."""
         if self._rebuild_timer is not None:
             self._rebuild_timer.stop()
+        self._recompute_groups()
         self._rebuild_timer = self.set_timer(0.01, self._rebuild)
 
-    async def _rebuild(self) -> None:
-        self._rebuild_timer = None
-        try:
-            container = self.query_one("#kanban-columns", Horizontal)
-        except Exception:
-            return
-        await container.remove_children()
+    def _recompute_groups(self) -> tuple[dict[str, list[WBSNode]], dict[str, bool]]:
+        """Flatten, group and lock-check the current data (memoized per update)."""
+        key = (self._req_id, self._group_by)
+        if self._prepared is not None and self._prepared_key == key:
+            return self._prepared
 
-        # Flatten nodes
-        flat: list[WBSNode] = []
-        for node in self._wbs_nodes:
-            self._flatten(node, flat)
+        flat = self._all_flat()
+        lock_states = compute_lock_states(flat, self._title_map)
 
-        # Group by status
-        groups: dict[str, list[WBSNode]] = {}
+        groups: dict[str, list[WBSNode]]
         if self._group_by == "status":
-            for s in Status:
-                groups[s.value] = []
+            by_status: dict[Status, list[WBSNode]] = {s: [] for s in Status}
             for node in flat:
-                groups.setdefault(node.status.value, []).append(node)
+                by_status[node.status].append(node)
+            groups = {s.value: cards for s, cards in by_status.items()}
         elif self._group_by == "priority":
-            from tui_wbs.models import Priority
-
-            for p in Priority:
-                groups[p.value] = []
+            by_priority: dict[Priority, list[WBSNode]] = {p: [] for p in Priority}
             for node in flat:
-                groups.setdefault(node.priority.value, []).append(node)
+                by_priority[node.priority].append(node)
+            groups = {p.value: cards for p, cards in by_priority.items()}
         elif self._group_by == "assignee":
+            groups = defaultdict(list)
             for node in flat:
-                key = node.assignee or "(unassigned)"
-                groups.setdefault(key, []).append(node)
+                groups[node.assignee or "(unassigned)"].append(node)
+            groups = dict(groups)
         else:
-            groups["All"] = flat
+            groups = {"All": flat}
 
-        for i, (title, cards) in enumerate(groups.items()):
-            col = KanbanColumn(title, cards, title_map=self._title_map, id=f"kanban-col-{i}")
-            await container.mount(col)
+        self._prepared = (groups, lock_states)
+        self._prepared_key = key
+        return self._prepared
+
+    async def _rebuild(self) -> None:
+        """Bring the mounted columns in line with the current data.
+
+        Only one rebuild runs at a time: a trigger that arrives mid-rebuild sets
+        ``_rebuild_pending`` and is replayed when the current pass finishes, and
+        a pass whose data was superseded (``_req_id`` changed) stops early.
+        """
+        self._rebuild_timer = None
+        if self._rebuild_in_flight:
+            self._rebuild_pending = True
+            return
+        try:
+            container = self.query_one("#kanban-columns", Horizontal)
+        except Exception:
+            return
+        groups, lock_states = self._recompute_groups()
+        mounted = self._mounted
+        if (
+            mounted is not None
+            and mounted[2] == theme.MILESTONE
+            and mounted[1] == lock_states
+            and _same_groups(mounted[0], groups)
+        ):
+            return
+        self._rebuild_in_flight = True
+        try:
+            if await self._sync_columns(container, self._req_id, groups, lock_states):
+                self._mounted = (groups, lock_states, theme.MILESTONE)
+        finally:
+            self._rebuild_in_flight = False
+            if self._rebuild_pending:
+                self._rebuild_pending = False
+                self._schedule_rebuild()
+
+    async def _sync_columns(
+        self,
+        container: Horizontal,
+        req_id: int,
+        groups: dict[str, list[WBSNode]],
+        lock_states: dict[str, bool],
+    ) -> bool:
+        """Mount/update columns for *groups*; False if superseded midway."""
+        stale = [col for title, col in self._columns.items() if title not in groups]
+        if stale:
+            self._columns = {t: c for t, c in self._columns.items() if t in groups}
+            await container.remove_children(stale)
+            if req_id != self._req_id:
+                self._rebuild_pending = True
+                return False
+
+        new_columns: dict[str, KanbanColumn] = {}
+        for title, cards in groups.items():
+            col = self._columns.get(title)
+            if col is None:
+                new_columns[title] = KanbanColumn(title, cards, lock_states=lock_states)
+            else:
+                await col.set_cards(cards, lock_states)
+                if req_id != self._req_id:
+                    self._rebuild_pending = True
+                    return False
+
+        # Mount all new columns in one batch, then fix up the order
+        if new_columns:
+            await container.mount_all(new_columns.values())
+            self._columns.update(new_columns)
+        for index, title in enumerate(groups):
+            col = self._columns[title]
+            if container.children[index] is not col:
+                container.move_child(col, before=index)
+        return True
 
     def _flatten(self, node: WBSNode, result: list[WBSNode]) -> None:
-        result.append(node)
-        for child in node.children:
-            self._flatten(child, result)
+        """Append *node* and its descendants to *result* in pre-order."""
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            result.append(n)
+            stack.extend(reversed(n.children))
 
     def move_card(self, node_id: str, direction: int) -> None:
         """Move card left (-1) or right (+1) in status columns."""
-        statuses = list(Status)
-        # Find current status
-        for node in self._all_flat():
-            if node.id == node_id:
-                try:
-                    idx = statuses.index(node.status)
-                except ValueError:
-                    return
-                new_idx = max(0, min(len(statuses) - 1, idx + direction))
-                if new_idx != idx:
-                    self.post_message(self.CardMoved(node_id, statuses[new_idx]))
-                return
+        self._all_flat()
+        node = self._node_index.get(node_id)
+        if node is None:
+            return
+        idx = _STATUS_INDEX.get(node.status)
+        if idx is None:
+            return
+        new_idx = max(0, min(len(_STATUS_ORDER) - 1, idx + direction))
+        if new_idx != idx:
+            self.post_message(self.CardMoved(node_id, _STATUS_ORDER[new_idx]))
 
     def _all_flat(self) -> list[WBSNode]:
-        flat: list[WBSNode] = []
-        for node in self._wbs_nodes:
-            self._flatten(node, flat)
-        return flat
+        """Return all nodes in pre-order, cached until a new node list arrives.
+
+        Also refreshes ``_node_index`` (id -> node) for the same list.
+        """
+        if self._flat_source is not self._wbs_nodes:
+            flat: list[WBSNode] = []
+            for node in self._wbs_nodes:
+                self._flatten(node, flat)
+            self._flat_cache = flat
+            self._flat_source = self._wbs_nodes
+            self._node_index = {n.id: n for n in flat}
+        return self._flat_cache
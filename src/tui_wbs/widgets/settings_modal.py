@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 
 from textual.app import ComposeResult
-from textual.containers import Horizontal, VerticalScroll
+from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, OptionList, Select, Static
 from textual.widgets.option_list import Option
@@ -13,6 +13,33 @@ from textual.widgets.option_list import Option
 from tui_wbs.models import ColumnDef, DATE_FORMAT_PRESETS, ProjectConfig, ViewConfig
 
 
+def _view_label(view: ViewConfig) -> str:
+    return f"  {view.name} ({view.type})"
+
+
+def _col_label(col: ColumnDef) -> str:
+    vals = f" ({', '.join(col.values)})" if col.values else ""
+    return f"  {col.name} [{col.type}]{vals}"
+
+
+def _sync_option_list(ol: OptionList, prefix: str, labels: list[str], old: list[str]) -> None:
+    """Update *ol* from *old* to *labels*, touching only the rows that differ.
+
+    Option ids are positional (``{prefix}-{i}``), so a changed row keeps its id
+    and only gets a new prompt; rows are added or removed at the end.
+    """
+    for i in range(len(old) - 1, len(labels) - 1, -1):
+        ol.remove_option_at_index(i)
+    for i, (label, prev) in enumerate(zip(labels, old)):
+        if label != prev:
+            ol.replace_option_prompt_at_index(i, label)
+    if len(labels) > len(old):
+        ol.add_options(
+            Option(label, id=f"{prefix}-{i}")
+            for i, label in enumerate(labels[len(old):], len(old))
+        )
+
+
 class SettingsModal(ModalScreen[ProjectConfig | None]):
     """Settings modal for project configuration."""
 
@@ -37,6 +64,9 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
     .settings-section {
         margin-bottom: 1;
     }
+    .edit-fields {
+        height: auto;
+    }
     .settings-label {
         text-style: bold;
         color: $text-muted;
@@ -71,6 +101,12 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
         self._config = config
         self._selected_view_idx: int = -1
         self._selected_col_idx: int = -1
+        # Prompts currently shown in the view / column option lists
+        self._view_list_sig: list[str] = []
+        self._col_list_sig: list[str] = []
+        # Edit widgets currently mounted for the selected view / column
+        self._view_edit_inputs: tuple[Input, Select] | None = None
+        self._col_edit_inputs: tuple[Input, Input, Select, Input] | None = None
 
     def compose(self) -> ComposeResult:
         with VerticalScroll(id="settings-container"):
@@ -79,18 +115,20 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
             # --- Project ---
             yield Static("[bold]Project[/bold]", classes="settings-label")
             yield Label("Name:")
-            yield Input(
+            self._name_input = Input(
                 value=self._config.name,
                 placeholder="Project name",
                 id="project-name-input",
             )
+            yield self._name_input
             yield Label("Date Format:")
-            yield Select(
+            self._fmt_select: Select[str] = Select(
                 [(label, label) for label in DATE_FORMAT_PRESETS],
                 value=self._config.date_format,
                 id="date-format-select",
                 allow_blank=False,
             )
+            yield self._fmt_select
 
             # --- Views ---
             yield Static("")
@@ -103,7 +141,10 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
                 yield Button("Del", id="view-del-btn", variant="warning")
 
             # View edit fields (hidden initially)
-            yield Static("", id="view-edit-section")
+            self._view_edit_section = Static("", id="view-edit-section")
+            yield self._view_edit_section
+            self._view_edit_fields = Vertical(id="view-edit-fields", classes="edit-fields")
+            yield self._view_edit_fields
 
             # --- Default Columns ---
             yield Static("")
@@ -122,7 +163,10 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
                 yield Button("Del", id="col-del-btn", variant="warning")
 
             # Column edit fields
-            yield Static("", id="col-edit-section")
+            self._col_edit_section = Static("", id="col-edit-section")
+            yield self._col_edit_section
+            self._col_edit_fields = Vertical(id="col-edit-fields", classes="edit-fields")
+            yield self._col_edit_fields
 
             # --- Save/Close ---
             with Horizontal(id="settings-buttons"):
@@ -130,16 +174,17 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
                 yield Button("Close", variant="default", id="close-btn")
 
     def _build_view_list(self) -> OptionList:
-        ol = OptionList(id="view-list")
-        for i, v in enumerate(self._config.views):
-            ol.add_option(Option(f"  {v.name} ({v.type})", id=f"view-{i}"))
+        ol = self._view_list = OptionList(id="view-list")
+        self._view_list_sig = [_view_label(v) for v in self._config.views]
+        for i, label in enumerate(self._view_list_sig):
+            ol.add_option(Option(label, id=f"view-{i}"))
         return ol
 
     def _build_col_list(self) -> OptionList:
-        ol = OptionList(id="col-list")
-        for i, col in enumerate(self._config.custom_columns):
-            vals = f" ({', '.join(col.values)})" if col.values else ""
-            ol.add_option(Option(f"  {col.name} [{col.type}]{vals}", id=f"col-{i}"))
+        ol = self._col_list = OptionList(id="col-list")
+        self._col_list_sig = [_col_label(col) for col in self._config.custom_columns]
+        for i, label in enumerate(self._col_list_sig):
+            ol.add_option(Option(label, id=f"col-{i}"))
         return ol
 
     def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
@@ -155,7 +200,7 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
             except (ValueError, IndexError):
                 pass
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         btn = event.button.id or ""
 
         if btn == "save-btn":
@@ -169,7 +214,7 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
             self._config.views.append(new_view)
             self._refresh_view_list()
         elif btn == "view-edit-btn":
-            self._show_view_edit()
+            await self._show_view_edit()
         elif btn == "view-dup-btn":
             if 0 <= self._selected_view_idx < len(self._config.views):
                 orig = self._config.views[self._selected_view_idx]
@@ -203,7 +248,7 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
             self._config.custom_columns.append(new_col)
             self._refresh_col_list()
         elif btn == "col-edit-btn":
-            self._show_col_edit()
+            await self._show_col_edit()
         elif btn == "col-del-btn":
             if 0 <= self._selected_col_idx < len(self._config.custom_columns):
                 self._config.custom_columns.pop(self._selected_col_idx)
@@ -213,64 +258,44 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
             self._apply_col_edit()
 
     def _apply_name(self) -> None:
-        try:
-            name_input = self.query_one("#project-name-input", Input)
-            self._config.name = name_input.value
-        except Exception:
-            pass
-        try:
-            fmt_select = self.query_one("#date-format-select", Select)
-            if fmt_select.value and fmt_select.value != Select.BLANK:
-                self._config.date_format = str(fmt_select.value)
-        except Exception:
-            pass
+        self._config.name = self._name_input.value
+        fmt = self._fmt_select.value
+        if fmt and fmt != Select.BLANK:
+            self._config.date_format = str(fmt)
 
     def _refresh_view_list(self) -> None:
-        try:
-            old = self.query_one("#view-list", OptionList)
-            old.clear_options()
-            for i, v in enumerate(self._config.views):
-                old.add_option(Option(f"  {v.name} ({v.type})", id=f"view-{i}"))
-        except Exception:
-            pass
+        labels = [_view_label(v) for v in self._config.views]
+        if labels == self._view_list_sig:
+            return
+        _sync_option_list(self._view_list, "view", labels, self._view_list_sig)
+        self._view_list_sig = labels
 
     def _refresh_col_list(self) -> None:
-        try:
-            old = self.query_one("#col-list", OptionList)
-            old.clear_options()
-            for i, col in enumerate(self._config.custom_columns):
-                vals = f" ({', '.join(col.values)})" if col.values else ""
-                old.add_option(Option(f"  {col.name} [{col.type}]{vals}", id=f"col-{i}"))
-        except Exception:
-            pass
+        labels = [_col_label(col) for col in self._config.custom_columns]
+        if labels == self._col_list_sig:
+            return
+        _sync_option_list(self._col_list, "col", labels, self._col_list_sig)
+        self._col_list_sig = labels
 
-    def _show_view_edit(self) -> None:
+    async def _show_view_edit(self) -> None:
         if not (0 <= self._selected_view_idx < len(self._config.views)):
             return
         view = self._config.views[self._selected_view_idx]
         try:
-            section = self.query_one("#view-edit-section", Static)
-            parent = section.parent
-            if parent is None:
-                return
-            # Remove old edit widgets
-            for w in self.query(".view-edit-widget"):
-                w.remove()
-            section.update("[bold]Edit View[/bold]")
-            idx = parent._nodes.index(section)
-            # Insert edit fields after section marker
-            name_inp = Input(value=view.name, placeholder="View name", id="view-name-edit", classes="view-edit-widget")
+            fields = self._view_edit_fields
+            # Drop the previous edit widgets before reusing their ids
+            await fields.remove_children()
+            self._view_edit_section.update("[bold]Edit View[/bold]")
+            name_inp = Input(value=view.name, placeholder="View name", id="view-name-edit")
             type_sel = Select(
                 [("table", "table"), ("table+gantt", "table+gantt"), ("kanban", "kanban")],
                 value=view.type,
                 id="view-type-edit",
                 allow_blank=False,
-                classes="view-edit-widget",
             )
-            save_btn = Button("Apply", id="view-save-edit-btn", variant="success", classes="view-edit-widget")
-            parent.mount(name_inp, after=section)
-            parent.mount(type_sel, after=name_inp)
-            parent.mount(save_btn, after=type_sel)
+            save_btn = Button("Apply", id="view-save-edit-btn", variant="success")
+            await fields.mount(name_inp, type_sel, save_btn)
+            self._view_edit_inputs = (name_inp, type_sel)
         except Exception:
             pass
 
@@ -278,59 +303,41 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
         if not (0 <= self._selected_view_idx < len(self._config.views)):
             return
         view = self._config.views[self._selected_view_idx]
-        try:
-            name_inp = self.query_one("#view-name-edit", Input)
+        if self._view_edit_inputs is not None:
+            name_inp, type_sel = self._view_edit_inputs
             view.name = name_inp.value.strip() or view.name
-        except Exception:
-            pass
-        try:
-            type_sel = self.query_one("#view-type-edit", Select)
             if type_sel.value:
                 view.type = str(type_sel.value)
-        except Exception:
-            pass
         self._refresh_view_list()
         # Clean up edit widgets
-        for w in self.query(".view-edit-widget"):
-            w.remove()
-        try:
-            self.query_one("#view-edit-section", Static).update("")
-        except Exception:
-            pass
+        self._view_edit_fields.remove_children()
+        self._view_edit_inputs = None
+        self._view_edit_section.update("")
 
-    def _show_col_edit(self) -> None:
+    async def _show_col_edit(self) -> None:
         if not (0 <= self._selected_col_idx < len(self._config.custom_columns)):
             return
         col = self._config.custom_columns[self._selected_col_idx]
         try:
-            section = self.query_one("#col-edit-section", Static)
-            parent = section.parent
-            if parent is None:
-                return
-            for w in self.query(".col-edit-widget"):
-                w.remove()
-            section.update("[bold]Edit Column[/bold]")
-            id_inp = Input(value=col.id, placeholder="Column ID", id="col-id-edit", classes="col-edit-widget")
-            name_inp = Input(value=col.name, placeholder="Column Name", id="col-name-edit", classes="col-edit-widget")
+            fields = self._col_edit_fields
+            await fields.remove_children()
+            self._col_edit_section.update("[bold]Edit Column[/bold]")
+            id_inp = Input(value=col.id, placeholder="Column ID", id="col-id-edit")
+            name_inp = Input(value=col.name, placeholder="Column Name", id="col-name-edit")
             type_sel = Select(
                 [("text", "text"), ("enum", "enum"), ("number", "number")],
                 value=col.type,
                 id="col-type-edit",
                 allow_blank=False,
-                classes="col-edit-widget",
             )
             vals_inp = Input(
                 value=", ".join(col.values),
                 placeholder="Values (comma separated, for enum)",
                 id="col-values-edit",
-                classes="col-edit-widget",
             )
-            save_btn = Button("Apply", id="col-save-edit-btn", variant="success", classes="col-edit-widget")
-            parent.mount(id_inp, after=section)
-            parent.mount(name_inp, after=id_inp)
-            parent.mount(type_sel, after=name_inp)
-            parent.mount(vals_inp, after=type_sel)
-            parent.mount(save_btn, after=vals_inp)
+            save_btn = Button("Apply", id="col-save-edit-btn", variant="success")
+            await fields.mount(id_inp, name_inp, type_sel, vals_inp, save_btn)
+            self._col_edit_inputs = (id_inp, name_inp, type_sel, vals_inp)
         except Exception:
             pass
 
@@ -338,32 +345,17 @@ class SettingsModal(ModalScreen[ProjectConfig | None]):
         if not (0 <= self._selected_col_idx < len(self._config.custom_columns)):
             return
         col = self._config.custom_columns[self._selected_col_idx]
-        try:
-            col.id = self.query_one("#col-id-edit", Input).value.strip() or col.id
-        except Exception:
-            pass
-        try:
-            col.name = self.query_one("#col-name-edit", Input).value.strip() or col.name
-        except Exception:
-            pass
-        try:
-            type_sel = self.query_one("#col-type-edit", Select)
+        if self._col_edit_inputs is not None:
+            id_inp, name_inp, type_sel, vals_inp = self._col_edit_inputs
+            col.id = id_inp.value.strip() or col.id
+            col.name = name_inp.value.strip() or col.name
             if type_sel.value:
                 col.type = str(type_sel.value)
-        except Exception:
-            pass
-        try:
-            vals_str = self.query_one("#col-values-edit", Input).value
-            col.values = [v.strip() for v in vals_str.split(",") if v.strip()]
-        except Exception:
-            pass
+            col.values = [v.strip() for v in vals_inp.value.split(",") if v.strip()]
         self._refresh_col_list()
-        for w in self.query(".col-edit-widget"):
-            w.remove()
-        try:
-            self.query_one("#col-edit-section", Static).update("")
-        except Exception:
-            pass
+        self._col_edit_fields.remove_children()
+        self._col_edit_inputs = None
+        self._col_edit_section.update("")
 
     def action_cancel(self) -> None:
         self.dismiss(None)
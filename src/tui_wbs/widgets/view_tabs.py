@@ -11,6 +11,17 @@ from textual.widgets import Static
 
 from tui_wbs.models import ViewConfig
 
+_INACTIVE_CLASSES = "tab-button"
+_ACTIVE_CLASSES = "tab-button tab-active"
+
+
+class _TabButton(Static):
+    """A single tab; remembers the id of the view it selects."""
+
+    def __init__(self, view: ViewConfig, index: int, classes: str) -> None:
+        super().__init__(f" {view.name} ", id=f"tab-{index}", classes=classes)
+        self.view_id = view.id
+
 
 class ViewTabs(Container):
     """A tab bar for switching between views."""
@@ -78,6 +89,7 @@ class ViewTabs(Container):
         self._active_id = active_id
         self._render_timer = None
         self._rendering = False
+        self._last_sig: tuple | None = None
 
     def compose(self) -> ComposeResult:
         yield Horizontal(id="view-tabs-container")
@@ -102,18 +114,15 @@ class ViewTabs(Container):
         try:
             container = self.query_one("#view-tabs-container", Horizontal)
             await container.remove_children()
-            children = []
-            for i, view in enumerate(self._views):
-                classes = "tab-button"
-                if view.id == self._active_id:
-                    classes += " tab-active"
-                children.append(Static(
-                    f" {view.name} ",
-                    id=f"tab-{view.id}-{i}",
-                    classes=classes,
-                ))
+            active_id = self._active_id
+            children: list[Static] = [
+                _TabButton(
+                    view, i, _ACTIVE_CLASSES if view.id == active_id else _INACTIVE_CLASSES
+                )
+                for i, view in enumerate(self._views)
+            ]
             children.append(Static("+", id="add-view-btn"))
-            await container.mount(*children)
+            await container.mount_all(children)
         except Exception:
             pass
         finally:
@@ -121,14 +130,10 @@ class ViewTabs(Container):
 
     def on_click(self, event: Click) -> None:
         widget = event.widget
-        widget_id = widget.id or ""
-        if widget_id == "add-view-btn":
+        if isinstance(widget, _TabButton):
+            self.post_message(self.ViewSelected(widget.view_id))
+        elif widget is not None and widget.id == "add-view-btn":
             self.post_message(self.AddViewRequested())
-        elif widget_id.startswith("tab-"):
-            parts = widget_id.split("-")
-            if len(parts) >= 3:
-                view_id = "-".join(parts[1:-1])
-                self.post_message(self.ViewSelected(view_id))
 
     def key_enter(self) -> None:
         self.post_message(self.EditViewRequested())
@@ -150,7 +155,38 @@ class ViewTabs(Container):
         self.post_message(self.ViewSelected(self._active_id))
 
     def update_views(self, views: list[ViewConfig], active_id: str) -> None:
-        """Rebuild the tab bar with new data."""
+        """Rebuild the tab bar with new data.
+
+        Skips the rebuild when nothing changed, and only toggles the
+        ``tab-active`` class when just the active tab moved.
+        """
         self._views = views
         self._active_id = active_id
+        tabs_sig = tuple((v.id, v.name) for v in views)
+        sig = (tabs_sig, active_id)
+        last_sig = self._last_sig
+        if sig == last_sig:
+            return
+        self._last_sig = sig
+        if (
+            last_sig is not None
+            and last_sig[0] == tabs_sig
+            and self._render_timer is None
+            and not self._rendering
+            and self._swap_active(last_sig[1], active_id)
+        ):
+            return
         self._schedule_render()
+
+    def _swap_active(self, old_id: str, new_id: str) -> bool:
+        """Move the ``tab-active`` class between mounted tabs in place."""
+        try:
+            tabs = self.query_one("#view-tabs-container", Horizontal).children
+        except Exception:
+            return False
+        if len(tabs) != len(self._views) + 1:
+            return False
+        for i, view in enumerate(self._views):
+            if view.id == old_id or view.id == new_id:
+                tabs[i].set_class(view.id == new_id, "tab-active")
+        return True
@@ -2,23 +2,32 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Sequence
 from datetime import date
+from functools import lru_cache
 
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.message import Message
 from textual.widgets import DataTable
+from textual.widgets.data_table import CellKey, RowKey
 
+from rich.style import Style
 from rich.text import Text
 
 from tui_wbs.models import (
     LOCK_ICON,
     MILESTONE_ICON,
+    PRIORITY_ICONS,
+    STATUS_ICONS,
+    Priority,
     Status,
     ViewConfig,
     WBSNode,
+    compute_lock_states,
     format_date,
     has_incomplete_dependencies,
+    roots_changed,
 )
 from tui_wbs import theme
 from tui_wbs.widgets.gantt_chart import GanttToolbar
@@ -38,14 +47,49 @@ class SyncedDataTable(DataTable):
         super().watch_scroll_y(old_value, new_value)
         self.post_message(self.ScrollChanged(new_value))
 
+    def remove_rows(self, row_keys: Iterable[str]) -> None:
+        """Remove several rows, re-indexing the remaining rows only once.
+
+        Same bookkeeping as ``DataTable.remove_row``, which re-indexes the
+        whole table for every single row removed.
+        """
+        doomed = {RowKey(key) for key in row_keys}
+        doomed.intersection_update(self.rows)
+        if not doomed:
+            return
+        for row_key in doomed:
+            for column_key in self._data[row_key]:
+                self._updated_cells.discard(CellKey(row_key, column_key))
+            self._new_rows.discard(row_key)
+            del self.rows[row_key]
+            del self._data[row_key]
+        locations = self._row_locations
+        remaining = sorted(
+            (locations.get(row_key), row_key) for row_key in locations if row_key not in doomed
+        )
+        self._row_locations = type(locations)(
+            {row_key: index for index, (_, row_key) in enumerate(remaining)}
+        )
+        self._require_update_dimensions = True
+        self.cursor_coordinate = self.cursor_coordinate
+        self.hover_coordinate = self.hover_coordinate
+        self._update_count += 1
+        self.check_idle()
+        self.refresh(layout=True)
+
+    def reorder_rows(self, row_keys: Sequence[str]) -> None:
+        """Display the existing rows in the given key order (like ``sort``)."""
+        self._row_locations = type(self._row_locations)(
+            {RowKey(key): index for index, key in enumerate(row_keys)}
+        )
+        self._update_count += 1
+        self.refresh()
+
 
 _PROGRESS_BAR_WIDTH = 8
 
 
-def _make_progress_cell(progress: int | None, bar_width: int = _PROGRESS_BAR_WIDTH) -> Text | str:
-    if progress is None:
-        return ""
-    progress = max(0, min(100, progress))
+def _build_progress_cell(progress: int, bar_width: int) -> Text:
     filled = max(1, round(bar_width * progress / 100)) if progress > 0 else 0
     empty = bar_width - filled
 
@@ -62,6 +106,25 @@ def _make_progress_cell(progress: int | None, bar_width: int = _PROGRESS_BAR_WID
     return text
 
 
+# Prebuilt cells for 0..100% at the default width, shared by every row (the
+# DataTable never mutates them). Rebuilt when the theme swaps its thresholds.
+_progress_cells: list[Text] = []
+_progress_cells_thresholds: list[tuple[int, str]] | None = None
+
+
+def _make_progress_cell(progress: int | None, bar_width: int = _PROGRESS_BAR_WIDTH) -> Text | str:
+    global _progress_cells, _progress_cells_thresholds
+    if progress is None:
+        return ""
+    progress = max(0, min(100, progress))
+    if bar_width != _PROGRESS_BAR_WIDTH:
+        return _build_progress_cell(progress, bar_width)
+    if _progress_cells_thresholds is not theme.PROGRESS_THRESHOLDS:
+        _progress_cells = [_build_progress_cell(p, bar_width) for p in range(101)]
+        _progress_cells_thresholds = theme.PROGRESS_THRESHOLDS
+    return _progress_cells[progress]
+
+
 COLUMN_LABELS = {
     "id": "#",
     "title": "Title",
@@ -160,6 +223,21 @@ class WBSTable(Container):
         self._date_format = date_format
         self._flat_rows: list[tuple[WBSNode, int, str]] = []
         self._collapsed: set[str] = set()
+        # Bumped whenever the roots or the collapsed set change; _flat_rows is
+        # only re-flattened when it was built for an older version
+        self._tree_version = 0
+        self._flat_version = -1
+        self._roots_seen: tuple[WBSNode, ...] = tuple(self._wbs_nodes)
+        # node.id -> position in _flat_rows, rebuilt together with it
+        self._row_index_by_id: dict[str, int] = {}
+        # (node.id, depth, hier_id, collapsed, columns) -> (node, row); reused
+        # across collapse/expand rebuilds and dropped whenever new data arrives
+        self._row_cache: dict[tuple, tuple[WBSNode, list]] = {}
+        # Incomplete-dependency flag per node id, filled per rebuild for the
+        # rows that became visible and dropped together with the row cache
+        self._lock_states: dict[str, bool] = {}
+        # Reference date for overdue highlighting, refreshed once per rebuild
+        self._today: date = date.today()
 
     def compose(self) -> ComposeResult:
         yield GanttToolbar(show_scale=False, id="wbs-toolbar")
@@ -183,6 +261,7 @@ class WBSTable(Container):
         # Save cursor position before rebuild
         saved_node_id = self.highlighted_node_id
         saved_col_id = self.highlighted_column_id
+        self._refresh_today()
 
         table.clear(columns=True)
 
@@ -193,118 +272,94 @@ class WBSTable(Container):
             width = custom_widths.get(col_id, DEFAULT_COLUMN_WIDTHS.get(col_id))
             table.add_column(label, key=col_id, width=width)
 
-        self._flat_rows = []
-        for idx, node in enumerate(self._wbs_nodes, start=1):
-            self._flatten_node(node, 0, str(idx))
+        self._visible_rows()
+        lock_states = self._lock_states
+        unchecked = [node for node, _, _ in self._flat_rows if node.id not in lock_states]
+        if unchecked:
+            lock_states.update(compute_lock_states(unchecked, self._title_map))
 
         for node, depth, hier_id in self._flat_rows:
             row_data = self._make_row(node, depth, hier_id)
             table.add_row(*row_data, key=node.id)
 
         # Restore cursor position after rebuild
-        if saved_node_id:
-            for row_idx, (node, _, _) in enumerate(self._flat_rows):
-                if node.id == saved_node_id:
-                    col_idx = 0
-                    if saved_col_id:
-                        try:
-                            col_idx = columns.index(saved_col_id)
-                        except ValueError:
-                            pass
-                    table.move_cursor(row=row_idx, column=col_idx, animate=False)
-                    break
+        row_idx = self.row_index(saved_node_id) if saved_node_id else None
+        if row_idx is not None:
+            col_idx = 0
+            if saved_col_id:
+                try:
+                    col_idx = columns.index(saved_col_id)
+                except ValueError:
+                    pass
+            table.move_cursor(row=row_idx, column=col_idx, animate=False)
 
         self.post_message(self.RowsChanged(list(self._flat_rows)))
 
-    def _flatten_node(self, node: WBSNode, depth: int, prefix: str = "") -> None:
-        self._flat_rows.append((node, depth, prefix))
-        if node.id not in self._collapsed:
-            for idx, child in enumerate(node.children, start=1):
-                self._flatten_node(child, depth + 1, f"{prefix}.{idx}")
+    def _refresh_today(self) -> bool:
+        """Update ``_today``; True (and cached rows dropped) if the date changed."""
+        today = date.today()
+        if today == self._today:
+            return False
+        self._today = today
+        self._row_cache.clear()
+        return True
+
+    def _visible_rows(self) -> list[tuple[WBSNode, int, str]]:
+        """Return ``_flat_rows``, re-flattening only if the tree changed."""
+        if self._flat_version != self._tree_version:
+            self._set_flat_rows(self._flatten_rows())
+        return self._flat_rows
+
+    def _set_flat_rows(self, rows: list[tuple[WBSNode, int, str]]) -> None:
+        self._flat_rows = rows
+        self._flat_version = self._tree_version
+        self._row_index_by_id = {node.id: i for i, (node, _, _) in enumerate(rows)}
+
+    def row_index(self, node_id: str) -> int | None:
+        """Return the display row of *node_id*, or None if it isn't shown."""
+        return self._row_index_by_id.get(node_id)
+
+    def get_row_by_id(self, node_id: str) -> tuple[WBSNode, int, str] | None:
+        """Return the ``(node, depth, hier_id)`` row of *node_id*, if shown."""
+        idx = self._row_index_by_id.get(node_id)
+        return None if idx is None else self._flat_rows[idx]
+
+    def _flatten_rows(self) -> list[tuple[WBSNode, int, str]]:
+        """Return the visible ``(node, depth, hier_id)`` rows in pre-order.
+
+        Iterative, so deep trees don't hit the recursion limit; children of
+        collapsed nodes are skipped.
+        """
+        rows: list[tuple[WBSNode, int, str]] = []
+        collapsed = self._collapsed
+        stack = [(node, 0, str(idx)) for idx, node in enumerate(self._wbs_nodes, start=1)]
+        stack.reverse()
+        while stack:
+            entry = stack.pop()
+            rows.append(entry)
+            node, depth, prefix = entry
+            if node.children and node.id not in collapsed:
+                children = [
+                    (child, depth + 1, f"{prefix}.{idx}")
+                    for idx, child in enumerate(node.children, start=1)
+                ]
+                children.reverse()
+                stack.extend(children)
+        return rows
 
     def _make_row(self, node: WBSNode, depth: int, hier_id: str = "") -> list[str]:
-        columns = self._view_config.columns
-        row: list[str] = []
-
-        for col_id in columns:
-            if col_id == "id":
-                row.append(hier_id)
-            elif col_id == "title":
-                indent = "  " * depth
-                if node.children:
-                    fold_icon = "▶ " if node.id in self._collapsed else "▼ "
-                else:
-                    fold_icon = "  "
-                icon = node.display_icon
-                lock = ""
-                if node.depends_list and has_incomplete_dependencies(node, self._title_map):
-                    lock = f" {LOCK_ICON}"
-                prefix = f"{indent}{fold_icon}{icon} "
-                title_text = Text()
-                title_text.append(prefix)
-                title_start = len(title_text)
-                title_text.append(node.title)
-                title_end = len(title_text)
-                if lock:
-                    title_text.append(lock)
-                # Highlight overdue TODO nodes in red bold
-                if (
-                    node.status == Status.TODO
-                    and node.start is not None
-                    and node.start <= date.today()
-                ):
-                    title_text.stylize(f"{theme.OVERDUE_TITLE} bold", title_start, title_end)
-                row.append(title_text)
-            elif col_id == "status":
-                color = theme.STATUS_COLORS.get(node.status, theme.STATUS_COLORS[Status.TODO])
-                text = Text(f"{node.status_icon} {node.status.value}")
-                text.stylize(color)
-                row.append(text)
-            elif col_id == "assignee":
-                row.append(node.assignee)
-            elif col_id == "priority":
-                from tui_wbs.models import Priority
-                color = theme.PRIORITY_COLORS.get(node.priority, theme.PRIORITY_COLORS[Priority.MEDIUM])
-                text = Text(f"{node.priority_icon} {node.priority.value}")
-                text.stylize(color)
-                row.append(text)
-            elif col_id == "duration":
-                row.append(node.duration)
-            elif col_id == "start":
-                row.append(format_date(node.start, self._date_format))
-            elif col_id == "end":
-                row.append(format_date(node.end, self._date_format))
-            elif col_id == "progress":
-                row.append(_make_progress_cell(node.progress))
-            elif col_id == "depends":
-                row.append(node.depends)
-            elif col_id == "milestone":
-                row.append(MILESTONE_ICON if node.milestone else "")
-            elif col_id == "memo":
-                row.append(node.memo.replace("\n", " ")[:40])
-            elif col_id == "file":
-                row.append(node.source_file)
-            elif col_id == "label":
-                raw = node.custom_fields.get("label", "")
-                if raw.strip():
-                    tags = [t.strip() for t in raw.split(",") if t.strip()]
-                    label_text = Text()
-                    for i, tag in enumerate(tags):
-                        if i > 0:
-                            label_text.append(" ")
-                        start = len(label_text)
-                        label_text.append(f"[{tag}]")
-                        label_text.stylize("dim", start, start + 1)
-                        label_text.stylize("bold", start + 1, start + 1 + len(tag))
-                        label_text.stylize("dim", start + 1 + len(tag), start + 2 + len(tag))
-                    row.append(label_text)
-                else:
-                    row.append("")
-            else:
-                row.append(node.custom_fields.get(col_id, ""))
-
+        columns = tuple(self._view_config.columns)
+        key = (node.id, depth, hier_id, node.id in self._collapsed, columns)
+        cached = self._row_cache.get(key)
+        if cached is not None and cached[0] is node:
+            return cached[1]
+        row = self._build_row(node, depth, hier_id, columns)
+        self._row_cache[key] = (node, row)
         return row
 
+    def _build_row(self, node: WBSNode, depth: int, hier_id: str, columns: Sequence[str]) -> list[str]:
+        return [render(self, node, depth, hier_id) for render in _row_renderers(tuple(columns))]
+
     def on_data_table_cell_selected(self, event: DataTable.CellSelected) -> None:
         if event.coordinate is not None:
             row_key = event.cell_key.row_key
@@ -328,9 +383,62 @@ class WBSTable(Container):
             self._collapsed.discard(node_id)
         else:
             self._collapsed.add(node_id)
-        self._rebuild_table()
+        self._tree_version += 1
+        if not self._patch_rows(node_id):
+            self._rebuild_table()
+
+    def _patch_rows(self, toggled_id: str) -> bool:
+        """Apply a collapse/expand by removing or adding only the affected rows.
+
+        Columns, hierarchical ids and depths of the other rows are unchanged by
+        a toggle; only the toggled row's fold icon needs refreshing. Returns
+        False when the table can't be patched and needs a full rebuild.
+        """
+        try:
+            table = self.query_one("#wbs-data-table", SyncedDataTable)
+        except Exception:
+            return False
+        if table.row_count != len(self._flat_rows):
+            return False
+        if self._refresh_today():
+            return False
+
+        saved_node_id = self.highlighted_node_id
+        old_ids = {node.id for node, _, _ in self._flat_rows}
+        new_rows = self._flatten_rows()
+        new_ids = {node.id for node, _, _ in new_rows}
+
+        lock_states = self._lock_states
+        unchecked = [node for node, _, _ in new_rows if node.id not in lock_states]
+        if unchecked:
+            lock_states.update(compute_lock_states(unchecked, self._title_map))
+
+        columns = self._view_config.columns
+        title_idx = columns.index("title") if "title" in columns else -1
+        table.remove_rows(old_ids - new_ids)
+        added = False
+        for node, depth, hier_id in new_rows:
+            if node.id not in old_ids:
+                table.add_row(*self._make_row(node, depth, hier_id), key=node.id)
+                added = True
+            elif node.id == toggled_id and title_idx >= 0:
+                row = self._make_row(node, depth, hier_id)
+                table.update_cell(node.id, "title", row[title_idx])
+        if added:
+            table.reorder_rows([node.id for node, _, _ in new_rows])
+        self._set_flat_rows(new_rows)
+
+        row_idx = self.row_index(saved_node_id) if saved_node_id else None
+        if row_idx is not None and table.cursor_row != row_idx:
+            table.move_cursor(row=row_idx, animate=False)
+
+        self.post_message(self.RowsChanged(list(self._flat_rows)))
+        return True
 
     def update_data(self, nodes: list[WBSNode], view_config: ViewConfig | None = None, title_map: dict[str, WBSNode] | None = None, date_format: str | None = None) -> None:
+        if roots_changed(nodes, self._roots_seen):
+            self._tree_version += 1
+            self._roots_seen = tuple(nodes)
         self._wbs_nodes = nodes
         if view_config:
             self._view_config = view_config
@@ -338,6 +446,8 @@ class WBSTable(Container):
             self._title_map = title_map
         if date_format is not None:
             self._date_format = date_format
+        self._row_cache.clear()
+        self._lock_states.clear()
         self._rebuild_table()
 
     def collapse_all(self) -> None:
@@ -345,11 +455,13 @@ class WBSTable(Container):
         for node, _, _ in self._flat_rows:
             if node.children:
                 self._collapsed.add(node.id)
+        self._tree_version += 1
         self._rebuild_table()
 
     def expand_all(self) -> None:
         """Expand all collapsed nodes."""
         self._collapsed.clear()
+        self._tree_version += 1
         self._rebuild_table()
 
     @property
@@ -374,3 +486,117 @@ class WBSTable(Container):
         if col_idx is not None and 0 <= col_idx < len(columns):
             return columns[col_idx]
         return None
+
+
+# ── Cell renderers ──
+# One function per built-in column: (table, node, depth, hier_id) -> cell.
+# Columns without a renderer fall back to the node's custom field.
+
+
+def _cell_id(table: WBSTable, node: WBSNode, depth: int, hier_id: str) -> str:
+    return hier_id
+
+
+def _cell_title(table: WBSTable, node: WBSNode, depth: int, hier_id: str) -> Text:
+    indent = "  " * depth
+    if node.children:
+        fold_icon = "▶ " if node.id in table._collapsed else "▼ "
+    else:
+        fold_icon = "  "
+    icon = node.display_icon
+    locked = table._lock_states.get(node.id)
+    if locked is None:
+        locked = bool(node.depends_list) and has_incomplete_dependencies(node, table._title_map)
+    # Highlight overdue TODO nodes in red bold
+    overdue = (
+        node.status is Status.TODO
+        and node.start is not None
+        and node.start <= table._today
+    )
+    title_text = Text(f"{indent}{fold_icon}{icon} ")
+    title_text.append(node.title, _overdue_style(theme.OVERDUE_TITLE) if overdue else None)
+    if locked:
+        title_text.append(f" {LOCK_ICON}")
+    return title_text
+
+
+@lru_cache(maxsize=16)
+def _overdue_style(color: str) -> Style:
+    # Parsed once per theme color rather than for every overdue row.
+    return Style.parse(f"{color} bold")
+
+
+@lru_cache(maxsize=64)
+def _status_text(status: Status, color: str) -> Text:
+    # Shared across rows; keyed on the color so a theme reload restyles it.
+    text = Text(f"{STATUS_ICONS[status]} {status.value}")
+    text.stylize(color)
+    return text
+
+
+@lru_cache(maxsize=64)
+def _priority_text(priority: Priority, color: str) -> Text:
+    text = Text(f"{PRIORITY_ICONS[priority]} {priority.value}")
+    text.stylize(color)
+    return text
+
+
+def _cell_status(table: WBSTable, node: WBSNode, depth: int, hier_id: str) -> Text:
+    color = theme.STATUS_COLORS.get(node.status, theme.STATUS_COLORS[Status.TODO])
+    return _status_text(node.status, color)
+
+
+def _cell_priority(table: WBSTable, node: WBSNode, depth: int, hier_id: str) -> Text:
+    color = theme.PRIORITY_COLORS.get(node.priority, theme.PRIORITY_COLORS[Priority.MEDIUM])
+    return _priority_text(node.priority, color)
+
+
+def _cell_label(table: WBSTable, node: WBSNode, depth: int, hier_id: str) -> Text | str:
+    raw = node.custom_fields.get("label", "")
+    if not raw.strip():
+        return ""
+    return _label_text(raw)
+
+
+@lru_cache(maxsize=256)
+def _label_text(raw: str) -> Text:
+    # Label sets repeat across rows, so the styled Text is shared.
+    tags = [t.strip() for t in raw.split(",") if t.strip()]
+    label_text = Text()
+    for i, tag in enumerate(tags):
+        if i > 0:
+            label_text.append(" ")
+        start = len(label_text)
+        label_text.append(f"[{tag}]")
+        label_text.stylize("dim", start, start + 1)
+        label_text.stylize("bold", start + 1, start + 1 + len(tag))
+        label_text.stylize("dim", start + 1 + len(tag), start + 2 + len(tag))
+    return label_text
+
+
+_COLUMN_RENDERERS: dict[str, Callable[[WBSTable, WBSNode, int, str], Text | str]] = {
+    "id": _cell_id,
+    "title": _cell_title,
+    "status": _cell_status,
+    "assignee": lambda table, node, depth, hier_id: node.assignee,
+    "priority": _cell_priority,
+    "duration": lambda table, node, depth, hier_id: node.duration,
+    "start": lambda table, node, depth, hier_id: format_date(node.start, table._date_format),
+    "end": lambda table, node, depth, hier_id: format_date(node.end, table._date_format),
+    "progress": lambda table, node, depth, hier_id: _make_progress_cell(node.progress),
+    "depends": lambda table, node, depth, hier_id: node.depends,
+    "milestone": lambda table, node, depth, hier_id: MILESTONE_ICON if node.milestone else "",
+    "memo": lambda table, node, depth, hier_id: node.memo.replace("\n", " ")[:40],
+    "file": lambda table, node, depth, hier_id: node.source_file,
+    "label": _cell_label,
+}
+
+
+def _custom_renderer(col_id: str) -> Callable[[WBSTable, WBSNode, int, str], Text | str]:
+    return lambda table, node, depth, hier_id: node.custom_fields.get(col_id, "")
+
+
+@lru_cache(maxsize=32)
+def _row_renderers(columns: tuple[str, ...]) -> tuple[Callable[[WBSTable, WBSNode, int, str], Text | str], ...]:
+    """Resolve each column to its renderer once per column layout, not per cell."""
+    return tuple(_COLUMN_RENDERERS.get(col_id) or _custom_renderer(col_id) for col_id in columns)
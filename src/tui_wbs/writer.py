@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import os
+import shutil
 import tempfile
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from tui_wbs.models import WBSDocument, WBSNode
+from tui_wbs.models import WBSDocument, WBSNode, WBSProject
+
+_MAX_WRITE_WORKERS = 8
+
+# Linux-only; 0 elsewhere, which disables the unnamed temp file path.
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0)
 
 
 def _build_meta_table(node: WBSNode) -> list[str]:
@@ -41,15 +51,21 @@ def _build_meta_table(node: WBSNode) -> list[str]:
     for key, value in sorted(node.custom_fields.items()):
         parts[key] = value
 
-    keys = list(parts.keys())
-    header = "| " + " | ".join(keys) + " |"
-    sep = "| " + " | ".join("---" for _ in keys) + " |"
-    values = "| " + " | ".join(parts.values()) + " |"
-    return [header, sep, values]
+    return [
+        "".join(("| ", " | ".join(parts), " |")),
+        _table_separator(len(parts)),
+        "".join(("| ", " | ".join(parts.values()), " |")),
+    ]
+
+
+@lru_cache(maxsize=64)
+def _table_separator(columns: int) -> str:
+    """Return the markdown separator row for a table with *columns* columns."""
+    return "| " + " | ".join(["---"] * columns) + " |"
 
 
-def _serialize_node(node: WBSNode, lines: list[str]) -> None:
-    """Serialize a single node and its children to lines.
+def _iter_own_lines(node: WBSNode) -> Iterator[str]:
+    """Yield the lines of a single node, excluding its children.
 
     Round-trip strategy:
     - If node is not modified (_meta_modified=False), use raw lines exactly as parsed.
@@ -57,29 +73,80 @@ def _serialize_node(node: WBSNode, lines: list[str]) -> None:
     """
     if not node._meta_modified:
         # Round-trip: output raw lines exactly as they were
-        lines.append(node._raw_heading_line)
-        for meta_line in node._raw_meta_lines:
-            lines.append(meta_line)
-        for body_line in node._raw_body_lines:
-            lines.append(body_line)
+        yield node._raw_heading_line
+        yield from node._raw_meta_lines
+        yield from node._raw_body_lines
     else:
         # Modified node: regenerate heading and metadata
         heading_prefix = "#" * node.level
-        lines.append(f"{heading_prefix} {node.title}")
-        lines.extend(_build_meta_table(node))
+        yield f"{heading_prefix} {node.title}"
+        yield from _build_meta_table(node)
 
         # Memo as body
         if node.memo:
-            lines.append("")
-            for memo_line in node.memo.split("\n"):
-                lines.append(memo_line)
-            lines.append("")
+            yield ""
+            yield from node.memo.split("\n")
+        yield ""
+
+
+def _serialize_subtree(
+    root: WBSNode,
+    previous: dict[int, tuple[WBSNode, str]],
+    current: dict[int, tuple[WBSNode, str]],
+) -> str:
+    """Return the newline-joined lines of *root* and its descendants.
+
+    Edits replace only the nodes on the path to the change, so every subtree
+    still held by *previous* is reused as-is; only changed nodes are
+    re-serialized. Every subtree visited is recorded in *current*. Walks
+    with an explicit stack (post-order), so nesting depth is not bounded by
+    the recursion limit.
+    """
+    stack: list[tuple[WBSNode, bool]] = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        key = id(node)
+        if not children_done:
+            cached = previous.get(key)
+            if cached is not None and cached[0] is node:
+                current[key] = cached
+                continue
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children)
         else:
-            lines.append("")
+            parts = list(_iter_own_lines(node))
+            parts.extend(current[id(child)][1] for child in node.children)
+            current[key] = (node, "\n".join(parts))
+    return current[id(root)][1]
+
 
-    # Recurse into children
-    for child in node.children:
-        _serialize_node(child, lines)
+def iter_serialize_document(doc: WBSDocument) -> Iterator[str]:
+    """Yield a WBSDocument's markdown as text chunks, in output order.
+
+    Concatenating the chunks gives exactly ``serialize_document(doc)``, so
+    callers can stream a document to disk without joining it into one
+    string. Subtrees unchanged since the previous call are served from the
+    document's cache, so repeated saves only re-serialize edited nodes.
+    """
+    if not doc.modified:
+        yield doc.raw_content
+        return
+
+    previous = doc._subtree_text
+    current: dict[int, tuple[WBSNode, str]] = {}
+    last = ""
+    for i, root in enumerate(doc.root_nodes):
+        if i:
+            yield "\n"
+        last = _serialize_subtree(root, previous, current)
+        yield last
+    # Drop entries for nodes no longer in the tree
+    doc._subtree_text = current
+
+    # Preserve trailing newline if original had one
+    ends_with_newline = last.endswith("\n") or (len(doc.root_nodes) > 1 and not last)
+    if doc.raw_content.endswith("\n") and not ends_with_newline:
+        yield "\n"
 
 
 def serialize_document(doc: WBSDocument) -> str:
@@ -90,44 +157,75 @@ def serialize_document(doc: WBSDocument) -> str:
     """
     if not doc.modified:
         return doc.raw_content
+    return "".join(iter_serialize_document(doc))
 
-    lines: list[str] = []
-    for root in doc.root_nodes:
-        _serialize_node(root, lines)
 
-    # Join with newline, preserve trailing newline if original had one
-    result = "\n".join(lines)
-    if doc.raw_content.endswith("\n") and not result.endswith("\n"):
-        result += "\n"
-    return result
+def _backup_file(target: Path, bak_path: Path) -> None:
+    """Snapshot *target* as *bak_path* without decoding it.
 
+    A hard link is enough because the write below swaps in a new inode via
+    ``os.replace``, leaving the backup pointing at the old contents. Falls back
+    to a raw byte copy where links are unsupported. The snapshot is made under
+    a temporary name and renamed over *bak_path*, so the previous backup
+    survives if both fail.
+    """
+    tmp_path = bak_path.parent / f".tui-wbs-{uuid.uuid4().hex}.bak"
+    try:
+        try:
+            os.link(target, tmp_path)
+        except OSError:
+            shutil.copyfile(target, tmp_path)
+        os.replace(tmp_path, bak_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-def write_document(doc: WBSDocument, backup: bool = True) -> None:
-    """Write a WBSDocument to its file path with backup and atomic write.
 
-    1. Create .bak backup of current file (if it exists)
-    2. Write to a temp file in the same directory
-    3. Atomic rename (os.replace) temp -> target
+def _write_via_unnamed_file(doc: WBSDocument, target: Path) -> bool:
+    """Write *doc* through an unnamed O_TMPFILE inode, then swap it in.
+
+    The file only gets a (hidden) name once fully written, so a partial temp
+    file is never visible and a crash leaves nothing behind. Returns False
+    before touching the directory if the platform or filesystem lacks
+    O_TMPFILE support, so the caller can fall back to a named temp file.
     """
-    target = doc.file_path
-    content = serialize_document(doc)
+    global _O_TMPFILE
+    if not _O_TMPFILE:
+        return False
+    target_dir = target.parent
+    try:
+        fd = os.open(target_dir, _O_TMPFILE | os.O_WRONLY, 0o600)
+    except OSError:
+        return False
+
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.writelines(iter_serialize_document(doc))
+        f.flush()
+        tmp_path = target_dir / f".tui-wbs-{uuid.uuid4().hex}.tmp"
+        try:
+            os.link(f"/proc/self/fd/{fd}", tmp_path)
+        except OSError:
+            # e.g. /proc unavailable or sandboxed; nothing was named. Linking
+            # won't start working later, so stop trying for this process.
+            _O_TMPFILE = 0
+            return False
 
-    # Backup existing file
-    if backup and target.exists():
-        bak_path = target.with_suffix(target.suffix + ".bak")
+    try:
+        os.replace(tmp_path, target)
+    except BaseException:
         try:
-            bak_path.write_text(target.read_text(encoding="utf-8"), encoding="utf-8")
+            os.unlink(tmp_path)
         except OSError:
-            pass  # Best effort backup
+            pass
+        raise
+    return True
 
-    # Atomic write: temp file → rename
-    target_dir = target.parent
-    target_dir.mkdir(parents=True, exist_ok=True)
 
-    fd, tmp_path = tempfile.mkstemp(dir=target_dir, suffix=".tmp", prefix=".tui-wbs-")
+def _write_via_temp_file(doc: WBSDocument, target: Path) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp", prefix=".tui-wbs-")
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(content)
+            f.writelines(iter_serialize_document(doc))
         os.replace(tmp_path, target)
     except BaseException:
         # Clean up temp file on failure
@@ -137,13 +235,46 @@ def write_document(doc: WBSDocument, backup: bool = True) -> None:
             pass
         raise
 
+
+def write_document(doc: WBSDocument, backup: bool = True) -> None:
+    """Write a WBSDocument to its file path with backup and atomic write.
+
+    1. Create .bak backup of current file (if it exists)
+    2. Stream the serialized document into a temp file in the same directory
+       (an unnamed O_TMPFILE inode on Linux, otherwise a named temp file)
+    3. Atomic rename (os.replace) temp -> target
+    """
+    target = doc.file_path
+
+    # Backup existing file
+    if backup and target.exists():
+        bak_path = target.with_suffix(target.suffix + ".bak")
+        try:
+            _backup_file(target, bak_path)
+        except OSError:
+            pass  # Best effort backup
+
+    # Atomic write: temp file → rename
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if not _write_via_unnamed_file(doc, target):
+        _write_via_temp_file(doc, target)
+
     doc.modified = False
 
 
-def write_project(project: "WBSProject", backup: bool = True) -> None:
-    """Write all modified documents in a project."""
-    from tui_wbs.models import WBSProject
+def write_project(project: WBSProject, backup: bool = True) -> None:
+    """Write all modified documents in a project.
 
-    for doc in project.documents:
-        if doc.modified:
+    Each document targets its own file, so multiple writes run concurrently
+    on a small thread pool; the first failure is re-raised.
+    """
+    modified_docs = [doc for doc in project.documents if doc.modified]
+    if len(modified_docs) <= 1:
+        for doc in modified_docs:
             write_document(doc, backup=backup)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(modified_docs))) as pool:
+        futures = [pool.submit(write_document, doc, backup) for doc in modified_docs]
+    for future in futures:
+        future.result()
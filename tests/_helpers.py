@@ -0,0 +1,36 @@
+"""Helpers shared by the pilot-driven test modules."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from tui_wbs.app import WBSApp
+
+TIMEOUT = 5.0
+
+
+async def wait_for(pilot, predicate, timeout: float = TIMEOUT) -> None:
+    """Tick the event loop until *predicate* holds instead of sleeping blindly."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "timed out waiting for app state"
+        await pilot.pause()
+
+
+def loaded(app) -> bool:
+    """True once the project has finished loading (views are set up)."""
+    return app.project is not None and bool(app._active_view_id)
+
+
+def load_app(project_dir: Path) -> WBSApp:
+    """Load *project_dir* into a WBSApp synchronously, without a Textual driver.
+
+    For tests that only call app helpers and read state back. Autosave is
+    disabled because timers need a running event loop.
+    """
+    app = WBSApp(project_dir=project_dir)
+    app._schedule_autosave = lambda: None
+    app._load_project()
+    return app
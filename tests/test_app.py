@@ -4,10 +4,13 @@ from pathlib import Path
 
 import pytest
 
+from tests._helpers import load_app, loaded, wait_for
 from tui_wbs.app import WBSApp
 
 
-PAUSE = 0.1
+def _confirm_screen(app):
+    from tui_wbs.screens.confirm_screen import ConfirmScreen
+    return next((s for s in app.screen_stack if isinstance(s, ConfirmScreen)), None)
 
 
 @pytest.fixture
@@ -59,8 +62,8 @@ def named_project(tmp_path):
 @pytest.mark.asyncio
 async def test_app_starts(sample_project):
     app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
         assert app.project is not None
         assert len(app.project.documents) == 1
 
@@ -68,16 +71,16 @@ async def test_app_starts(sample_project):
 @pytest.mark.asyncio
 async def test_app_title_from_config(named_project):
     app = WBSApp(project_dir=named_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
         assert "My Project" in app.title
 
 
 @pytest.mark.asyncio
 async def test_app_help_modal(sample_project):
     app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
         app.action_help()
         from tui_wbs.screens.help_screen import HelpScreen
         assert any(isinstance(s, HelpScreen) for s in app.screen_stack)
@@ -86,8 +89,8 @@ async def test_app_help_modal(sample_project):
 @pytest.mark.asyncio
 async def test_app_warning_modal(sample_project):
     app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
         app.action_warnings()
         from tui_wbs.screens.warning_screen import WarningScreen
         assert any(isinstance(s, WarningScreen) for s in app.screen_stack)
@@ -96,17 +99,10 @@ async def test_app_warning_modal(sample_project):
 @pytest.mark.asyncio
 async def test_app_empty_project_confirm_yes(tmp_path):
     app = WBSApp(project_dir=tmp_path)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        from tui_wbs.screens.confirm_screen import ConfirmScreen
-        confirm = None
-        for s in app.screen_stack:
-            if isinstance(s, ConfirmScreen):
-                confirm = s
-                break
-        assert confirm is not None
-        confirm.dismiss(True)
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: _confirm_screen(app) is not None)
+        _confirm_screen(app).dismiss(True)
+        await wait_for(pilot, lambda: loaded(app))
         assert (tmp_path / "project.wbs.md").exists()
         assert app.project is not None
         assert len(app.project.documents) == 1
@@ -115,14 +111,10 @@ async def test_app_empty_project_confirm_yes(tmp_path):
 @pytest.mark.asyncio
 async def test_app_empty_project_confirm_no(tmp_path):
     app = WBSApp(project_dir=tmp_path)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        from tui_wbs.screens.confirm_screen import ConfirmScreen
-        for s in app.screen_stack:
-            if isinstance(s, ConfirmScreen):
-                s.dismiss(False)
-                break
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: _confirm_screen(app) is not None)
+        _confirm_screen(app).dismiss(False)
+        await wait_for(pilot, lambda: loaded(app))
         assert not (tmp_path / "project.wbs.md").exists()
         assert app.project is not None
         assert len(app.project.documents) == 0
@@ -131,54 +123,46 @@ async def test_app_empty_project_confirm_no(tmp_path):
 @pytest.mark.asyncio
 async def test_app_save(sample_project):
     app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
         app.action_save()
         config_path = sample_project / ".tui-wbs" / "config.toml"
         assert config_path.exists()
         assert app._modified is False
 
 
-@pytest.mark.asyncio
-async def test_app_node_update(sample_project):
+def test_app_node_update(sample_project):
     """Test node update via _update_node."""
     from tui_wbs.models import Status
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        first_node = app.project.all_nodes()[0]
-        app._update_node(first_node.id, status=Status.DONE)
-        updated = app._node_map.get(first_node.id)
-        assert updated is not None
-        assert updated.status == Status.DONE
-        assert app._modified is True
+    app = load_app(sample_project)
+    assert loaded(app)
+    first_node = app.project.all_nodes()[0]
+    app._update_node(first_node.id, status=Status.DONE)
+    updated = app._node_map.get(first_node.id)
+    assert updated is not None
+    assert updated.status == Status.DONE
+    assert app._modified is True
 
 
-@pytest.mark.asyncio
-async def test_app_undo_redo(sample_project):
+def test_app_undo_redo(sample_project):
     """Test undo/redo functionality."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        nodes_before = len(app.project.all_nodes())
-        # Add a child node
-        first_node = app.project.all_nodes()[0]
-        app._update_node(first_node.id, status=app.project.all_nodes()[0].status)
-        assert len(app._undo_stack) >= 1
-        # Undo
-        app.action_undo()
-        assert len(app._redo_stack) >= 1
+    from tui_wbs.models import Status
+    app = load_app(sample_project)
+    assert app.project is not None
+    first_node = app.project.all_nodes()[0]
+    app._update_node(first_node.id, status=Status.DONE)
+    assert len(app._undo_stack) >= 1
+    # Undo
+    app.action_undo()
+    assert len(app._redo_stack) >= 1
 
 
 @pytest.mark.asyncio
 async def test_app_quit_unsaved(sample_project):
     """Test quit with unsaved changes shows confirmation."""
     app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
         app._modified = True
         app.action_quit_app()
-        from tui_wbs.screens.confirm_screen import ConfirmScreen
-        assert any(isinstance(s, ConfirmScreen) for s in app.screen_stack)
+        assert _confirm_screen(app) is not None
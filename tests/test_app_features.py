@@ -1,12 +1,22 @@
 """Integration tests for Phase 2-4 app features."""
 
+import asyncio
+import copy
+import os
+import shutil
 from dataclasses import replace
+from datetime import date
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
+from textual import events
+from textual.widgets import DataTable, Input, OptionList, Static
 
+from tests._helpers import load_app, loaded, wait_for
 from tui_wbs.app import WBSApp
 from tui_wbs.models import (
+    ColumnDef,
     FilterConfig,
     Priority,
     ProjectConfig,
@@ -15,347 +25,439 @@ from tui_wbs.models import (
     ViewConfig,
     WBSNode,
 )
+from tui_wbs.widgets.filter_bar import FilterBar
+from tui_wbs.widgets.settings_modal import SettingsModal
+from tui_wbs.widgets.view_tabs import ViewTabs
+from tui_wbs.widgets.wbs_table import SyncedDataTable, WBSTable
+
+
+_SAMPLE_MD = (
+    "# My Project\n"
+    "| status | assignee | priority |\n"
+    "| --- | --- | --- |\n"
+    "| IN_PROGRESS | Gihwan | HIGH |\n"
+    "\n"
+    "## Phase 1\n"
+    "| status | assignee |\n"
+    "| --- | --- |\n"
+    "| TODO | Jane |\n"
+    "\n"
+    "### Task 1.1\n"
+    "| status | assignee | duration |\n"
+    "| --- | --- | --- |\n"
+    "| DONE | Jane | 2d |\n"
+    "\n"
+    "### Task 1.2\n"
+    "| status | assignee | depends |\n"
+    "| --- | --- | --- |\n"
+    "| IN_PROGRESS | John | Task 1.1 |\n"
+).encode("utf-8")
+
+_MINI_MD = (
+    "# Test\n"
+    "| status |\n"
+    "| --- |\n"
+    "| TODO |\n"
+).encode("utf-8")
+
+
+def _settings_open(app) -> bool:
+    """True once the SettingsModal is on screen with its lists composed."""
+    return isinstance(app.screen, SettingsModal) and bool(app.screen.query("#col-list"))
+
+
+@pytest.fixture(scope="session")
+def _mini_project_template(tmp_path_factory):
+    """Write the one-node project once per session."""
+    template = tmp_path_factory.mktemp("mini")
+    (template / "project.wbs.md").write_bytes(_MINI_MD)
+    return template
 
 
-PAUSE = 0.1
+@pytest.fixture
+def mini_project(tmp_path, _mini_project_template):
+    """A one-node project directory, hard-linked from the session template."""
+    project_dir = tmp_path / "mini"
+    shutil.copytree(_mini_project_template, project_dir, copy_function=os.link)
+    return project_dir
+
+
+@pytest.fixture(scope="session")
+def _sample_project_template(tmp_path_factory):
+    """Write the sample project once per session; tests get their own copy."""
+    template = tmp_path_factory.mktemp("wbs_tpl")
+    (template / "project.wbs.md").write_bytes(_SAMPLE_MD)
+    return template
 
 
 @pytest.fixture
-def sample_project(tmp_path):
+def sample_project(tmp_path, _sample_project_template):
     """Create a sample project directory with WBS files."""
-    (tmp_path / "project.wbs.md").write_text(
-        "# My Project\n"
-        "| status | assignee | priority |\n"
-        "| --- | --- | --- |\n"
-        "| IN_PROGRESS | Gihwan | HIGH |\n"
-        "\n"
-        "## Phase 1\n"
-        "| status | assignee |\n"
-        "| --- | --- |\n"
-        "| TODO | Jane |\n"
-        "\n"
-        "### Task 1.1\n"
-        "| status | assignee | duration |\n"
-        "| --- | --- | --- |\n"
-        "| DONE | Jane | 2d |\n"
-        "\n"
-        "### Task 1.2\n"
-        "| status | assignee | depends |\n"
-        "| --- | --- | --- |\n"
-        "| IN_PROGRESS | John | Task 1.1 |\n",
-        encoding="utf-8",
-    )
-    return tmp_path
+    project_dir = tmp_path / "proj"
+    shutil.copytree(_sample_project_template, project_dir)
+    return project_dir
 
 
-# ── Node CRUD Tests ──
+@pytest.fixture
+def bare_app(sample_project):
+    """The sample project loaded into a WBSApp without booting a pilot."""
+    return load_app(sample_project)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _shared_app(_sample_project_template, tmp_path_factory):
+    """One running WBSApp per module, plus a snapshot of its loaded state."""
+    project_dir = tmp_path_factory.mktemp("shared") / "proj"
+    shutil.copytree(_sample_project_template, project_dir)
+    app = WBSApp(project_dir=project_dir)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
+        snapshot = copy.deepcopy((app.project, app.config))
+        yield app, pilot, snapshot
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def shared_pilot(_shared_app):
+    """Borrow the module's running app, reset to the freshly loaded state.
+
+    For pilot tests that only switch views, move focus or apply filters, so
+    they skip booting their own Textual app. Resets the project, config,
+    undo/redo, search, displayed-roots cache, and the table's collapsed rows,
+    cursor and scroll. Widgets of other views (Kanban selection, Gantt
+    scroll) keep whatever state the previous borrower left.
+    """
+    app, pilot, snapshot = _shared_app
+    while len(app.screen_stack) > 1:
+        app.pop_screen()
+    if app._autosave_timer is not None:
+        app._autosave_timer.stop()
+        app._autosave_timer = None
+    app.project, app.config = copy.deepcopy(snapshot)
+    app._active_view_id = app.config.views[0].id
+    app._undo_stack.clear()
+    app._redo_stack.clear()
+    app._modified = False
+    app._kanban_selected_id = ""
+    app._displayed_roots = []
+    app._displayed_source = ()
+    app._displayed_key = None
+    app._rebuild_node_map()
+    app._perform_search("")
+    app.query_one("#search-bar", Input).display = False
+    app._refresh_ui()
+    table = app.query_one(WBSTable)
+    table.expand_all()
+    data_table = table.query_one("#wbs-data-table", SyncedDataTable)
+    data_table.move_cursor(row=0, column=0, scroll=False)
+    data_table.scroll_home(animate=False)
+    app.screen.set_focus(None)
+    await pilot.pause()
+    return app, pilot
 
 
-@pytest.mark.asyncio
-async def test_add_child_node(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        count_before = len(app.project.all_nodes())
-        first_node = app.project.all_nodes()[0]
-        # Add a child node
-        app._add_node_to_parent(
-            first_node.id,
-            WBSNode(
-                title="New Child",
-                level=first_node.level + 1,
-                source_file=first_node.source_file,
-                _meta_modified=True,
-            ),
-        )
-        count_after = len(app.project.all_nodes())
-        assert count_after == count_before + 1
-        assert app._modified is True
-        # Verify the new node exists
-        new_node = app.project.find_node_by_title("New Child")
-        assert new_node is not None
-        assert new_node.level == first_node.level + 1
+# ── Node CRUD Tests ──
 
 
-@pytest.mark.asyncio
-async def test_add_sibling_node(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        count_before = len(app.project.all_nodes())
-        # Get Task 1.1 and add a sibling
-        task11 = app.project.find_node_by_title("Task 1.1")
-        assert task11 is not None
-        app._add_sibling_node(
-            task11.id,
-            WBSNode(
-                title="Task 1.1b",
-                level=task11.level,
-                source_file=task11.source_file,
-                _meta_modified=True,
-            ),
-        )
-        count_after = len(app.project.all_nodes())
-        assert count_after == count_before + 1
+def test_add_child_node(bare_app):
+    app = bare_app
+    assert app.project is not None
+    count_before = len(app.project.all_nodes())
+    first_node = app.project.all_nodes()[0]
+    # Add a child node
+    app._add_node_to_parent(
+        first_node.id,
+        WBSNode(
+            title="New Child",
+            level=first_node.level + 1,
+            source_file=first_node.source_file,
+            _meta_modified=True,
+        ),
+    )
+    count_after = len(app.project.all_nodes())
+    assert count_after == count_before + 1
+    assert app._modified is True
+    # Verify the new node exists
+    new_node = app.project.find_node_by_title("New Child")
+    assert new_node is not None
+    assert new_node.level == first_node.level + 1
+
+
+def test_add_sibling_node(bare_app):
+    app = bare_app
+    assert app.project is not None
+    count_before = len(app.project.all_nodes())
+    # Get Task 1.1 and add a sibling
+    task11 = app.project.find_node_by_title("Task 1.1")
+    assert task11 is not None
+    app._add_sibling_node(
+        task11.id,
+        WBSNode(
+            title="Task 1.1b",
+            level=task11.level,
+            source_file=task11.source_file,
+            _meta_modified=True,
+        ),
+    )
+    count_after = len(app.project.all_nodes())
+    assert count_after == count_before + 1
 
 
-@pytest.mark.asyncio
-async def test_delete_node(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        count_before = len(app.project.all_nodes())
-        task12 = app.project.find_node_by_title("Task 1.2")
-        assert task12 is not None
-        app._delete_node_by_id(task12.id)
-        count_after = len(app.project.all_nodes())
-        assert count_after == count_before - 1
-        assert app.project.find_node_by_title("Task 1.2") is None
+def test_delete_node(bare_app):
+    app = bare_app
+    assert app.project is not None
+    count_before = len(app.project.all_nodes())
+    task12 = app.project.find_node_by_title("Task 1.2")
+    assert task12 is not None
+    app._delete_node_by_id(task12.id)
+    count_after = len(app.project.all_nodes())
+    assert count_after == count_before - 1
+    assert app.project.find_node_by_title("Task 1.2") is None
 
 
-@pytest.mark.asyncio
-async def test_delete_node_with_children(sample_project):
+def test_delete_node_with_children(bare_app):
     """Deleting a parent should remove all children."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        phase1 = app.project.find_node_by_title("Phase 1")
-        assert phase1 is not None
-        child_count = len(phase1.all_nodes())  # includes phase1 itself
-        count_before = len(app.project.all_nodes())
-        app._delete_node_by_id(phase1.id)
-        count_after = len(app.project.all_nodes())
-        assert count_after == count_before - child_count
+    app = bare_app
+    assert app.project is not None
+    phase1 = app.project.find_node_by_title("Phase 1")
+    assert phase1 is not None
+    child_count = len(phase1.all_nodes())  # includes phase1 itself
+    count_before = len(app.project.all_nodes())
+    app._delete_node_by_id(phase1.id)
+    count_after = len(app.project.all_nodes())
+    assert count_after == count_before - child_count
 
 
 # ── Status Change Tests ──
 
 
-@pytest.mark.asyncio
-async def test_status_change(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Task 1.1")
-        assert task is not None
-        assert task.status == Status.DONE
-        app._update_node(task.id, status=Status.TODO)
-        updated = app._node_map.get(task.id)
-        assert updated is not None
-        assert updated.status == Status.TODO
+def test_status_change(bare_app):
+    app = bare_app
+    assert app.project is not None
+    task = app.project.find_node_by_title("Task 1.1")
+    assert task is not None
+    assert task.status == Status.DONE
+    app._update_node(task.id, status=Status.TODO)
+    updated = app._node_map.get(task.id)
+    assert updated is not None
+    assert updated.status == Status.TODO
 
 
 # ── Depends Auto-Update Tests ──
 
 
-@pytest.mark.asyncio
-async def test_depends_auto_update_on_rename(sample_project):
+def test_depends_auto_update_on_rename(bare_app):
     """Renaming a node should update depends references."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        # Task 1.2 depends on "Task 1.1"
-        task11 = app.project.find_node_by_title("Task 1.1")
-        assert task11 is not None
-        task12 = app.project.find_node_by_title("Task 1.2")
-        assert task12 is not None
-        assert "Task 1.1" in task12.depends
+    app = bare_app
+    assert app.project is not None
+    # Task 1.2 depends on "Task 1.1"
+    task11 = app.project.find_node_by_title("Task 1.1")
+    assert task11 is not None
+    task12 = app.project.find_node_by_title("Task 1.2")
+    assert task12 is not None
+    assert "Task 1.1" in task12.depends
 
-        # Simulate title edit + depends update
-        app._on_title_edited(task11.id, "Requirements Done")
+    # Simulate title edit + depends update
+    app._on_title_edited(task11.id, "Requirements Done")
 
-        # Verify Task 1.2's depends was updated
-        updated_12 = app._node_map.get(task12.id)
-        assert updated_12 is not None
-        assert "Requirements Done" in updated_12.depends
-        assert "Task 1.1" not in updated_12.depends
+    # Verify Task 1.2's depends was updated
+    updated_12 = app._node_map.get(task12.id)
+    assert updated_12 is not None
+    assert "Requirements Done" in updated_12.depends
+    assert "Task 1.1" not in updated_12.depends
 
 
 # ── Search Tests ──
 
 
-@pytest.mark.asyncio
-async def test_search_finds_matches(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        app._perform_search("Jane")
-        assert len(app._search_matches) == 2  # Phase 1 + Task 1.1
-        assert app._search_index == 0
+def test_search_finds_matches(bare_app):
+    app = bare_app
+    app._perform_search("Jane")
+    assert len(app._search_matches) == 2  # Phase 1 + Task 1.1
+    assert app._search_index == 0
 
 
-@pytest.mark.asyncio
-async def test_search_no_matches(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        app._perform_search("Nonexistent")
-        assert len(app._search_matches) == 0
-        assert app._search_index == -1
+def test_search_no_matches(bare_app):
+    app = bare_app
+    app._perform_search("Nonexistent")
+    assert len(app._search_matches) == 0
+    assert app._search_index == -1
 
 
-@pytest.mark.asyncio
-async def test_search_next_prev(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        app._perform_search("Task")
-        assert len(app._search_matches) == 2
-        assert app._search_index == 0
-        app.action_search_next()
-        assert app._search_index == 1
-        app.action_search_next()
-        assert app._search_index == 0  # Wraps around
-        app.action_search_prev()
-        assert app._search_index == 1  # Wraps backward
+def test_search_next_prev(bare_app):
+    app = bare_app
+    app._perform_search("Task")
+    assert len(app._search_matches) == 2
+    assert app._search_index == 0
+    app.action_search_next()
+    assert app._search_index == 1
+    app.action_search_next()
+    assert app._search_index == 0  # Wraps around
+    app.action_search_prev()
+    assert app._search_index == 1  # Wraps backward
 
 
 # ── Node Movement Tests ──
 
 
-@pytest.mark.asyncio
-async def test_move_node_down(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        phase1 = app.project.find_node_by_title("Phase 1")
-        assert phase1 is not None
-        # Phase 1 has children: Task 1.1, Task 1.2
-        first_child_title = phase1.children[0].title
-        assert first_child_title == "Task 1.1"
+def test_move_node_down(bare_app):
+    app = bare_app
+    assert app.project is not None
+    phase1 = app.project.find_node_by_title("Phase 1")
+    assert phase1 is not None
+    # Phase 1 has children: Task 1.1, Task 1.2
+    first_child_title = phase1.children[0].title
+    assert first_child_title == "Task 1.1"
 
-        # Move Task 1.1 down
-        app._move_node_in_siblings(phase1.children[0].id, 1)
+    # Move Task 1.1 down
+    app._move_node_in_siblings(phase1.children[0].id, 1)
 
-        # Re-fetch phase1 from project
-        phase1_updated = app.project.find_node_by_title("Phase 1")
-        assert phase1_updated is not None
-        # Now Task 1.2 should be first
-        assert phase1_updated.children[0].title == "Task 1.2"
-        assert phase1_updated.children[1].title == "Task 1.1"
+    # Re-fetch phase1 from project
+    phase1_updated = app.project.find_node_by_title("Phase 1")
+    assert phase1_updated is not None
+    # Now Task 1.2 should be first
+    assert phase1_updated.children[0].title == "Task 1.2"
+    assert phase1_updated.children[1].title == "Task 1.1"
 
 
-@pytest.mark.asyncio
-async def test_change_node_level(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task11 = app.project.find_node_by_title("Task 1.1")
-        assert task11 is not None
-        original_level = task11.level
-        app._change_node_level(task11.id, 1)  # Indent
-        updated = app._node_map.get(task11.id)
-        assert updated is not None
-        assert updated.level == original_level + 1
+def test_change_node_level(bare_app):
+    app = bare_app
+    assert app.project is not None
+    task11 = app.project.find_node_by_title("Task 1.1")
+    assert task11 is not None
+    original_level = task11.level
+    app._change_node_level(task11.id, 1)  # Indent
+    updated = app._node_map.get(task11.id)
+    assert updated is not None
+    assert updated.level == original_level + 1
 
 
-@pytest.mark.asyncio
-async def test_change_node_level_min_one(sample_project):
+def test_change_node_level_min_one(bare_app):
     """Level should not go below 1."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        root = app.project.all_nodes()[0]
-        assert root.level == 1
-        app._change_node_level(root.id, -1)  # Try to go below 1
-        updated = app._node_map.get(root.id)
-        assert updated is not None
-        assert updated.level == 1  # Should remain 1
+    app = bare_app
+    assert app.project is not None
+    root = app.project.all_nodes()[0]
+    assert root.level == 1
+    app._change_node_level(root.id, -1)  # Try to go below 1
+    updated = app._node_map.get(root.id)
+    assert updated is not None
+    assert updated.level == 1  # Should remain 1
 
 
 # ── View Management Tests ──
 
 
-@pytest.mark.asyncio
-async def test_create_new_view(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        views_before = len(app.config.views)
-        app._on_new_view_name("My Kanban")
-        assert len(app.config.views) == views_before + 1
-        assert app.config.views[-1].name == "My Kanban"
-        assert app._modified is True
+def test_create_new_view(bare_app):
+    app = bare_app
+    views_before = len(app.config.views)
+    app._on_new_view_name("My Kanban")
+    assert len(app.config.views) == views_before + 1
+    assert app.config.views[-1].name == "My Kanban"
+    assert app._modified is True
 
 
-@pytest.mark.asyncio
-async def test_create_view_empty_name_ignored(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        views_before = len(app.config.views)
-        app._on_new_view_name("")
-        assert len(app.config.views) == views_before
-        app._on_new_view_name(None)
-        assert len(app.config.views) == views_before
+def test_create_view_empty_name_ignored(bare_app):
+    app = bare_app
+    views_before = len(app.config.views)
+    app._on_new_view_name("")
+    assert len(app.config.views) == views_before
+    app._on_new_view_name(None)
+    assert len(app.config.views) == views_before
 
 
 # ── Settings Tests ──
 
 
-@pytest.mark.asyncio
-async def test_settings_save(sample_project):
-    from tui_wbs.models import ProjectConfig
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        new_config = ProjectConfig(name="Updated Name")
-        new_config.ensure_default_view()
-        app._on_settings_saved(new_config)
-        assert app.config.name == "Updated Name"
-        assert app._modified is True
+def test_settings_save(bare_app):
+    app = bare_app
+    new_config = ProjectConfig(name="Updated Name")
+    new_config.ensure_default_view()
+    app._on_settings_saved(new_config)
+    assert app.config.name == "Updated Name"
+    assert app._modified is True
 
 
-@pytest.mark.asyncio
-async def test_settings_cancel(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        old_name = app.config.name
-        app._on_settings_saved(None)
-        assert app.config.name == old_name
+def test_settings_cancel(bare_app):
+    app = bare_app
+    old_name = app.config.name
+    app._on_settings_saved(None)
+    assert app.config.name == old_name
 
 
 # ── Undo/Redo Extended Tests ──
 
 
-@pytest.mark.asyncio
-async def test_undo_stack_limit(sample_project):
+def test_undo_stack_limit(bare_app, monkeypatch):
     """Undo stack should be limited to 50."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        first_node = app.project.all_nodes()[0]
-        # Push 55 undo states
-        for i in range(55):
-            app._update_node(first_node.id, memo=f"memo-{i}")
-        assert len(app._undo_stack) <= 50
-
-
-@pytest.mark.asyncio
-async def test_redo_cleared_on_new_change(sample_project):
+    app = bare_app
+    # Only the undo pushes matter here; skip redrawing after each edit
+    monkeypatch.setattr(app, "_refresh_ui", lambda: None)
+    assert app.project is not None
+    first_node = app.project.all_nodes()[0]
+    # Push 55 undo states
+    for i in range(55):
+        app._update_node(first_node.id, memo=f"memo-{i}")
+    assert len(app._undo_stack) <= 50
+
+
+def test_redo_cleared_on_new_change(bare_app):
     """Making a new change should clear redo stack."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        first_node = app.project.all_nodes()[0]
-        app._update_node(first_node.id, memo="change1")
-        app.action_undo()
-        assert len(app._redo_stack) >= 1
-        # Now make a new change
-        app._update_node(first_node.id, memo="change2")
-        assert len(app._redo_stack) == 0  # Redo cleared
+    app = bare_app
+    assert app.project is not None
+    first_node = app.project.all_nodes()[0]
+    app._update_node(first_node.id, memo="change1")
+    app.action_undo()
+    assert len(app._redo_stack) >= 1
+    # Now make a new change
+    app._update_node(first_node.id, memo="change2")
+    assert len(app._redo_stack) == 0  # Redo cleared
+
+
+def test_undo_snapshot_shares_unchanged_nodes(bare_app):
+    """Undo snapshots copy document lists but share the immutable nodes."""
+    app = bare_app
+    task = app.project.find_node_by_title("Task 1.2")
+    roots_before = app.project.documents[0].root_nodes
+    app._update_node(task.id, memo="changed")
+    snapshot = app._undo_stack[-1][0]
+    assert snapshot.root_nodes is not roots_before
+    assert snapshot.root_nodes[0] is roots_before[0]
+    assert app.project.documents[0].root_nodes[0] is not roots_before[0]
+
+
+def test_update_node_copies_only_the_ancestor_path(bare_app):
+    app = bare_app
+    task = app.project.find_node_by_title("Task 1.2")
+    root = app.project.documents[0].root_nodes[0]
+    phase = app._node_map[app._parent_map[task.id]]
+    siblings = [c for c in phase.children if c.id != task.id]
+    app._update_node(task.id, memo="changed")
+
+    new_root = app.project.documents[0].root_nodes[0]
+    new_phase = app._node_map[phase.id]
+    assert new_root is not root and new_phase is not phase
+    assert new_root.children[0] is new_phase
+    new_siblings = [c for c in new_phase.children if c.id != task.id]
+    assert len(new_siblings) == len(siblings)
+    assert all(a is b for a, b in zip(new_siblings, siblings))  # shared, not copied
+    assert app._node_map[task.id].memo == "changed"
+
+
+def test_replace_in_tree_handles_deep_chains(bare_app):
+    app = bare_app
+    leaf = WBSNode(title="Leaf", level=3)
+    node = leaf
+    for i in range(3000):
+        node = WBSNode(title=f"N{i}", level=2, children=(node,))
+    app.project.documents[0].root_nodes = [node]
+    app._rebuild_node_map()
+    assert len(app._parent_map) == 3000
+
+    new_root = app._replace_in_tree(node, leaf.id, replace(leaf, memo="deep"))
+    app.project.documents[0].root_nodes = [new_root]
+    app._rebuild_node_map()
+    assert app._node_map[leaf.id].memo == "deep"
+    other = WBSNode(title="Elsewhere", level=1)
+    assert app._replace_in_tree(other, leaf.id, leaf) is other
 
 
 # ── Filter & Sort Tests ──
@@ -389,6 +491,12 @@ class TestFilterSort:
         f = FilterConfig(field="assignee", operator="contains", value="bob")
         assert WBSApp._node_matches_filter(node, f) is False
 
+    def test_lowercase_title_cached_on_node(self):
+        node = WBSNode(title="Write Docs", level=1)
+        assert WBSApp._get_node_field_value_lower(node, "title") == "write docs"
+        assert node._title_lower is node._title_lower
+        assert replace(node, title="Other")._title_lower == "other"
+
     def test_apply_filters_keeps_matching_parent(self):
         child = WBSNode(title="Child", level=2, status=Status.DONE)
         parent = WBSNode(title="Parent", level=1, status=Status.TODO, children=(child,))
@@ -427,6 +535,13 @@ class TestFilterSort:
         result = WBSApp._apply_sort([n1, n2, n3], sort)
         assert [n.priority for n in result] == [Priority.HIGH, Priority.MEDIUM, Priority.LOW]
 
+    def test_sort_key_func_uses_precomputed_ranks(self):
+        node = WBSNode(title="Task", level=1, status=Status.DONE, priority=Priority.HIGH)
+        assert WBSApp._sort_key_func("status")(node) == 2
+        assert WBSApp._sort_key_func("priority")(node) == 0
+        assert WBSApp._sort_key_func("title")(node) == "task"
+        assert WBSApp._sort_key_func("start")(node) == WBSApp._sort_key(node, "start")
+
     def test_sort_by_title_desc(self):
         n1 = WBSNode(title="Alpha", level=1)
         n2 = WBSNode(title="Charlie", level=1)
@@ -444,150 +559,179 @@ class TestFilterSort:
         assert result[0].children[0].title == "A-Child"  # TODO comes first
         assert result[0].children[1].title == "B-Child"  # DONE comes last
 
+    def test_filter_and_sort_in_one_pass(self):
+        c1 = WBSNode(title="B", level=2, assignee="Jane")
+        c2 = WBSNode(title="C", level=2, assignee="John")
+        c3 = WBSNode(title="A", level=2, assignee="Jane")
+        parent = WBSNode(title="Parent", level=1, children=(c1, c2, c3))
+        filters = [FilterConfig(field="assignee", operator="eq", value="Jane")]
+        result = WBSApp._apply_filters_and_sort([parent], filters, SortConfig())
+        assert [c.title for c in result[0].children] == ["A", "B"]
+        assert result[0].children[0] is c3
+
+    def test_sort_keeps_already_ordered_nodes(self):
+        c1 = WBSNode(title="A", level=2)
+        c2 = WBSNode(title="B", level=2)
+        parent = WBSNode(title="Parent", level=1, children=(c1, c2))
+        assert WBSApp._apply_sort([parent], SortConfig())[0] is parent
+
 
 # ── Filter Integration Tests ──
 
 
-@pytest.mark.asyncio
-async def test_filter_applied_in_refresh_ui(sample_project):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_filter_applied_in_refresh_ui(shared_pilot):
     """Filters should affect nodes displayed in table."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        view = app._get_active_view()
-        assert view is not None
-        # Add filter: assignee contains "Jane"
-        view.filters = [FilterConfig(field="assignee", operator="contains", value="Jane")]
-        app._refresh_ui()
-        # Table should only show nodes related to Jane
-        from tui_wbs.widgets.wbs_table import WBSTable
-        table = app.query_one(WBSTable)
-        displayed_titles = [node.title for node, _, _ in table._flat_rows]
-        assert "Phase 1" in displayed_titles  # Parent kept because child matches
-        assert "Task 1.1" in displayed_titles  # Jane's task
+    app, pilot = shared_pilot
+    view = app._get_active_view()
+    assert view is not None
+    # Add filter: assignee contains "Jane"
+    view.filters = [FilterConfig(field="assignee", operator="contains", value="Jane")]
+    app._refresh_ui()
+    # Table should only show nodes related to Jane
+    displayed_titles = {node.title for node in app.displayed_nodes()}
+    assert "Phase 1" in displayed_titles  # Parent kept because child matches
+    assert "Task 1.1" in displayed_titles  # Jane's task
+
+
+def test_filtered_roots_reused_until_inputs_change(bare_app):
+    app = bare_app
+    view = app._get_active_view()
+    roots = app.project.all_root_nodes()
+    view.filters = [FilterConfig(field="assignee", operator="contains", value="Jane")]
+    first = app._filtered_sorted_roots(roots, view)
+    assert app._filtered_sorted_roots(list(roots), view) is first
+
+    view.filters = []
+    assert app._filtered_sorted_roots(roots, view) is not first
+    assert {n.title for n in app.displayed_nodes()} >= {"Phase 1", "Task 1.2"}
 
 
 # ── View Switching Tests ──
 
 
-@pytest.mark.asyncio
-async def test_switch_to_adjacent_view_next(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert len(app.config.views) >= 2
-        first_view_id = app._active_view_id
-        app._switch_to_adjacent_view(1)
-        assert app._active_view_id != first_view_id
-        assert app._active_view_id == app.config.views[1].id
+def test_switch_to_adjacent_view_next(bare_app):
+    app = bare_app
+    assert len(app.config.views) >= 2
+    first_view_id = app._active_view_id
+    app._switch_to_adjacent_view(1)
+    assert app._active_view_id != first_view_id
+    assert app._active_view_id == app.config.views[1].id
 
 
-@pytest.mark.asyncio
-async def test_switch_to_adjacent_view_wraps(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        # Go to last view
-        last_idx = len(app.config.views) - 1
-        app._active_view_id = app.config.views[last_idx].id
-        app._switch_to_adjacent_view(1)
-        assert app._active_view_id == app.config.views[0].id
+def test_switch_to_adjacent_view_wraps(bare_app):
+    app = bare_app
+    # Go to last view
+    last_idx = len(app.config.views) - 1
+    app._active_view_id = app.config.views[last_idx].id
+    app._switch_to_adjacent_view(1)
+    assert app._active_view_id == app.config.views[0].id
 
 
-@pytest.mark.asyncio
-async def test_switch_to_view_by_index(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert len(app.config.views) >= 3
-        # Simulate switching to view 2 (index 1)
-        app._active_view_id = app.config.views[1].id
-        app._refresh_ui()
-        assert app._active_view_id == app.config.views[1].id
+def test_switch_to_view_by_index(bare_app):
+    app = bare_app
+    assert len(app.config.views) >= 3
+    # Simulate switching to view 2 (index 1)
+    app._active_view_id = app.config.views[1].id
+    app._refresh_ui()
+    assert app._active_view_id == app.config.views[1].id
 
 
-@pytest.mark.asyncio
-async def test_focus_tabs_action(sample_project):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_focus_tabs_action(shared_pilot):
     """Test that action_focus_tabs focuses the ViewTabs widget."""
-    from tui_wbs.widgets.view_tabs import ViewTabs
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        app.action_focus_tabs()
-        await pilot.pause(delay=PAUSE)
-        assert isinstance(app.focused, ViewTabs)
+    app, pilot = shared_pilot
+    app.action_focus_tabs()
+    await wait_for(pilot, lambda: isinstance(app.focused, ViewTabs))
 
 
-@pytest.mark.asyncio
-async def test_focus_content_action(sample_project):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_focus_content_action(shared_pilot):
     """Test that action_focus_content focuses the DataTable."""
-    from textual.widgets import DataTable
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        app.action_focus_content()
-        await pilot.pause(delay=PAUSE)
-        assert isinstance(app.focused, DataTable)
+    app, pilot = shared_pilot
+    app.action_focus_content()
+    await wait_for(pilot, lambda: isinstance(app.focused, DataTable))
 
 
-@pytest.mark.asyncio
-async def test_focus_filters_no_filters(sample_project):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_focus_filters_no_filters(shared_pilot):
     """Focus filters should focus FilterBar (always visible even without filters)."""
-    from tui_wbs.widgets.filter_bar import FilterBar
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        app.action_focus_filters()
-        await pilot.pause(delay=PAUSE)
-        # FilterBar is always visible now, so it should be focusable
-        assert isinstance(app.focused, FilterBar)
+    app, pilot = shared_pilot
+    app.action_focus_filters()
+    # FilterBar is always visible now, so it should be focusable
+    await wait_for(pilot, lambda: isinstance(app.focused, FilterBar))
 
 
-@pytest.mark.asyncio
-async def test_view_tabs_arrow_navigation(sample_project):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_view_tabs_arrow_navigation(shared_pilot):
     """After focusing ViewTabs, arrow keys should switch views."""
-    from tui_wbs.widgets.view_tabs import ViewTabs
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert len(app.config.views) >= 2
-        first_view_id = app._active_view_id
-        app.action_focus_tabs()
-        await pilot.pause(delay=PAUSE)
-        # Press right arrow to switch to next view
-        await pilot.press("right")
-        await pilot.pause(delay=PAUSE)
-        assert app._active_view_id != first_view_id
-        assert app._active_view_id == app.config.views[1].id
-
-
-@pytest.mark.asyncio
-async def test_cycle_status(sample_project):
+    app, pilot = shared_pilot
+    assert len(app.config.views) >= 2
+    first_view_id = app._active_view_id
+    app.action_focus_tabs()
+    await wait_for(pilot, lambda: isinstance(app.focused, ViewTabs))
+    # Dispatch the right-arrow key straight to the focused tabs
+    await app.focused.handle_key(events.Key("right", None))
+    await wait_for(pilot, lambda: app._active_view_id != first_view_id)
+    assert app._active_view_id != first_view_id
+    assert app._active_view_id == app.config.views[1].id
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_view_tabs_switch_keeps_tab_widgets(shared_pilot):
+    """Switching only the active view toggles classes instead of remounting."""
+    app, pilot = shared_pilot
+    tabs = app.query_one(ViewTabs)
+    before = list(tabs.query(".tab-button").results(Static))
+    app._active_view_id = app.config.views[1].id
+    app._refresh_ui()
+    await wait_for(pilot, lambda: tabs._render_timer is None)
+    after = list(tabs.query(".tab-button").results(Static))
+    assert after == before
+    assert not after[0].has_class("tab-active")
+    assert after[1].has_class("tab-active")
+
+    # Identical data is a no-op.
+    tabs.update_views(app.config.views, app._active_view_id)
+    assert tabs._render_timer is None
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_view_tabs_click_selects_view(shared_pilot):
+    """Clicking a tab selects the view it was built for."""
+    app, pilot = shared_pilot
+    tabs = app.query_one(ViewTabs)
+    second = list(tabs.query(".tab-button"))[1]
+    assert second.view_id == app.config.views[1].id
+    await pilot.click(second)
+    await wait_for(pilot, lambda: app._active_view_id == second.view_id)
+    assert app._active_view_id == app.config.views[1].id
+
+
+def test_cycle_status(bare_app):
     """Test status cycling: TODO → IN_PROGRESS → DONE → TODO."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        assert task.status == Status.TODO
-        app._update_node(task.id, status=Status.IN_PROGRESS)
-        updated = app._node_map.get(task.id)
-        assert updated.status == Status.IN_PROGRESS
-        app._update_node(task.id, status=Status.DONE)
-        updated = app._node_map.get(task.id)
-        assert updated.status == Status.DONE
-        app._update_node(task.id, status=Status.TODO)
-        updated = app._node_map.get(task.id)
-        assert updated.status == Status.TODO
+    app = bare_app
+    assert app.project is not None
+    task = app.project.find_node_by_title("Phase 1")
+    assert task is not None
+    assert task.status == Status.TODO
+    app._update_node(task.id, status=Status.IN_PROGRESS)
+    updated = app._node_map.get(task.id)
+    assert updated.status == Status.IN_PROGRESS
+    app._update_node(task.id, status=Status.DONE)
+    updated = app._node_map.get(task.id)
+    assert updated.status == Status.DONE
+    app._update_node(task.id, status=Status.TODO)
+    updated = app._node_map.get(task.id)
+    assert updated.status == Status.TODO
 
 
 @pytest.mark.asyncio
 async def test_autosave_timer_scheduled(sample_project):
     """Test that _mark_modified schedules an autosave timer."""
     app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
         assert app._autosave_timer is None
         assert app.project is not None
         first_node = app.project.all_nodes()[0]
@@ -599,290 +743,278 @@ async def test_autosave_timer_scheduled(sample_project):
 # ── No-Color Tests ──
 
 
-@pytest.mark.asyncio
-async def test_no_color_sets_env(tmp_path, monkeypatch):
+def test_no_color_sets_env(mini_project, monkeypatch):
     """--no-color should set NO_COLOR env var before Textual init."""
-    import os
     monkeypatch.delenv("NO_COLOR", raising=False)
-    (tmp_path / "project.wbs.md").write_text(
-        "# Test\n"
-        "| status |\n"
-        "| --- |\n"
-        "| TODO |\n",
-        encoding="utf-8",
-    )
-    app = WBSApp(project_dir=tmp_path, no_color=True)
+    app = WBSApp(project_dir=mini_project, no_color=True)
     assert os.environ.get("NO_COLOR") == "1"
     # Clean up
     monkeypatch.delenv("NO_COLOR", raising=False)
 
 
-@pytest.mark.asyncio
-async def test_no_color_false_no_env(tmp_path, monkeypatch):
+def test_no_color_false_no_env(mini_project, monkeypatch):
     """Without --no-color, NO_COLOR should not be set by app."""
-    import os
     monkeypatch.delenv("NO_COLOR", raising=False)
-    (tmp_path / "project.wbs.md").write_text(
-        "# Test\n"
-        "| status |\n"
-        "| --- |\n"
-        "| TODO |\n",
-        encoding="utf-8",
-    )
-    _ = WBSApp(project_dir=tmp_path, no_color=False)
+    _ = WBSApp(project_dir=mini_project, no_color=False)
     assert os.environ.get("NO_COLOR") is None
 
 
 # ── Reset Tests ──
 
 
-@pytest.mark.asyncio
-async def test_reset_view_clears_filters_and_sort(sample_project):
+def test_reset_view_clears_filters_and_sort(bare_app):
     """r key should clear filters and reset sort to defaults."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        view = app._get_active_view()
-        assert view is not None
-        # Add filter and custom sort
-        view.filters = [FilterConfig(field="status", operator="eq", value="TODO")]
-        view.sort = SortConfig(field="status", order="desc")
-        app.action_reset_view()
-        assert view.filters == []
-        assert view.sort.field == "title"
-        assert view.sort.order == "asc"
-        assert app._modified is True
-
-
-@pytest.mark.asyncio
-async def test_reset_config_restores_defaults(sample_project):
+    app = bare_app
+    view = app._get_active_view()
+    assert view is not None
+    # Add filter and custom sort
+    view.filters = [FilterConfig(field="status", operator="eq", value="TODO")]
+    view.sort = SortConfig(field="status", order="desc")
+    app.action_reset_view()
+    assert view.filters == []
+    assert view.sort.field == "title"
+    assert view.sort.order == "asc"
+    assert app._modified is True
+
+
+def test_reset_config_restores_defaults(bare_app):
     """R key + confirm should reset config to defaults."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        # Set a custom config state
-        app.config.name = "My Project"
-        app.config.views = [ViewConfig(name="Custom", type="table")]
-        old_name = app.config.name
-        app._on_reset_config_confirmed(True)
-        assert app.config.name == old_name  # name preserved
-        assert len(app.config.views) == 3  # default 3 views restored
-        view_types = {v.type for v in app.config.views}
-        assert "table" in view_types
-        assert "table+gantt" in view_types
-        assert "kanban" in view_types
-        assert app._active_view_id == app.config.views[0].id
-        assert app._modified is True
-
-
-@pytest.mark.asyncio
-async def test_reset_config_cancelled(sample_project):
+    app = bare_app
+    # Set a custom config state
+    app.config.name = "My Project"
+    app.config.views = [ViewConfig(name="Custom", type="table")]
+    old_name = app.config.name
+    app._on_reset_config_confirmed(True)
+    assert app.config.name == old_name  # name preserved
+    assert len(app.config.views) == 3  # default 3 views restored
+    view_types = {v.type for v in app.config.views}
+    assert "table" in view_types
+    assert "table+gantt" in view_types
+    assert "kanban" in view_types
+    assert app._active_view_id == app.config.views[0].id
+    assert app._modified is True
+
+
+def test_reset_config_cancelled(bare_app):
     """R key + cancel should not change anything."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        views_before = len(app.config.views)
-        app._on_reset_config_confirmed(False)
-        assert len(app.config.views) == views_before
+    app = bare_app
+    views_before = len(app.config.views)
+    app._on_reset_config_confirmed(False)
+    assert len(app.config.views) == views_before
 
 
 # ── Field Edit Tests ──
 
 
-@pytest.mark.asyncio
-async def test_apply_field_edit_title(sample_project):
+def test_apply_field_edit_title(bare_app):
     """Editing title via _apply_field_edit should update node and depends."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task11 = app.project.find_node_by_title("Task 1.1")
-        assert task11 is not None
-        task12 = app.project.find_node_by_title("Task 1.2")
-        assert task12 is not None
-        assert "Task 1.1" in task12.depends
-
-        app._apply_field_edit(task11.id, "title", "Analysis Done")
-        updated = app._node_map.get(task11.id)
-        assert updated is not None
-        assert updated.title == "Analysis Done"
-        # Depends should be auto-updated
-        updated_12 = app._node_map.get(task12.id)
-        assert updated_12 is not None
-        assert "Analysis Done" in updated_12.depends
-
-
-@pytest.mark.asyncio
-async def test_apply_field_edit_status(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        app._apply_field_edit(task.id, "status", "DONE")
-        updated = app._node_map.get(task.id)
-        assert updated.status == Status.DONE
-
-
-@pytest.mark.asyncio
-async def test_apply_field_edit_priority(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        app._apply_field_edit(task.id, "priority", "LOW")
-        updated = app._node_map.get(task.id)
-        assert updated.priority == Priority.LOW
-
-
-@pytest.mark.asyncio
-async def test_apply_field_edit_date(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        app._apply_field_edit(task.id, "start", "2026-03-01")
-        updated = app._node_map.get(task.id)
-        from datetime import date
-        assert updated.start == date(2026, 3, 1)
-
-
-@pytest.mark.asyncio
-async def test_apply_field_edit_invalid_date(sample_project):
-    """Invalid date should not crash, should show notification."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        app._apply_field_edit(task.id, "start", "not-a-date")
-        updated = app._node_map.get(task.id)
-        assert updated.start is None  # unchanged
-
-
-@pytest.mark.asyncio
-async def test_apply_field_edit_progress(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        app._apply_field_edit(task.id, "progress", "50")
-        updated = app._node_map.get(task.id)
-        assert updated.progress == 50
-
-
-@pytest.mark.asyncio
-async def test_apply_field_edit_progress_invalid(sample_project):
-    """Progress > 100 should be rejected."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        app._apply_field_edit(task.id, "progress", "150")
-        updated = app._node_map.get(task.id)
-        assert updated.progress is None  # unchanged
-
-
-@pytest.mark.asyncio
-async def test_apply_field_edit_milestone(sample_project):
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        assert task.milestone is False
-        app._apply_field_edit(task.id, "milestone", "true")
-        updated = app._node_map.get(task.id)
-        assert updated.milestone is True
+    app = bare_app
+    assert app.project is not None
+    task11 = app.project.find_node_by_title("Task 1.1")
+    assert task11 is not None
+    task12 = app.project.find_node_by_title("Task 1.2")
+    assert task12 is not None
+    assert "Task 1.1" in task12.depends
+
+    app._apply_field_edit(task11.id, "title", "Analysis Done")
+    updated = app._node_map.get(task11.id)
+    assert updated is not None
+    assert updated.title == "Analysis Done"
+    # Depends should be auto-updated
+    updated_12 = app._node_map.get(task12.id)
+    assert updated_12 is not None
+    assert "Analysis Done" in updated_12.depends
+    # The title index follows the rename
+    assert app.project.find_node_by_title("Task 1.1") is None
+    assert app.project.find_node_by_title("Analysis Done") is updated
+    assert app._build_title_map()["Task 1.2"] is updated_12
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "expected"),
+    [
+        ("status", "DONE", Status.DONE),
+        ("priority", "LOW", Priority.LOW),
+        ("start", "2026-03-01", date(2026, 3, 1)),
+        ("start", "not-a-date", None),  # invalid date: notify, leave unchanged
+        ("progress", "50", 50),
+        ("progress", "150", None),  # > 100 rejected, unchanged
+        ("milestone", "true", True),
+    ],
+    ids=["status", "priority", "date", "invalid-date", "progress", "progress-invalid", "milestone"],
+)
+def test_apply_field_edit(bare_app, field, value, expected):
+    app = bare_app
+    task = app.project.find_node_by_title("Phase 1")
+    assert task is not None
+    app._apply_field_edit(task.id, field, value)
+    updated = app._node_map.get(task.id)
+    assert getattr(updated, field) == expected
 
 
-@pytest.mark.asyncio
-async def test_apply_field_edit_custom_field(sample_project):
+def test_apply_field_edit_custom_field(bare_app):
     """Custom field edits should update custom_fields dict."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        app._apply_field_edit(task.id, "custom:label", "backend")
-        updated = app._node_map.get(task.id)
-        assert updated.custom_fields.get("label") == "backend"
+    app = bare_app
+    assert app.project is not None
+    task = app.project.find_node_by_title("Phase 1")
+    assert task is not None
+    app._apply_field_edit(task.id, "custom:label", "backend")
+    updated = app._node_map.get(task.id)
+    assert updated.custom_fields.get("label") == "backend"
 
 
-@pytest.mark.asyncio
-async def test_apply_field_edit_none_value_ignored(sample_project):
+def test_apply_field_edit_none_value_ignored(bare_app):
     """Passing None value should be a no-op."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        original_title = task.title
-        app._apply_field_edit(task.id, "title", None)
-        updated = app._node_map.get(task.id)
-        assert updated.title == original_title
+    app = bare_app
+    assert app.project is not None
+    task = app.project.find_node_by_title("Phase 1")
+    assert task is not None
+    original_title = task.title
+    app._apply_field_edit(task.id, "title", None)
+    updated = app._node_map.get(task.id)
+    assert updated.title == original_title
 
 
 # ── NodeEditScreen Callback Tests ──
 
 
-@pytest.mark.asyncio
-async def test_on_node_edited_multiple_fields(sample_project):
+def test_on_node_edited_multiple_fields(bare_app):
     """_on_node_edited should apply a dict of changes."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        assert task is not None
-        app._on_node_edited(task.id, {
-            "assignee": "Alice",
-            "duration": "10d",
-        })
-        updated = app._node_map.get(task.id)
-        assert updated.assignee == "Alice"
-        assert updated.duration == "10d"
-
-
-@pytest.mark.asyncio
-async def test_on_node_edited_title_updates_depends(sample_project):
+    app = bare_app
+    assert app.project is not None
+    task = app.project.find_node_by_title("Phase 1")
+    assert task is not None
+    app._on_node_edited(task.id, {
+        "assignee": "Alice",
+        "duration": "10d",
+    })
+    updated = app._node_map.get(task.id)
+    assert updated.assignee == "Alice"
+    assert updated.duration == "10d"
+
+
+def test_on_node_edited_title_updates_depends(bare_app):
     """_on_node_edited with title change should update depends."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task11 = app.project.find_node_by_title("Task 1.1")
-        task12 = app.project.find_node_by_title("Task 1.2")
-        assert task11 is not None
-        assert "Task 1.1" in task12.depends
+    app = bare_app
+    assert app.project is not None
+    task11 = app.project.find_node_by_title("Task 1.1")
+    task12 = app.project.find_node_by_title("Task 1.2")
+    assert task11 is not None
+    assert "Task 1.1" in task12.depends
 
-        app._on_node_edited(task11.id, {"title": "Req Analysis"})
-        updated_12 = app._node_map.get(task12.id)
-        assert "Req Analysis" in updated_12.depends
-        assert "Task 1.1" not in updated_12.depends
+    app._on_node_edited(task11.id, {"title": "Req Analysis"})
+    updated_12 = app._node_map.get(task12.id)
+    assert "Req Analysis" in updated_12.depends
+    assert "Task 1.1" not in updated_12.depends
 
 
-@pytest.mark.asyncio
-async def test_on_node_edited_none_is_noop(sample_project):
+def test_on_node_edited_none_is_noop(bare_app):
     """_on_node_edited with None should be a no-op."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        assert app.project is not None
-        task = app.project.find_node_by_title("Phase 1")
-        undo_len = len(app._undo_stack)
-        app._on_node_edited(task.id, None)
-        assert len(app._undo_stack) == undo_len  # no undo state pushed
+    app = bare_app
+    assert app.project is not None
+    task = app.project.find_node_by_title("Phase 1")
+    undo_len = len(app._undo_stack)
+    app._on_node_edited(task.id, None)
+    assert len(app._undo_stack) == undo_len  # no undo state pushed
+
+
+def test_edit_of_missing_node_pushes_no_undo_state(bare_app):
+    app = bare_app
+    redo_marker = app._snapshot_documents()
+    app._redo_stack.append(redo_marker)
+    app._update_node("no-such-id", status=Status.DONE)
+    app._add_node_to_parent("no-such-id", WBSNode(title="Orphan", level=2))
+    assert len(app._undo_stack) == 0
+    assert app._redo_stack == [redo_marker]  # redo history survives
+
+
+def test_edit_with_unchanged_values_is_noop(bare_app):
+    app = bare_app
+    task = app.project.find_node_by_title("Task 1.1")
+    roots = app.project.documents[0].root_nodes
+    app._apply_field_edit(task.id, "status", task.status.value)
+    app._apply_field_edit(task.id, "duration", task.duration)
+    app._on_node_edited(task.id, {"assignee": task.assignee, "priority": task.priority})
+    assert len(app._undo_stack) == 0
+    assert app._modified is False
+    assert app.project.documents[0].root_nodes is roots
+    assert app._node_map[task.id] is task
+
+
+@pytest.mark.asyncio
+async def test_settings_view_list_updates_in_place(sample_project):
+    """Editing views updates only the changed OptionList rows."""
+    app = WBSApp(project_dir=sample_project)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
+        app.action_settings()
+        await wait_for(pilot, lambda: _settings_open(app))
+        modal = app.screen
+        assert isinstance(modal, SettingsModal)
+        ol = modal.query_one("#view-list", OptionList)
+
+        def rows():
+            return [(str(o.prompt), o.id) for o in ol.options]
+
+        first = ol.get_option_at_index(0)
+        modal._config.views[1].name = "Renamed"
+        modal._refresh_view_list()
+        assert ol.get_option_at_index(0) is first
+        assert rows()[1] == (f"  Renamed ({modal._config.views[1].type})", "view-1")
+
+        modal._config.views.pop(0)
+        modal._refresh_view_list()
+        modal._config.views.append(ViewConfig(name="Extra", type="kanban"))
+        modal._refresh_view_list()
+        assert rows() == [
+            (f"  {v.name} ({v.type})", f"view-{i}") for i, v in enumerate(modal._config.views)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_settings_apply_view_edit(sample_project):
+    """Edit fields mounted for a view are applied to the config and list."""
+    app = WBSApp(project_dir=sample_project)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
+        app.action_settings()
+        await wait_for(pilot, lambda: _settings_open(app))
+        modal = app.screen
+        assert isinstance(modal, SettingsModal)
+        modal._selected_view_idx = 0
+        await modal._show_view_edit()
+        await modal._show_view_edit()  # re-opening replaces the fields
+        await wait_for(pilot, lambda: len(modal.query_one("#view-edit-fields").children) == 3)
+        assert len(modal.query_one("#view-edit-fields").children) == 3
+        modal.query_one("#view-name-edit", Input).value = "Edited"
+        modal._apply_view_edit()
+        await wait_for(pilot, lambda: not modal.query_one("#view-edit-fields").children)
+        assert modal._config.views[0].name == "Edited"
+        assert str(modal._view_list.get_option_at_index(0).prompt).startswith("  Edited (")
+        assert not modal.query_one("#view-edit-fields").children
+
+        modal._name_input.value = "Renamed Project"
+        modal._apply_name()
+        assert modal._config.name == "Renamed Project"
+
+
+@pytest.mark.asyncio
+async def test_settings_apply_col_edit(sample_project):
+    """Column edit fields are mounted in their own container and applied."""
+    app = WBSApp(project_dir=sample_project)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
+        app.action_settings()
+        await wait_for(pilot, lambda: _settings_open(app))
+        modal = app.screen
+        assert isinstance(modal, SettingsModal)
+        modal._config.custom_columns.append(ColumnDef(id="risk", name="Risk", type="text"))
+        modal._refresh_col_list()
+        modal._selected_col_idx = len(modal._config.custom_columns) - 1
+        await modal._show_col_edit()
+        await wait_for(pilot, lambda: bool(modal.query("#col-values-edit")))
+        modal.query_one("#col-values-edit", Input).value = "low, high"
+        modal._apply_col_edit()
+        await wait_for(pilot, lambda: not modal.query_one("#col-edit-fields").children)
+        assert modal._config.custom_columns[-1].values == ["low", "high"]
+        assert not modal.query_one("#col-edit-fields").children
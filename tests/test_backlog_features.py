@@ -1,12 +1,16 @@
 """Tests for backlog features: hierarchical IDs, TODO delay warning, duration↔date sync, filter bar, columns, demo data, parent aggregation."""
 
+import shutil
 from dataclasses import replace
 from datetime import date, timedelta
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
+from tests._helpers import load_app, loaded, wait_for
 from tui_wbs.app import WBSApp
+from tui_wbs.filelock import release_lock
 from tui_wbs.models import (
     FilterConfig,
     ProjectConfig,
@@ -18,13 +22,50 @@ from tui_wbs.models import (
     days_to_duration,
 )
 
-PAUSE = 0.1
 
-
-@pytest.fixture
-def sample_project(tmp_path):
-    """Create a sample project directory with WBS files."""
-    (tmp_path / "project.wbs.md").write_text(
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def running_app(tmp_path_factory):
+    """One running WBSApp per module; tests load their project via _load_into."""
+    boot_dir = tmp_path_factory.mktemp("boot")
+    (boot_dir / "project.wbs.md").write_text("# Boot\n", encoding="utf-8")
+    app = WBSApp(project_dir=boot_dir)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
+        yield app, pilot
+
+
+async def _load_into(app: WBSApp, pilot, project_dir: Path) -> None:
+    """Reload the shared app in place from *project_dir*, dropping edit state."""
+    if app._autosave_timer is not None:
+        app._autosave_timer.stop()
+        app._autosave_timer = None
+    release_lock(app.project_dir)
+    app.project_dir = project_dir
+    app._active_view_id = ""
+    app._undo_stack.clear()
+    app._redo_stack.clear()
+    app._modified = False
+    app._load_project()
+    await pilot.pause()
+
+
+def _project_template(tmp_path_factory, name: str, markdown: str) -> Path:
+    template = tmp_path_factory.mktemp(name)
+    (template / "project.wbs.md").write_text(markdown, encoding="utf-8")
+    return template
+
+
+def _copy_project(template: Path, tmp_path: Path) -> Path:
+    project_dir = tmp_path / "proj"
+    shutil.copytree(template, project_dir)
+    return project_dir
+
+
+@pytest.fixture(scope="session")
+def _sample_template(tmp_path_factory):
+    return _project_template(
+        tmp_path_factory,
+        "sample",
         "# My Project\n"
         "| status | assignee | priority |\n"
         "| --- | --- | --- |\n"
@@ -44,17 +85,27 @@ def sample_project(tmp_path):
         "| status | assignee |\n"
         "| --- | --- |\n"
         "| IN_PROGRESS | John |\n",
-        encoding="utf-8",
     )
-    return tmp_path
+
+
+@pytest.fixture
+def sample_project(tmp_path, _sample_template):
+    """Create a sample project directory with WBS files."""
+    return _copy_project(_sample_template, tmp_path)
 
 
 @pytest.fixture
 def date_project(tmp_path):
-    """Project with start/end/duration fields for date sync testing."""
+    """Project with start/end/duration fields for date sync testing.
+
+    Written per test, not from a session template: the tests compare
+    against date.today(), which must match the day the file was written.
+    """
     today = date.today()
     yesterday = today - timedelta(days=1)
-    (tmp_path / "project.wbs.md").write_text(
+    project_dir = tmp_path / "proj"
+    project_dir.mkdir()
+    (project_dir / "project.wbs.md").write_text(
         f"# Project\n"
         f"| status | start | duration |\n"
         f"| --- | --- | --- |\n"
@@ -71,7 +122,7 @@ def date_project(tmp_path):
         f"| TODO | {today.isoformat()} | {(today + timedelta(days=10)).isoformat()} |\n",
         encoding="utf-8",
     )
-    return tmp_path
+    return project_dir
 
 
 # ── duration_to_days / days_to_duration unit tests ──
@@ -102,6 +153,11 @@ class TestDurationHelpers:
     def test_no_unit(self):
         assert duration_to_days("3") == 3
 
+    def test_long_unit_names_and_fractions(self):
+        assert duration_to_days("2 weeks") == 14
+        assert duration_to_days("1.5w") == 10
+        assert duration_to_days("16 hours") == 2
+
     def test_days_to_duration(self):
         assert days_to_duration(5) == "5d"
 
@@ -115,233 +171,195 @@ class TestDurationHelpers:
 # ── Hierarchical ID tests ──
 
 
-@pytest.mark.asyncio
-async def test_hierarchical_ids(sample_project):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_hierarchical_ids(running_app, sample_project):
     """Table should show hierarchical IDs like 1, 1.1, 1.1.1."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        from tui_wbs.widgets.wbs_table import WBSTable
-        table = app.query_one(WBSTable)
-        # Extract hierarchical IDs
-        hier_ids = [hier_id for _, _, hier_id in table._flat_rows]
-        assert hier_ids[0] == "1"       # My Project
-        assert hier_ids[1] == "1.1"     # Phase 1
-        assert hier_ids[2] == "1.1.1"   # Task 1.1
-        assert hier_ids[3] == "1.1.2"   # Task 1.2
-
-
-@pytest.mark.asyncio
-async def test_hierarchical_ids_after_collapse(sample_project):
+    app, pilot = running_app
+    await _load_into(app, pilot, sample_project)
+    from tui_wbs.widgets.wbs_table import WBSTable
+    table = app.query_one(WBSTable)
+    # Extract hierarchical IDs
+    hier_ids = [hier_id for _, _, hier_id in table._flat_rows]
+    assert hier_ids[0] == "1"       # My Project
+    assert hier_ids[1] == "1.1"     # Phase 1
+    assert hier_ids[2] == "1.1.1"   # Task 1.1
+    assert hier_ids[3] == "1.1.2"   # Task 1.2
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_hierarchical_ids_after_collapse(running_app, sample_project):
     """IDs should be stable after fold/unfold."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        from tui_wbs.widgets.wbs_table import WBSTable
-        table = app.query_one(WBSTable)
-        # Collapse Phase 1
-        phase1_node = None
-        for node, _, hier_id in table._flat_rows:
-            if node.title == "Phase 1":
-                phase1_node = node
-                break
-        assert phase1_node is not None
-        table.toggle_collapse(phase1_node.id)
-        # After collapse, children hidden but parent ID still correct
-        hier_ids = [hier_id for _, _, hier_id in table._flat_rows]
-        assert "1" in hier_ids
-        assert "1.1" in hier_ids
-        # Children are collapsed so 1.1.1 and 1.1.2 should not be visible
-        assert "1.1.1" not in hier_ids
-        assert "1.1.2" not in hier_ids
+    app, pilot = running_app
+    await _load_into(app, pilot, sample_project)
+    from tui_wbs.widgets.wbs_table import WBSTable
+    table = app.query_one(WBSTable)
+    # Collapse Phase 1
+    phase1_node, _, _ = table.get_row_by_id(app.project.find_node_by_title("Phase 1").id)
+    table.toggle_collapse(phase1_node.id)
+    # After collapse, children hidden but parent ID still correct
+    hier_ids = [hier_id for _, _, hier_id in table._flat_rows]
+    assert "1" in hier_ids
+    assert "1.1" in hier_ids
+    # Children are collapsed so 1.1.1 and 1.1.2 should not be visible
+    assert "1.1.1" not in hier_ids
+    assert "1.1.2" not in hier_ids
 
 
 # ── TODO Delay Warning tests ──
 
 
-@pytest.mark.asyncio
-async def test_todo_overdue_red_text(date_project):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_todo_overdue_red_text(running_app, date_project):
     """TODO nodes with past start dates should have red bold title."""
-    app = WBSApp(project_dir=date_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        from tui_wbs.widgets.wbs_table import WBSTable
-        from rich.text import Text
-
-        table = app.query_one(WBSTable)
-        # Find Task A (has yesterday's start date, TODO status)
-        task_a = None
-        for node, _, _ in table._flat_rows:
-            if node.title == "Task A":
-                task_a = node
-                break
-        assert task_a is not None
-        assert task_a.status == Status.TODO
-        assert task_a.start is not None
-        assert task_a.start <= date.today()
-
-        # Check that the row's title column is a Text object with red bold
-        view_config = table._view_config
-        row_data = table._make_row(task_a, 1, "1.1")
-        title_idx = view_config.columns.index("title") if "title" in view_config.columns else -1
-        assert title_idx >= 0
-        title_cell = row_data[title_idx]
-        assert isinstance(title_cell, Text)
-        # The title text should contain "Task A" with "red bold" style
-        plain = title_cell.plain
-        assert "Task A" in plain
-
-
-@pytest.mark.asyncio
-async def test_done_node_no_red_text(date_project):
+    app, pilot = running_app
+    await _load_into(app, pilot, date_project)
+    from tui_wbs import theme
+    from tui_wbs.widgets.wbs_table import WBSTable
+    from rich.style import Style
+    from rich.text import Text
+
+    table = app.query_one(WBSTable)
+    # Find Task A (has yesterday's start date, TODO status)
+    task_a, _, _ = table.get_row_by_id(app.project.find_node_by_title("Task A").id)
+    assert task_a.status == Status.TODO
+    assert task_a.start is not None
+    assert task_a.start <= date.today()
+
+    # Check that the row's title column is a Text object with red bold
+    view_config = table._view_config
+    row_data = table._make_row(task_a, 1, "1.1")
+    title_idx = view_config.columns.index("title") if "title" in view_config.columns else -1
+    assert title_idx >= 0
+    title_cell = row_data[title_idx]
+    assert isinstance(title_cell, Text)
+    # The title is the row's single span, styled with the overdue color
+    (span,) = title_cell.spans
+    assert title_cell.plain[span.start:span.end] == "Task A"
+    assert span.style == Style.parse(f"{theme.OVERDUE_TITLE} bold")
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_done_node_no_red_text(running_app, date_project):
     """DONE nodes should NOT get red text even if start is past."""
-    app = WBSApp(project_dir=date_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        # Change Task A to DONE
-        task_a = app.project.find_node_by_title("Task A")
-        assert task_a is not None
-        app._update_node(task_a.id, status=Status.DONE)
-
-        from tui_wbs.widgets.wbs_table import WBSTable
-        from rich.text import Text
-
-        table = app.query_one(WBSTable)
-        updated_node = app._node_map[task_a.id]
-        row_data = table._make_row(updated_node, 1, "1.1")
-        view_config = table._view_config
-        title_idx = view_config.columns.index("title")
-        title_cell = row_data[title_idx]
-        assert isinstance(title_cell, Text)
-        # Should NOT have red bold style on the title portion
-        # Find the "Task A" span and check it doesn't have red
-        start_pos = title_cell.plain.index("Task A")
-        end_pos = start_pos + len("Task A")
-        spans = title_cell._spans
-        red_bold_on_title = any(
-            s.style and "red" in str(s.style) and "bold" in str(s.style)
-            for s in spans
-            if s.start <= start_pos and s.end >= end_pos
-        )
-        assert not red_bold_on_title
+    app, pilot = running_app
+    await _load_into(app, pilot, date_project)
+    # Change Task A to DONE
+    task_a = app.project.find_node_by_title("Task A")
+    assert task_a is not None
+    app._update_node(task_a.id, status=Status.DONE)
+
+    from tui_wbs.widgets.wbs_table import WBSTable
+    from rich.text import Text
+
+    table = app.query_one(WBSTable)
+    updated_node = app._node_map[task_a.id]
+    row_data = table._make_row(updated_node, 1, "1.1")
+    view_config = table._view_config
+    title_idx = view_config.columns.index("title")
+    title_cell = row_data[title_idx]
+    assert isinstance(title_cell, Text)
+    # No overdue span: the title is unstyled
+    assert "Task A" in title_cell.plain
+    assert title_cell.spans == []
 
 
 # ── Duration ↔ Date Sync tests ──
 
 
-@pytest.mark.asyncio
-async def test_duration_edit_updates_end(date_project):
+def test_duration_edit_updates_end(date_project):
     """Editing duration when start exists should auto-calculate end."""
-    app = WBSApp(project_dir=date_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        # Project node has start=today, duration=5d
-        project_node = app.project.find_node_by_title("Project")
-        assert project_node is not None
-        today = date.today()
-        assert project_node.start == today
-
-        # Edit duration to 10d
-        app._apply_field_edit(project_node.id, "duration", "10d")
-        updated = app._node_map[project_node.id]
-        assert updated.duration == "10d"
-        assert updated.end == today + timedelta(days=10)
-
-
-@pytest.mark.asyncio
-async def test_start_edit_updates_end_when_duration_exists(date_project):
+    app = load_app(date_project)
+    # Project node has start=today, duration=5d
+    project_node = app.project.find_node_by_title("Project")
+    assert project_node is not None
+    today = date.today()
+    assert project_node.start == today
+
+    # Edit duration to 10d
+    app._apply_field_edit(project_node.id, "duration", "10d")
+    updated = app._node_map[project_node.id]
+    assert updated.duration == "10d"
+    assert updated.end == today + timedelta(days=10)
+
+
+def test_start_edit_updates_end_when_duration_exists(date_project):
     """Editing start when duration exists should auto-calculate end."""
-    app = WBSApp(project_dir=date_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        project_node = app.project.find_node_by_title("Project")
-        assert project_node is not None
-        new_start = date.today() + timedelta(days=5)
-        app._apply_field_edit(project_node.id, "start", new_start.isoformat())
-        updated = app._node_map[project_node.id]
-        assert updated.start == new_start
-        # duration is "5d" → end = start + 5
-        assert updated.end == new_start + timedelta(days=5)
-
-
-@pytest.mark.asyncio
-async def test_end_edit_updates_duration(date_project):
+    app = load_app(date_project)
+    project_node = app.project.find_node_by_title("Project")
+    assert project_node is not None
+    new_start = date.today() + timedelta(days=5)
+    app._apply_field_edit(project_node.id, "start", new_start.isoformat())
+    updated = app._node_map[project_node.id]
+    assert updated.start == new_start
+    # duration is "5d" → end = start + 5
+    assert updated.end == new_start + timedelta(days=5)
+
+
+def test_end_edit_updates_duration(date_project):
     """Editing end when start exists should auto-calculate duration."""
-    app = WBSApp(project_dir=date_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        # Task B has start=today, end=today+10
-        task_b = app.project.find_node_by_title("Task B")
-        assert task_b is not None
-        new_end = date.today() + timedelta(days=20)
-        app._apply_field_edit(task_b.id, "end", new_end.isoformat())
-        updated = app._node_map[task_b.id]
-        assert updated.end == new_end
-        diff = (new_end - updated.start).days
-        assert updated.duration == f"{diff}d"
-
-
-@pytest.mark.asyncio
-async def test_start_edit_calculates_duration_when_end_exists_no_duration(date_project):
+    app = load_app(date_project)
+    # Task B has start=today, end=today+10
+    task_b = app.project.find_node_by_title("Task B")
+    assert task_b is not None
+    new_end = date.today() + timedelta(days=20)
+    app._apply_field_edit(task_b.id, "end", new_end.isoformat())
+    updated = app._node_map[task_b.id]
+    assert updated.end == new_end
+    diff = (new_end - updated.start).days
+    assert updated.duration == f"{diff}d"
+
+
+def test_start_edit_calculates_duration_when_end_exists_no_duration(date_project):
     """Editing start when end exists and no duration should calculate duration."""
-    app = WBSApp(project_dir=date_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        # Task B has start, end, but let's clear duration first
-        task_b = app.project.find_node_by_title("Task B")
-        assert task_b is not None
-        app._update_node(task_b.id, duration="")
-        task_b = app._node_map[task_b.id]
-        assert task_b.duration == ""
-
-        new_start = date.today()
-        app._apply_field_edit(task_b.id, "start", new_start.isoformat())
-        updated = app._node_map[task_b.id]
-        # end was today+10, start is today → duration = 10d
-        expected_days = (task_b.end - new_start).days
-        assert updated.duration == f"{expected_days}d"
+    app = load_app(date_project)
+    # Task B has start, end, but let's clear duration first
+    task_b = app.project.find_node_by_title("Task B")
+    assert task_b is not None
+    app._update_node(task_b.id, duration="")
+    task_b = app._node_map[task_b.id]
+    assert task_b.duration == ""
+
+    new_start = date.today()
+    app._apply_field_edit(task_b.id, "start", new_start.isoformat())
+    updated = app._node_map[task_b.id]
+    # end was today+10, start is today → duration = 10d
+    expected_days = (task_b.end - new_start).days
+    assert updated.duration == f"{expected_days}d"
 
 
 # ── Filter Bar Display tests ──
 
 
-@pytest.mark.asyncio
-async def test_filter_bar_shows_hint_when_empty(sample_project):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_filter_bar_shows_hint_when_empty(running_app, sample_project):
     """FilterBar should show hint text when no filters and no sort active."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        from tui_wbs.widgets.filter_bar import FilterBar
-        from textual.widgets import Static
-
-        filter_bar = app.query_one(FilterBar)
-        # Clear sort to test fully empty state
-        filter_bar.update_filters([], None)
-        await pilot.pause(delay=PAUSE)
-        hint = filter_bar.query_one("#filter-bar-hint", Static)
-        assert hint.display is True
-
-
-@pytest.mark.asyncio
-async def test_filter_bar_shows_sort_without_filters(sample_project):
+    app, pilot = running_app
+    await _load_into(app, pilot, sample_project)
+    from tui_wbs.widgets.filter_bar import FilterBar
+
+    filter_bar = app.query_one(FilterBar)
+    # Clear sort to test fully empty state
+    filter_bar.update_filters([], None)
+    await pilot.pause()
+    assert filter_bar._hint.display is True
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_filter_bar_shows_sort_without_filters(running_app, sample_project):
     """Sort info should display even when no filters are active."""
-    app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        from tui_wbs.widgets.filter_bar import FilterBar
-        from tui_wbs.models import SortConfig
-        from textual.widgets import Static
-
-        filter_bar = app.query_one(FilterBar)
-        # Apply sort without filters
-        filter_bar.update_filters([], SortConfig(field="title", order="asc"))
-        await pilot.pause(delay=PAUSE)
-        # Hint should be hidden
-        hint = filter_bar.query_one("#filter-bar-hint", Static)
-        assert hint.display is False
-        # Sort info should be visible
-        sort_widget = filter_bar.query_one("#filter-bar-sort", Static)
-        assert sort_widget.display is True
+    app, pilot = running_app
+    await _load_into(app, pilot, sample_project)
+    from tui_wbs.widgets.filter_bar import FilterBar
+    from tui_wbs.models import SortConfig
+
+    filter_bar = app.query_one(FilterBar)
+    # Apply sort without filters
+    filter_bar.update_filters([], SortConfig(field="title", order="asc"))
+    await pilot.pause()
+    # Hint should be hidden
+    assert filter_bar._hint.display is False
+    # Sort info should be visible
+    assert filter_bar._sort_widget.display is True
 
 
 # ── Default Column Order tests ──
@@ -378,56 +396,64 @@ class TestDefaultColumns:
 # ── Demo Data Label/Module tests ──
 
 
+@pytest.fixture(scope="module")
+def demo_nodes() -> list[WBSNode]:
+    """All nodes of the bundled demo document, parsed once per module."""
+    from tui_wbs.demo_data import get_demo_dir
+    from tui_wbs.parser import parse_markdown
+    demo_file = get_demo_dir() / "demo.wbs.md"
+    content = demo_file.read_text(encoding="utf-8")
+    return parse_markdown(content, "demo.wbs.md").all_nodes()
+
+
+@pytest.fixture(scope="module")
+def demo_by_title(demo_nodes) -> dict[str, WBSNode]:
+    """Demo nodes keyed by title (first occurrence wins)."""
+    by_title: dict[str, WBSNode] = {}
+    for node in demo_nodes:
+        by_title.setdefault(node.title, node)
+    return by_title
+
+
 class TestDemoDataLabelModule:
-    def _parse_demo(self):
-        from tui_wbs.demo_data import get_demo_dir
-        from tui_wbs.parser import parse_markdown
-        demo_file = get_demo_dir() / "demo.wbs.md"
-        content = demo_file.read_text(encoding="utf-8")
-        return parse_markdown(content, "demo.wbs.md")
-
-    def test_all_nodes_have_label(self):
+    def test_all_nodes_have_label(self, demo_nodes):
         """Every node in demo data should have a label custom field."""
-        doc = self._parse_demo()
-        for node in doc.all_nodes():
+        for node in demo_nodes:
             assert "label" in node.custom_fields, f"Node '{node.title}' missing label"
             assert node.custom_fields["label"], f"Node '{node.title}' has empty label"
 
-    def test_all_nodes_have_module(self):
+    def test_all_nodes_have_module(self, demo_nodes):
         """Every node in demo data should have a module custom field."""
-        doc = self._parse_demo()
-        for node in doc.all_nodes():
+        for node in demo_nodes:
             assert "module" in node.custom_fields, f"Node '{node.title}' missing module"
             assert node.custom_fields["module"], f"Node '{node.title}' has empty module"
 
-    def test_phase1_labels(self):
+    def test_phase1_labels(self, demo_by_title):
         """Phase 1 nodes should have label=planning, module=project-mgmt."""
-        doc = self._parse_demo()
         phase1_titles = {"Phase 1: Discovery & Planning", "Stakeholder Interviews",
                          "Competitive Analysis", "Requirements Document", "Planning Milestone"}
-        for node in doc.all_nodes():
-            if node.title in phase1_titles:
-                assert node.custom_fields["label"] == "planning"
-                assert node.custom_fields["module"] == "project-mgmt"
+        for title in phase1_titles & demo_by_title.keys():
+            node = demo_by_title[title]
+            assert node.custom_fields["label"] == "planning"
+            assert node.custom_fields["module"] == "project-mgmt"
 
-    def test_backend_labels(self):
+    def test_backend_labels(self, demo_by_title):
         """Backend development nodes should have label=backend."""
-        doc = self._parse_demo()
         backend_titles = {"API Gateway Setup", "Authentication Service",
                           "Task CRUD Backend", "Real-time Sync Engine",
                           "Notification System", "Search & Filtering"}
-        for node in doc.all_nodes():
-            if node.title in backend_titles:
-                assert node.custom_fields["label"] == "backend"
+        for title in backend_titles & demo_by_title.keys():
+            assert demo_by_title[title].custom_fields["label"] == "backend"
 
 
 # ── Parent Date Aggregation tests ──
 
 
-@pytest.fixture
-def aggregation_project(tmp_path):
-    """Project for testing parent date aggregation."""
-    (tmp_path / "project.wbs.md").write_text(
+@pytest.fixture(scope="session")
+def _aggregation_template(tmp_path_factory):
+    return _project_template(
+        tmp_path_factory,
+        "aggregation",
         "# Root\n"
         "| status |\n"
         "| --- |\n"
@@ -447,99 +473,105 @@ def aggregation_project(tmp_path):
         "| status | start | end |\n"
         "| --- | --- | --- |\n"
         "| TODO | 2025-01-03 | 2025-01-20 |\n",
-        encoding="utf-8",
     )
-    return tmp_path
 
 
-@pytest.mark.asyncio
-async def test_propagate_dates_updates_parent(aggregation_project):
+@pytest.fixture
+def aggregation_project(tmp_path, _aggregation_template):
+    """Project for testing parent date aggregation."""
+    return _copy_project(_aggregation_template, tmp_path)
+
+
+def test_propagate_dates_updates_parent(aggregation_project):
     """Editing child start/end should update parent's start/end."""
-    app = WBSApp(project_dir=aggregation_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        child_a = app.project.find_node_by_title("Child A")
-        assert child_a is not None
-        # Move Child A start earlier
-        app._apply_field_edit(child_a.id, "start", "2025-01-01")
-        parent = app.project.find_node_by_title("Parent")
-        parent_node = app._node_map[parent.id]
-        # Parent start should be min(Child A start=Jan 1, Child B start=Jan 3) = Jan 1
-        assert parent_node.start == date(2025, 1, 1)
-
-
-@pytest.mark.asyncio
-async def test_propagate_dates_max_end(aggregation_project):
+    app = load_app(aggregation_project)
+    child_a = app.project.find_node_by_title("Child A")
+    assert child_a is not None
+    # Move Child A start earlier
+    app._apply_field_edit(child_a.id, "start", "2025-01-01")
+    parent = app.project.find_node_by_title("Parent")
+    parent_node = app._node_map[parent.id]
+    # Parent start should be min(Child A start=Jan 1, Child B start=Jan 3) = Jan 1
+    assert parent_node.start == date(2025, 1, 1)
+
+
+def test_propagate_dates_max_end(aggregation_project):
     """Parent end should be max of children's end dates."""
-    app = WBSApp(project_dir=aggregation_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        child_b = app.project.find_node_by_title("Child B")
-        assert child_b is not None
-        # Extend Child B's end
-        app._apply_field_edit(child_b.id, "end", "2025-02-28")
-        parent = app.project.find_node_by_title("Parent")
-        parent_node = app._node_map[parent.id]
-        assert parent_node.end == date(2025, 2, 28)
-
-
-@pytest.mark.asyncio
-async def test_propagate_dates_no_change_when_within_range(aggregation_project):
+    app = load_app(aggregation_project)
+    child_b = app.project.find_node_by_title("Child B")
+    assert child_b is not None
+    # Extend Child B's end
+    app._apply_field_edit(child_b.id, "end", "2025-02-28")
+    parent = app.project.find_node_by_title("Parent")
+    parent_node = app._node_map[parent.id]
+    assert parent_node.end == date(2025, 2, 28)
+
+
+def test_propagate_dates_no_change_when_within_range(aggregation_project):
     """Parent dates should not change if child dates stay within existing range."""
-    app = WBSApp(project_dir=aggregation_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        parent = app.project.find_node_by_title("Parent")
-        parent_node = app._node_map[parent.id]
-        original_start = parent_node.start
-        original_end = parent_node.end
-
-        # Set parent to match children's range first
-        app._update_node(parent.id, start=date(2025, 1, 3), end=date(2025, 1, 20))
-        parent_node = app._node_map[parent.id]
-
-        # Edit Child A start to be within range - parent should get min(children starts)
-        child_a = app.project.find_node_by_title("Child A")
-        app._apply_field_edit(child_a.id, "start", "2025-01-04")
-        parent_node = app._node_map[parent.id]
-        # min start = Child B Jan 3, so parent stays Jan 3
-        assert parent_node.start == date(2025, 1, 3)
-
-
-@pytest.mark.asyncio
-async def test_propagate_dates_cascades_to_grandparent(aggregation_project):
+    app = load_app(aggregation_project)
+    parent = app.project.find_node_by_title("Parent")
+    parent_node = app._node_map[parent.id]
+    original_start = parent_node.start
+    original_end = parent_node.end
+
+    # Set parent to match children's range first
+    app._update_node(parent.id, start=date(2025, 1, 3), end=date(2025, 1, 20))
+    parent_node = app._node_map[parent.id]
+
+    # Edit Child A start to be within range - parent should get min(children starts)
+    child_a = app.project.find_node_by_title("Child A")
+    app._apply_field_edit(child_a.id, "start", "2025-01-04")
+    parent_node = app._node_map[parent.id]
+    # min start = Child B Jan 3, so parent stays Jan 3
+    assert parent_node.start == date(2025, 1, 3)
+
+
+def test_propagate_dates_cascades_to_grandparent(aggregation_project):
     """Date changes should cascade from child → parent → grandparent."""
-    app = WBSApp(project_dir=aggregation_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        # Set Root to have dates so we can test cascade
-        root = app.project.find_node_by_title("Root")
-        app._update_node(root.id, start=date(2025, 1, 1), end=date(2025, 1, 10))
-
-        child_b = app.project.find_node_by_title("Child B")
-        app._apply_field_edit(child_b.id, "end", "2025-03-15")
-
-        # Parent should update
-        parent_node = app._node_map[app.project.find_node_by_title("Parent").id]
-        assert parent_node.end == date(2025, 3, 15)
-        # Root (grandparent) should also update
-        root_node = app._node_map[root.id]
-        assert root_node.end == date(2025, 3, 15)
-
-
-@pytest.mark.asyncio
-async def test_propagate_dates_via_duration(aggregation_project):
+    app = load_app(aggregation_project)
+    # Set Root to have dates so we can test cascade
+    root = app.project.find_node_by_title("Root")
+    app._update_node(root.id, start=date(2025, 1, 1), end=date(2025, 1, 10))
+
+    child_b = app.project.find_node_by_title("Child B")
+    app._apply_field_edit(child_b.id, "end", "2025-03-15")
+
+    # Parent should update
+    parent_node = app._node_map[app.project.find_node_by_title("Parent").id]
+    assert parent_node.end == date(2025, 3, 15)
+    # Root (grandparent) should also update
+    root_node = app._node_map[root.id]
+    assert root_node.end == date(2025, 3, 15)
+
+
+def test_propagate_dates_via_duration(aggregation_project):
     """Editing duration should propagate recalculated end to parent."""
-    app = WBSApp(project_dir=aggregation_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
-        child_a = app.project.find_node_by_title("Child A")
-        assert child_a is not None
-        # Child A start=Jan 5, set duration=30d → end=Jan 5+30=Feb 4
-        app._apply_field_edit(child_a.id, "duration", "30d")
-        updated_a = app._node_map[child_a.id]
-        assert updated_a.end == date(2025, 1, 5) + timedelta(days=30)
-
-        parent_node = app._node_map[app.project.find_node_by_title("Parent").id]
-        # Parent end should be max(Child A end=Feb 4, Child B end=Jan 20) = Feb 4
-        assert parent_node.end == date(2025, 1, 5) + timedelta(days=30)
+    app = load_app(aggregation_project)
+    child_a = app.project.find_node_by_title("Child A")
+    assert child_a is not None
+    # Child A start=Jan 5, set duration=30d → end=Jan 5+30=Feb 4
+    app._apply_field_edit(child_a.id, "duration", "30d")
+    updated_a = app._node_map[child_a.id]
+    assert updated_a.end == date(2025, 1, 5) + timedelta(days=30)
+
+    parent_node = app._node_map[app.project.find_node_by_title("Parent").id]
+    # Parent end should be max(Child A end=Feb 4, Child B end=Jan 20) = Feb 4
+    assert parent_node.end == date(2025, 1, 5) + timedelta(days=30)
+
+
+def test_propagate_dates_rebuilds_maps_once(aggregation_project):
+    """A cascade through several ancestors splices the tree in one pass."""
+    app = load_app(aggregation_project)
+    root = app.project.find_node_by_title("Root")
+    app._update_node(root.id, start=date(2025, 1, 1), end=date(2025, 1, 10))
+    child_b = app.project.find_node_by_title("Child B")
+    app._update_node(child_b.id, end=date(2025, 4, 1))
+
+    rebuilds = []
+    original = app._rebuild_node_map
+    app._rebuild_node_map = lambda: (rebuilds.append(1), original())
+    app._propagate_dates_to_parents(child_b.id)
+    assert len(rebuilds) == 1
+    assert app._node_map[root.id].end == date(2025, 4, 1)
+    assert app._node_map[app._parent_map[child_b.id]].end == date(2025, 4, 1)
@@ -0,0 +1,97 @@
+"""Micro-benchmarks for the filter/sort/search hot paths.
+
+These are marked ``benchmark`` and deselected from the default run, because
+pytest-benchmark cannot time tests under xdist. Run them serially:
+
+    pytest -n0 -m benchmark
+
+Each test fails when its median exceeds the limit in ``MEDIAN_LIMITS``.
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+from tui_wbs.app import WBSApp
+from tui_wbs.models import (
+    FilterConfig,
+    Priority,
+    SortConfig,
+    Status,
+    WBSDocument,
+    WBSNode,
+    WBSProject,
+)
+
+_STATUSES = list(Status)
+_PRIORITIES = list(Priority)
+
+# Median run time limits in seconds, with roughly 4x headroom over a typical dev machine
+MEDIAN_LIMITS = {
+    "test_apply_filters": 0.1,
+    "test_apply_sort": 0.1,
+    "test_perform_search": 0.002,
+}
+
+
+def _check_median(benchmark, request) -> None:
+    """Fail when the measured median exceeds the test's ``MEDIAN_LIMITS`` entry."""
+    if not benchmark.enabled:
+        pytest.skip("benchmark timing is disabled; run with -n0 -m benchmark")
+    limit = MEDIAN_LIMITS[request.node.name]
+    median = benchmark.stats["median"]
+    assert median <= limit, f"median {median * 1000:.2f} ms exceeds {limit * 1000:.2f} ms"
+
+
+@pytest.fixture(scope="module")
+def big_roots() -> list[WBSNode]:
+    """100 phases x 10 tasks x 10 subtasks (11 100 nodes)."""
+    roots: list[WBSNode] = []
+    for p in range(100):
+        tasks = []
+        for t in range(10):
+            subtasks = tuple(
+                WBSNode(
+                    title=f"Subtask {p}.{t}.{s}",
+                    level=3,
+                    status=_STATUSES[(p + t + s) % 3],
+                    priority=_PRIORITIES[(p * t + s) % 3],
+                    assignee=("Jane", "Bob", "")[s % 3],
+                )
+                for s in range(10)
+            )
+            tasks.append(WBSNode(title=f"Task {p}.{t}", level=2, children=subtasks))
+        roots.append(WBSNode(title=f"Phase {p}", level=1, children=tuple(tasks)))
+    return roots
+
+
+@pytest.fixture
+def search_app(big_roots):
+    app = WBSApp(project_dir=Path("."))
+    doc = WBSDocument(file_path=Path("big.wbs.md"), root_nodes=list(big_roots))
+    app.project = WBSProject(dir_path=Path("."), documents=[doc])
+    return app
+
+
+def test_apply_filters(benchmark, request, big_roots):
+    filters = [FilterConfig(field="assignee", operator="contains", value="jane")]
+    result = benchmark(WBSApp._apply_filters, big_roots, filters)
+    assert len(result) == 100
+    _check_median(benchmark, request)
+
+
+def test_apply_sort(benchmark, request, big_roots):
+    sort = SortConfig(field="priority", order="asc")
+    result = benchmark(WBSApp._apply_sort, big_roots, sort)
+    assert len(result) == 100
+    _check_median(benchmark, request)
+
+
+def test_perform_search(benchmark, request, search_app):
+    benchmark(search_app._perform_search, "subtask 7.")
+    assert len(search_app._search_matches) == 100
+    _check_median(benchmark, request)
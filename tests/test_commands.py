@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
+from tests._helpers import loaded, wait_for
 from tui_wbs.commands import COMMANDS, CommandDef, WBSCommandProvider, transliterate_korean
 
 
@@ -71,6 +73,41 @@ def test_transliterate_korean_shift_consonants():
     assert transliterate_korean("ㄲ") == "E"
 
 
+def test_transliterate_korean_leaves_syllables_alone():
+    # Only standalone jamo are mapped; composed syllables pass through
+    assert transliterate_korean("저장 ㅅave") == "저장 rave"
+
+
+# ── Provider search ──
+
+
+class _KanbanProvider(WBSCommandProvider):
+    def __init__(self) -> None:  # no screen needed to search
+        pass
+
+    @property
+    def _current_view_type(self) -> str:
+        return "kanban"
+
+
+def _search(query: str) -> list[str]:
+    async def collect():
+        return [hit.text async for hit in _KanbanProvider().search(query)]
+
+    return asyncio.run(collect())
+
+
+def test_search_matches_transliterated_query():
+    assert "Save" in _search("ㄴㅁㅍㄱ")
+    assert "Save" in _search("SAVE")
+
+
+def test_search_respects_view_context():
+    found = _search("scale")
+    assert found and not any(text.startswith("Gantt:") for text in found)
+    assert "Kanban: Move Card Left" in _search("card left")
+
+
 # ── Provider registration ──
 
 
@@ -100,22 +137,20 @@ def sample_project(tmp_path):
     return tmp_path
 
 
-PAUSE = 0.15
-
-
 @pytest.mark.asyncio
 async def test_command_palette_opens(sample_project):
     """Ctrl+P should open the command palette."""
     from tui_wbs.app import WBSApp
 
     app = WBSApp(project_dir=sample_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
         await pilot.press("ctrl+p")
-        await pilot.pause(delay=PAUSE)
         # The command palette is pushed as a screen
         from textual.command import CommandPalette
 
+        await wait_for(pilot, lambda: isinstance(app.screen, CommandPalette))
+
         assert any(
             isinstance(screen, CommandPalette) for screen in app.screen_stack
         ), "Command Palette did not open"
@@ -6,6 +6,7 @@ from datetime import date, timedelta
 
 import pytest
 
+from tests._helpers import loaded, wait_for
 from tui_wbs.app import WBSApp
 from tui_wbs.demo_data import (
     _extract_anchor,
@@ -16,9 +17,6 @@ from tui_wbs.models import Status
 from tui_wbs.parser import parse_file
 
 
-PAUSE = 0.1
-
-
 @pytest.fixture
 def demo_app():
     """Create a demo-mode WBSApp using the bundled demo directory."""
@@ -26,68 +24,69 @@ def demo_app():
     return WBSApp(project_dir=demo_dir, demo_mode=True)
 
 
+@pytest.fixture(scope="module")
+def demo_doc():
+    """The bundled demo.wbs.md, parsed once for the read-only checks below."""
+    return parse_file(get_demo_dir() / "demo.wbs.md")
+
+
+@pytest.fixture(scope="module")
+def demo_nodes(demo_doc):
+    return demo_doc.all_nodes()
+
+
 # ── Unit tests for demo data (file-based) ──
 
 
-def test_demo_file_parses_without_warnings():
+def test_demo_file_parses_without_warnings(demo_doc):
     """demo.wbs.md should parse cleanly with no warnings."""
-    doc = parse_file(get_demo_dir() / "demo.wbs.md")
-    assert doc.parse_warnings == [], [str(w) for w in doc.parse_warnings]
+    assert demo_doc.parse_warnings == [], [str(w) for w in demo_doc.parse_warnings]
 
 
-def test_demo_file_has_enough_nodes():
+def test_demo_file_has_enough_nodes(demo_nodes):
     """Demo data should have 25+ nodes."""
-    doc = parse_file(get_demo_dir() / "demo.wbs.md")
-    all_nodes = doc.all_nodes()
-    assert len(all_nodes) >= 25
+    assert len(demo_nodes) >= 25
 
 
-def test_demo_file_has_mixed_statuses():
+def test_demo_file_has_mixed_statuses(demo_nodes):
     """Demo data should have all three statuses represented."""
-    doc = parse_file(get_demo_dir() / "demo.wbs.md")
-    statuses = {n.status for n in doc.all_nodes()}
+    statuses = {n.status for n in demo_nodes}
     assert statuses == {Status.TODO, Status.IN_PROGRESS, Status.DONE}
 
 
-def test_demo_file_has_assignees():
+def test_demo_file_has_assignees(demo_nodes):
     """Demo data should have multiple different assignees."""
-    doc = parse_file(get_demo_dir() / "demo.wbs.md")
-    assignees = {n.assignee for n in doc.all_nodes() if n.assignee}
+    assignees = {n.assignee for n in demo_nodes if n.assignee}
     assert len(assignees) >= 5
 
 
-def test_demo_file_has_dates():
+def test_demo_file_has_dates(demo_nodes):
     """All tasks in demo data should have start/end dates."""
-    doc = parse_file(get_demo_dir() / "demo.wbs.md")
-    nodes_with_dates = [n for n in doc.all_nodes() if n.start and n.end]
+    nodes_with_dates = [n for n in demo_nodes if n.start and n.end]
     assert len(nodes_with_dates) >= 20
 
 
-def test_demo_file_has_milestones():
+def test_demo_file_has_milestones(demo_nodes):
     """Demo data should have milestone nodes."""
-    doc = parse_file(get_demo_dir() / "demo.wbs.md")
-    milestones = [n for n in doc.all_nodes() if n.milestone]
+    milestones = [n for n in demo_nodes if n.milestone]
     assert len(milestones) >= 4
 
 
-def test_demo_file_has_dependencies():
+def test_demo_file_has_dependencies(demo_nodes):
     """Demo data should have nodes with depends fields."""
-    doc = parse_file(get_demo_dir() / "demo.wbs.md")
-    with_deps = [n for n in doc.all_nodes() if n.depends]
+    with_deps = [n for n in demo_nodes if n.depends]
     assert len(with_deps) >= 10
 
 
-def test_demo_file_has_memos():
+def test_demo_file_has_memos(demo_nodes):
     """Demo data should have nodes with memo text."""
-    doc = parse_file(get_demo_dir() / "demo.wbs.md")
-    with_memo = [n for n in doc.all_nodes() if n.memo.strip()]
+    with_memo = [n for n in demo_nodes if n.memo.strip()]
     assert len(with_memo) >= 5
 
 
-def test_demo_file_has_three_level_hierarchy():
+def test_demo_file_has_three_level_hierarchy(demo_nodes):
     """Demo data should have nodes at levels 1, 2, and 3."""
-    doc = parse_file(get_demo_dir() / "demo.wbs.md")
-    levels = {n.level for n in doc.all_nodes()}
+    levels = {n.level for n in demo_nodes}
     assert {1, 2, 3}.issubset(levels)
 
 
@@ -134,6 +133,13 @@ def test_shift_dates_positive():
     assert "2026-01-10" not in result
 
 
+def test_shift_dates_repeated_dates():
+    """Every occurrence of a repeated date is shifted, across month ends."""
+    content = "<!-- demo-anchor: 2026-01-30 -->\n2026-01-30 | 2026-01-30 | 2026-02-01"
+    result = _shift_dates_in_content(content, timedelta(days=2))
+    assert result == "<!-- demo-anchor: 2026-02-01 -->\n2026-02-01 | 2026-02-01 | 2026-02-03"
+
+
 def test_shift_dates_negative():
     """Negative delta should shift dates backward."""
     content = "<!-- demo-anchor: 2026-03-10 -->\nstart: 2026-03-10 | end: 2026-03-20"
@@ -148,8 +154,8 @@ def test_shift_dates_negative():
 @pytest.mark.asyncio
 async def test_demo_app_starts_and_loads(demo_app):
     """Demo app should start and load data without errors."""
-    async with demo_app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with demo_app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(demo_app))
         assert demo_app.project is not None
         assert len(demo_app.project.documents) == 1
         assert len(demo_app.project.all_nodes()) >= 25
@@ -158,16 +164,16 @@ async def test_demo_app_starts_and_loads(demo_app):
 @pytest.mark.asyncio
 async def test_demo_app_title_contains_demo(demo_app):
     """Demo app title should contain [DEMO]."""
-    async with demo_app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with demo_app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(demo_app))
         assert "[DEMO]" in demo_app.title
 
 
 @pytest.mark.asyncio
 async def test_demo_app_no_file_lock(demo_app):
     """Demo mode should not create a file lock."""
-    async with demo_app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with demo_app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(demo_app))
         lock_file = get_demo_dir() / ".tui-wbs" / "lock"
         assert not lock_file.exists()
 
@@ -177,18 +183,18 @@ async def test_demo_app_save_disabled(demo_app):
     """Save action in demo mode should not modify files."""
     config_path = get_demo_dir() / ".tui-wbs" / "config.toml"
     original_content = config_path.read_text(encoding="utf-8")
-    async with demo_app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with demo_app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(demo_app))
         demo_app.action_save()
-        await pilot.pause(delay=PAUSE)
+        await pilot.pause()
         assert config_path.read_text(encoding="utf-8") == original_content
 
 
 @pytest.mark.asyncio
 async def test_demo_app_in_memory_editing(demo_app):
     """In-memory editing should work in demo mode."""
-    async with demo_app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with demo_app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(demo_app))
         assert demo_app.project is not None
         first_node = demo_app.project.all_nodes()[0]
         original_status = first_node.status
@@ -202,8 +208,8 @@ async def test_demo_app_in_memory_editing(demo_app):
 @pytest.mark.asyncio
 async def test_demo_app_no_autosave(demo_app):
     """Autosave should not be scheduled in demo mode."""
-    async with demo_app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with demo_app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(demo_app))
         assert demo_app.project is not None
         first_node = demo_app.project.all_nodes()[0]
         demo_app._update_node(first_node.id, status=Status.DONE)
@@ -213,8 +219,8 @@ async def test_demo_app_no_autosave(demo_app):
 @pytest.mark.asyncio
 async def test_demo_app_quit_no_confirm(demo_app):
     """Quit in demo mode should not show unsaved confirmation dialog."""
-    async with demo_app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with demo_app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(demo_app))
         # Make modifications so _modified is True
         assert demo_app.project is not None
         first_node = demo_app.project.all_nodes()[0]
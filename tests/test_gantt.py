@@ -5,11 +5,15 @@ from pathlib import Path
 
 import pytest
 
+from tests._helpers import loaded, wait_for
 from tui_wbs.models import Status, WBSNode, ViewConfig
-from tui_wbs.widgets.gantt_chart import SCALE_CONFIG, GanttView
-
-
-PAUSE = 0.15
+from tui_wbs.widgets.gantt_chart import (
+    SCALE_CONFIG,
+    GanttView,
+    _detail_label,
+    _detail_layout,
+    _iso_week_from_ord,
+)
 
 
 @pytest.fixture
@@ -57,6 +61,37 @@ class TestScaleConfig:
         assert SCALE_CONFIG["year"] == 365
 
 
+class TestDetailRowHelpers:
+    def test_layout_stops_at_width(self):
+        start = date(2026, 3, 2).toordinal()
+        layout = _detail_layout(start, start + 365, 7, 7, 20)
+        assert [col for col, _ in layout] == [0, 7, 14]
+        assert [o for _, o in layout] == [start, start + 7, start + 14]
+
+    def test_layout_stops_at_end_date(self):
+        start = date(2026, 3, 1).toordinal()
+        layout = _detail_layout(start, start + 2, 1, 2, 100)
+        assert len(layout) == 3
+
+    def test_layout_empty_when_end_before_start(self):
+        start = date(2026, 3, 1).toordinal()
+        assert _detail_layout(start, start - 1, 1, 2, 100) == []
+
+    def test_labels_per_scale(self):
+        o = date(2026, 3, 2).toordinal()
+        assert _detail_label("day", o, 2) == "02"
+        assert _detail_label("week", o, 7) == "  W10  "
+        assert _detail_label("month", o, 6) == " Mar  "
+        assert _detail_label("quarter", o, 6) == "  Q1  "
+        assert _detail_label("year", o, 6) == " 2026 "
+
+    def test_iso_week_matches_isocalendar(self):
+        d = date(2020, 12, 20)
+        for _ in range(800):
+            assert _iso_week_from_ord(d.toordinal()) == d.isocalendar()[1]
+            d += timedelta(days=1)
+
+
 class TestGanttViewDateRange:
     def test_date_range_from_nodes(self):
         view = GanttView()
@@ -93,6 +128,18 @@ class TestGanttViewDateRange:
         view.update_gantt([], "week", today, 0)
         assert view._rows == []
 
+    def test_row_fields_precomputed(self):
+        view = GanttView()
+        nodes = [
+            (WBSNode(title="A", level=1, start=date(2026, 3, 1), end=date(2026, 3, 10), progress=40), 0),
+            (WBSNode(title="B", level=1, milestone=True), 0),
+        ]
+        view.update_gantt(nodes, "week", date(2026, 3, 1), 0)
+        assert view._row_starts == [date(2026, 3, 1).toordinal(), -1]
+        assert view._row_ends == [date(2026, 3, 10).toordinal(), -1]
+        assert view._row_progress == [40, 0]
+        assert view._row_milestone == [False, True]
+
     def test_scroll_offset_shifts_date_range(self):
         view = GanttView()
         today = date(2026, 3, 1)
@@ -121,6 +168,48 @@ class TestGanttViewDateRange:
         assert view._days_per_col == 30
 
 
+class TestGanttViewRenderBar:
+    def _view(self, node, scale="month"):
+        view = GanttView()
+        view.update_gantt([(node, 0)], scale, date(2026, 3, 1), 0)
+        return view
+
+    def test_background_merged_into_runs(self):
+        node = WBSNode(title="A", level=1, start=date(2026, 3, 1), end=date(2026, 4, 1))
+        strip = self._view(node)._render_bar(0, 120)
+        segments = list(strip)
+        assert sum(len(s.text) for s in segments) == 120
+        assert len(segments) < 40
+
+    def test_bar_glyphs_and_today_marker(self):
+        node = WBSNode(
+            title="A", level=1, start=date(2026, 4, 1), end=date(2026, 6, 1), progress=50
+        )
+        view = self._view(node)
+        text = "".join(s.text for s in view._render_bar(0, 120))
+        start_col = view._date_to_col(date(2026, 4, 1))
+        assert text[start_col] == "█"
+        assert "░" in text
+        assert text[view._date_to_col(date(2026, 3, 1))] == "│"
+
+    def test_milestone_glyph(self):
+        node = WBSNode(title="M", level=1, start=date(2026, 4, 1), milestone=True)
+        view = self._view(node)
+        text = "".join(s.text for s in view._render_bar(0, 120))
+        assert text[view._date_to_col(date(2026, 4, 1))] == "◆"
+        assert "█" not in text
+
+    def test_rendered_rows_cached_until_update(self):
+        node = WBSNode(title="A", level=1, start=date(2026, 4, 1), end=date(2026, 5, 1))
+        view = self._view(node)
+        first = view._render_bar(0, 80)
+        assert view._render_bar(0, 80) is first
+        view._highlighted_row = 0
+        assert view._render_bar(0, 80) is not first
+        view.update_gantt([(node, 0)], "month", date(2026, 3, 1), 0)
+        assert view._line_cache == {}
+
+
 class TestGanttViewVirtualSize:
     def test_virtual_size_equals_row_count(self):
         """virtual_size height should equal len(rows), no header offset."""
@@ -197,6 +286,14 @@ class TestGanttChartUpdateRows:
         chart.update_rows(flat_rows)
         assert len(chart._flat_rows) == 1
 
+    def test_update_rows_refreshes_today(self):
+        from tui_wbs.widgets.gantt_chart import GanttChart
+
+        chart = GanttChart()
+        chart._today = date.today() - timedelta(days=3)  # started days ago
+        chart.update_rows([])
+        assert chart._today == date.today()
+
     def test_set_scale(self):
         from tui_wbs.widgets.gantt_chart import GanttChart
 
@@ -241,14 +338,14 @@ async def test_gantt_scroll_right_with_l_key(gantt_project):
 
     app = WBSApp(project_dir=gantt_project)
     async with app.run_test(size=(80, 30)) as pilot:
-        await pilot.pause(delay=PAUSE)
+        await wait_for(pilot, lambda: loaded(app))
         # Switch to table+gantt view
         for v in app.config.views:
             if v.type == "table+gantt":
                 app._active_view_id = v.id
                 break
         app._refresh_ui()
-        await pilot.pause(delay=PAUSE)
+        await pilot.pause()
 
         from tui_wbs.widgets.gantt_chart import GanttChart
 
@@ -257,7 +354,7 @@ async def test_gantt_scroll_right_with_l_key(gantt_project):
         initial_offset = gantt._scroll_offset
 
         app.action_kanban_right()
-        await pilot.pause(delay=PAUSE)
+        await pilot.pause()
 
         assert gantt._scroll_offset > initial_offset
 
@@ -269,14 +366,14 @@ async def test_gantt_scroll_left_with_h_key(gantt_project):
 
     app = WBSApp(project_dir=gantt_project)
     async with app.run_test(size=(80, 30)) as pilot:
-        await pilot.pause(delay=PAUSE)
+        await wait_for(pilot, lambda: loaded(app))
         # Switch to table+gantt view
         for v in app.config.views:
             if v.type == "table+gantt":
                 app._active_view_id = v.id
                 break
         app._refresh_ui()
-        await pilot.pause(delay=PAUSE)
+        await pilot.pause()
 
         from tui_wbs.widgets.gantt_chart import GanttChart
 
@@ -284,12 +381,12 @@ async def test_gantt_scroll_left_with_h_key(gantt_project):
 
         # First scroll right to have room to scroll left
         gantt.scroll_gantt(3)
-        await pilot.pause(delay=PAUSE)
+        await pilot.pause()
         scrolled_right = gantt._scroll_offset
         assert scrolled_right > 0
 
         app.action_kanban_left()
-        await pilot.pause(delay=PAUSE)
+        await pilot.pause()
 
         assert gantt._scroll_offset < scrolled_right
 
@@ -300,17 +397,17 @@ async def test_kanban_h_l_still_works(gantt_project):
     from tui_wbs.app import WBSApp
 
     app = WBSApp(project_dir=gantt_project)
-    async with app.run_test(size=(120, 40)) as pilot:
-        await pilot.pause(delay=PAUSE)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
         # Switch to kanban view
         for v in app.config.views:
             if v.type == "kanban":
                 app._active_view_id = v.id
                 break
         app._refresh_ui()
-        await pilot.pause(delay=PAUSE)
+        await pilot.pause()
 
         # In kanban view, action_kanban_left/right should not raise
         app.action_kanban_left()
         app.action_kanban_right()
-        await pilot.pause(delay=PAUSE)
+        await pilot.pause()
@@ -2,8 +2,45 @@
 
 import pytest
 
+from tests._helpers import loaded, wait_for
 from tui_wbs.models import Priority, Status, WBSNode, ViewConfig
-from tui_wbs.widgets.kanban_board import KanbanBoard
+from tui_wbs.widgets.kanban_board import KanbanBoard, KanbanCard, KanbanColumn
+
+
+def _board_settled(app) -> bool:
+    """True once no kanban rebuild is scheduled, running or queued."""
+    board = app.query_one(KanbanBoard)
+    return (
+        board._rebuild_timer is None
+        and not board._rebuild_in_flight
+        and not board._rebuild_pending
+    )
+
+
+async def _settle(app, pilot) -> None:
+    """Wait for the board to finish rebuilding, then for one refresh."""
+    await wait_for(pilot, lambda: _board_settled(app))
+    await pilot.pause()
+
+
+@pytest.fixture
+def kanban_project(tmp_path):
+    """Create a small project and make the kanban view active by default."""
+    (tmp_path / "project.wbs.md").write_text(
+        "# Board Project\n"
+        "\n"
+        "## Task A\n"
+        "| status | assignee |\n"
+        "| --- | --- |\n"
+        "| TODO | Alice |\n"
+        "\n"
+        "## Task B\n"
+        "| status | assignee |\n"
+        "| --- | --- |\n"
+        "| IN_PROGRESS | Bob |\n",
+        encoding="utf-8",
+    )
+    return tmp_path
 
 
 class TestKanbanBoardGrouping:
@@ -29,6 +66,21 @@ class TestKanbanBoardGrouping:
         board._flatten(nodes[0], flat)
         assert len(flat) == 4  # root + 3 children
 
+    def test_flatten_preorder(self):
+        board = KanbanBoard()
+        nodes = self._make_nodes()
+        flat: list[WBSNode] = []
+        board._flatten(nodes[0], flat)
+        assert [n.title for n in flat] == ["Root", "Todo Task", "Done Task", "In Progress"]
+
+    def test_all_flat_cached_per_node_list(self):
+        board = KanbanBoard()
+        board._wbs_nodes = self._make_nodes()
+        first = board._all_flat()
+        assert board._all_flat() is first
+        board._wbs_nodes = self._make_nodes()[0].children[:1]
+        assert [n.title for n in board._all_flat()] == ["Todo Task"]
+
     def test_group_by_status(self):
         board = KanbanBoard()
         board._group_by = "status"
@@ -154,3 +206,355 @@ class TestKanbanCardDisplay:
         node = WBSNode(title="Milestone", level=1, milestone=True)
         card = KanbanCard(node)
         assert "card-milestone" in card.classes
+
+    def test_locked_card_shows_lock_icon(self):
+        node = WBSNode(title="Blocked", level=1, depends="Other")
+        assert KanbanCard(node, locked=True)._label.plain.startswith("🔒 ")
+        assert not KanbanCard(node)._label.plain.startswith("🔒 ")
+
+    def test_compute_lock_states(self):
+        from tui_wbs.widgets.kanban_board import compute_lock_states
+
+        done = WBSNode(title="Done", level=1, status=Status.DONE)
+        todo = WBSNode(title="Todo", level=1)
+        after_done = WBSNode(title="A", level=1, depends="Done")
+        after_todo = WBSNode(title="B", level=1, depends="Todo")
+        flat = [done, todo, after_done, after_todo]
+        title_map = {n.title: n for n in flat}
+        locks = compute_lock_states(flat, title_map)
+        assert locks == {done.id: False, todo.id: False, after_done.id: False, after_todo.id: True}
+
+    def test_card_label_cached_by_display_fields(self):
+        from tui_wbs.widgets.kanban_board import _card_label
+
+        first = _card_label("Task", "▲", "Alice", False, False, "magenta")
+        assert _card_label("Task", "▲", "Alice", False, False, "magenta") is first
+        assert first.plain == "▲ Task\n  Alice"
+        locked = _card_label("Task", "▲", "Alice", False, True, "magenta")
+        assert locked is not first
+        assert locked.plain.startswith("🔒 ")
+
+    def test_card_label_styles_assignee_and_milestone(self):
+        from tui_wbs.widgets.kanban_board import _card_label
+
+        label = _card_label("Task", "▲", "Bob", True, False, "magenta")
+        assert label.plain == "▲ Task\n  Bob\n  ◇ Milestone"
+        styled = {label.plain[span.start:span.end]: str(span.style) for span in label.spans}
+        assert styled == {"Bob": "dim", "◇ Milestone": "magenta"}
+
+    def test_card_title_is_not_parsed_as_markup(self):
+        from tui_wbs.widgets.kanban_board import _card_label
+
+        label = _card_label("Fix [bold] tag [/i]", "", "", False, False, "magenta")
+        assert label.plain == " Fix [bold] tag [/i]"
+        assert label.spans == []
+
+
+async def _open_kanban(app, pilot):
+    await wait_for(pilot, lambda: loaded(app))
+    for v in app.config.views:
+        if v.type == "kanban":
+            app._active_view_id = v.id
+            break
+    app._refresh_ui()
+    await _settle(app, pilot)
+    return next(v for v in app.config.views if v.type == "kanban")
+
+
+def _find_card(app, node_id: str) -> KanbanCard:
+    return next(card for card in app.query(KanbanCard) if card.node_id == node_id)
+
+
+def _column_titles(app) -> dict[str, list[str]]:
+    return {
+        col._title: [card.node_id for card in col.query(KanbanCard)]
+        for col in app.query(KanbanColumn)
+    }
+
+
+@pytest.mark.asyncio
+async def test_rebuild_reuses_columns_and_cards(kanban_project):
+    """Changing one card's status moves only that card; other widgets survive."""
+    from tui_wbs.app import WBSApp
+
+    app = WBSApp(project_dir=kanban_project)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await _open_kanban(app, pilot)
+        columns_before = list(app.query(KanbanColumn))
+        task_a = app.project.find_node_by_title("Task A")
+        task_b = app.project.find_node_by_title("Task B")
+        card_b = _find_card(app, task_b.id)
+
+        app._update_node(task_a.id, status=Status.DONE)
+        await _settle(app, pilot)
+
+        assert list(app.query(KanbanColumn)) == columns_before
+        assert _find_card(app, task_b.id) is card_b
+        assert _column_titles(app)["DONE"] == [task_a.id]
+        assert task_a.id not in _column_titles(app)["TODO"]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_while_in_flight_is_deferred():
+    board = KanbanBoard()
+    board._rebuild_in_flight = True
+    await board._rebuild()
+    assert board._rebuild_pending is True
+
+
+@pytest.mark.asyncio
+async def test_burst_of_updates_settles_on_latest_data(kanban_project):
+    from tui_wbs.app import WBSApp
+
+    app = WBSApp(project_dir=kanban_project)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await _open_kanban(app, pilot)
+        task_a = app.project.find_node_by_title("Task A")
+        for status in (Status.IN_PROGRESS, Status.DONE, Status.TODO, Status.DONE):
+            app._update_node(task_a.id, status=status)
+            await pilot.pause()
+        await _settle(app, pilot)
+
+        columns = _column_titles(app)
+        assert columns["DONE"] == [task_a.id]
+        assert sum(len(ids) for ids in columns.values()) == 3
+
+
+@pytest.mark.asyncio
+async def test_rebuild_handles_group_by_change(kanban_project):
+    from tui_wbs.app import WBSApp
+
+    app = WBSApp(project_dir=kanban_project)
+    async with app.run_test(size=(80, 24)) as pilot:
+        view = await _open_kanban(app, pilot)
+        view.group_by = "assignee"
+        app._refresh_ui()
+        await _settle(app, pilot)
+
+        titles = [col._title for col in app.query(KanbanColumn)]
+        assert titles == ["(unassigned)", "Alice", "Bob"]
+
+
+class TestKanbanColumnCulling:
+    def _column(self, count: int) -> KanbanColumn:
+        cards = [WBSNode(title=f"Task {i}", level=2, status=Status.TODO) for i in range(count)]
+        col = KanbanColumn("TODO", cards)
+        # As measured from the default KanbanCard styles: border + bottom margin
+        col._card_chrome = 3
+        col._compute_offsets()
+        return col
+
+    def test_offsets_are_prefix_sums_of_card_heights(self):
+        col = self._column(3)
+        assert col._offsets == [0, 4, 8, 12]
+
+    def test_offsets_before_measuring_count_label_rows_only(self):
+        cards = [WBSNode(title=f"Task {i}", level=2, status=Status.TODO) for i in range(3)]
+        assert KanbanColumn("TODO", cards)._offsets == [0, 1, 2, 3]
+
+    def test_card_height_counts_wrapped_title_rows(self):
+        from tui_wbs.widgets.kanban_board import card_height
+
+        node = WBSNode(title="A fairly long card title", level=2, assignee="Bob")
+        assert card_height(node) == 2
+        assert card_height(node, 100, chrome=3) == 5
+        assert card_height(node, 10, chrome=3) == 7  # title wraps onto three rows
+
+    def test_card_height_counts_wrapped_label_lines(self):
+        from tui_wbs.widgets.kanban_board import card_height
+
+        node = WBSNode(
+            title="Task", level=2, assignee="Bartholomew Fitzgerald-Huntington", milestone=True
+        )
+        assert card_height(node, 100) == 3
+        assert card_height(node, 12) > 3  # the assignee line wraps too
+
+    def test_visible_range_windows_the_viewport(self):
+        col = self._column(100)
+        start, end = col._visible_range(0, 20)
+        assert start == 0
+        assert end < 100
+        start, end = col._visible_range(200, 20)
+        assert 0 < start <= 50 - 3
+        assert end >= 55
+
+    def test_visible_range_clamps_at_end(self):
+        col = self._column(10)
+        assert col._visible_range(10_000, 20)[1] == 10
+
+
+@pytest.mark.asyncio
+async def test_large_column_mounts_only_visible_cards(tmp_path):
+    from textual.containers import VerticalScroll
+    from tui_wbs.app import WBSApp
+
+    body = "".join(
+        f"\n## Task {i}\n| status |\n| --- |\n| TODO |\n" for i in range(120)
+    )
+    (tmp_path / "project.wbs.md").write_text("# Big\n" + body, encoding="utf-8")
+    app = WBSApp(project_dir=tmp_path)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await _open_kanban(app, pilot)
+        await _settle(app, pilot)
+        col = next(c for c in app.query(KanbanColumn) if c._title == "TODO")
+        scroll = col.query_one(VerticalScroll)
+        assert len(col.query(KanbanCard)) < len(col._cards)
+        assert all(card.id is None for card in col.query(KanbanCard))
+        assert scroll.virtual_size.height == col._offsets[-1]
+
+        scroll.scroll_end(animate=False)
+        await _settle(app, pilot)
+        mounted = [card.node_id for card in col.query(KanbanCard)]
+        assert mounted[-1] == col._cards[-1].id
+        assert len(mounted) < len(col._cards)
+
+
+@pytest.mark.asyncio
+async def test_culled_column_keeps_wrapped_titles(tmp_path):
+    from textual.containers import VerticalScroll
+    from tui_wbs.app import WBSApp
+
+    long_title = "Implement the authentication service with OAuth and refresh tokens"
+    body = "".join(
+        f"\n## {long_title} {i}\n| status |\n| --- |\n| TODO |\n" for i in range(60)
+    )
+    (tmp_path / "project.wbs.md").write_text("# Big\n" + body, encoding="utf-8")
+    app = WBSApp(project_dir=tmp_path)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await _open_kanban(app, pilot)
+        await _settle(app, pilot)
+        col = next(c for c in app.query(KanbanColumn) if c._title == "TODO")
+        scroll = col.query_one(VerticalScroll)
+        assert col._text_width > 0
+        cards = list(col.query(KanbanCard))
+        assert len(cards) < len(col._cards)
+        index = {node.id: i for i, node in enumerate(col._cards)}
+        for card in cards:
+            i = index[card.node_id]
+            # Long titles wrap instead of being cut off, and the offsets match
+            if col._cards[i].title.startswith(long_title):
+                assert card.outer_size.height > 3
+            outer = card.outer_size.height + card.styles.margin.height
+            assert outer == col._offsets[i + 1] - col._offsets[i]
+        assert scroll.virtual_size.height == col._offsets[-1]
+
+
+@pytest.mark.asyncio
+async def test_culled_column_measures_wrapped_assignees(tmp_path):
+    from textual.containers import VerticalScroll
+    from tui_wbs.app import WBSApp
+
+    body = "".join(
+        f"\n## Task {i}\n| status | assignee |\n| --- | --- |\n"
+        f"| TODO | Bartholomew Fitzgerald-Huntington the Third |\n"
+        for i in range(60)
+    )
+    (tmp_path / "project.wbs.md").write_text("# Big\n" + body, encoding="utf-8")
+    app = WBSApp(project_dir=tmp_path)
+    async with app.run_test(size=(60, 24)) as pilot:
+        await _open_kanban(app, pilot)
+        await _settle(app, pilot)
+        col = next(c for c in app.query(KanbanColumn) if c._title == "TODO")
+        scroll = col.query_one(VerticalScroll)
+        cards = list(col.query(KanbanCard))
+        assert len(cards) < len(col._cards)
+        # Cards render taller than title + one assignee row + border
+        assert any(card.outer_size.height > 4 for card in cards)
+        top, bottom = scroll.children[0], scroll.children[-1]
+        mounted = sum(card.outer_size.height + card.styles.margin.height for card in cards)
+        total = top.outer_size.height + mounted + bottom.outer_size.height
+        assert total == scroll.virtual_size.height == col._offsets[-1]
+
+
+def test_recompute_groups_memoized_per_update():
+    board = KanbanBoard()
+    root = WBSNode(title="Root", level=1, children=(
+        WBSNode(title="Todo Task", level=2, status=Status.TODO),
+    ))
+    board._wbs_nodes = [root]
+    first = board._recompute_groups()
+    assert board._recompute_groups() is first
+    assert [n.title for n in first[0]["TODO"]] == ["Root", "Todo Task"]
+    board._req_id += 1
+    assert board._recompute_groups() is not first
+
+
+@pytest.mark.asyncio
+async def test_refresh_with_unchanged_data_skips_sync(kanban_project):
+    from tui_wbs.app import WBSApp
+
+    app = WBSApp(project_dir=kanban_project)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await _open_kanban(app, pilot)
+        board = app.query_one(KanbanBoard)
+        calls = []
+        original = board._sync_columns
+
+        async def counting(*args):
+            calls.append(args)
+            return await original(*args)
+
+        board._sync_columns = counting
+        app._refresh_ui()
+        await _settle(app, pilot)
+        assert calls == []
+
+        task_a = app.project.find_node_by_title("Task A")
+        app._update_node(task_a.id, status=Status.DONE)
+        await _settle(app, pilot)
+        assert len(calls) == 1
+        assert _column_titles(app)["DONE"] == [task_a.id]
+
+
+def test_recompute_groups_by_priority_keeps_enum_order():
+    board = KanbanBoard()
+    board._group_by = "priority"
+    board._wbs_nodes = [
+        WBSNode(title="Low", level=1, priority=Priority.LOW),
+        WBSNode(title="High", level=1, priority=Priority.HIGH),
+    ]
+    groups, _ = board._recompute_groups()
+    assert list(groups) == [p.value for p in Priority]
+    assert [n.title for n in groups["HIGH"]] == ["High"]
+    assert groups["MEDIUM"] == []
+
+
+def test_move_card_finds_nested_node_by_id():
+    board = KanbanBoard()
+    child = WBSNode(title="Child", level=2, status=Status.IN_PROGRESS, id="child-id")
+    board._wbs_nodes = [WBSNode(title="Root", level=1, children=(child,))]
+    messages = []
+    board.post_message = lambda msg: messages.append(msg)
+
+    board.move_card("child-id", 1)
+    assert [m.new_status for m in messages] == [Status.DONE]
+    assert board._node_index["child-id"] is child
+
+
+def test_card_uses_passed_milestone_color():
+    node = WBSNode(title="Launch", level=1, milestone=True)
+    card = KanbanCard(node, milestone_color="red")
+    assert [str(span.style) for span in card._label.spans] == ["red"]
+    label = KanbanCard._build_label(node, False, "blue")
+    assert [str(span.style) for span in label.spans] == ["blue"]
+
+
+@pytest.mark.asyncio
+async def test_new_columns_are_mounted_in_group_order(kanban_project):
+    from tui_wbs.app import WBSApp
+
+    app = WBSApp(project_dir=kanban_project)
+    async with app.run_test(size=(80, 24)) as pilot:
+        view = await _open_kanban(app, pilot)
+        view.group_by = "assignee"
+        app._refresh_ui()
+        await _settle(app, pilot)
+        bob = next(c for c in app.query(KanbanColumn) if c._title == "Bob")
+
+        task_a = app.project.find_node_by_title("Task A")
+        app._update_node(task_a.id, assignee="Carl")
+        await _settle(app, pilot)
+
+        columns = list(app.query(KanbanColumn))
+        assert [col._title for col in columns] == ["(unassigned)", "Carl", "Bob"]
+        assert columns[2] is bob
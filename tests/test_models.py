@@ -19,8 +19,10 @@ from tui_wbs.models import (
     WBSDocument,
     WBSNode,
     WBSProject,
+    compute_lock_states,
     format_date,
     has_incomplete_dependencies,
+    preorder_nodes,
 )
 
 
@@ -71,6 +73,15 @@ class TestWBSNode:
         assert len(all_nodes) == 3
         assert [n.title for n in all_nodes] == ["Root", "Child", "GC"]
 
+    def test_all_nodes_deep_tree(self):
+        node = WBSNode(title="Leaf", level=3)
+        for i in range(3000):
+            node = WBSNode(title=f"N{i}", level=2, children=(node,))
+        all_nodes = node.all_nodes()
+        assert len(all_nodes) == 3001
+        assert all_nodes[0] is node
+        assert all_nodes[-1].title == "Leaf"
+
     def test_status_icon(self):
         for status, icon in STATUS_ICONS.items():
             node = WBSNode(title="T", level=1, status=status)
@@ -136,6 +147,13 @@ class TestFormatDate:
     def test_none_with_custom_format(self):
         assert format_date(None, "DD.MM.YYYY") == ""
 
+    def test_repeated_dates_are_cached(self):
+        format_date.cache_clear()
+        for _ in range(3):
+            assert format_date(date(2026, 4, 1), "YYYY-MM-DD") == "2026-04-01"
+        info = format_date.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+
     def test_presets_dict_has_default(self):
         assert DEFAULT_DATE_FORMAT in DATE_FORMAT_PRESETS
 
@@ -151,6 +169,21 @@ class TestHasIncompleteDependencies:
         title_map = {"Dep1": dep}
         assert has_incomplete_dependencies(node, title_map) is False
 
+    def test_compute_lock_states(self):
+        done = WBSNode(title="D", level=1, status=Status.DONE)
+        todo = WBSNode(title="T", level=1)
+        nodes = [
+            WBSNode(title="Free", level=1, id="free"),
+            WBSNode(title="Blank", level=1, id="blank", depends=" ; "),
+            WBSNode(title="Ok", level=1, id="ok", depends="D"),
+            WBSNode(title="Blocked", level=1, id="blocked", depends="D; T"),
+            WBSNode(title="Missing", level=1, id="missing", depends="Nope"),
+        ]
+        states = compute_lock_states(nodes, {"D": done, "T": todo})
+        assert states == {
+            "free": False, "blank": False, "ok": False, "blocked": True, "missing": True,
+        }
+
     def test_dep_not_done(self):
         dep = WBSNode(title="Dep1", level=1, status=Status.IN_PROGRESS)
         node = WBSNode(title="A", level=1, depends="Dep1")
@@ -182,6 +215,19 @@ class TestHasIncompleteDependencies:
         assert has_incomplete_dependencies(node, title_map) is False
 
 
+class TestPreorderNodes:
+    def test_preorder_across_roots(self):
+        a1 = WBSNode(title="A1", level=3)
+        a = WBSNode(title="A", level=2, children=(a1,))
+        b = WBSNode(title="B", level=2)
+        r1 = WBSNode(title="R1", level=1, children=(a, b))
+        r2 = WBSNode(title="R2", level=1)
+        assert [n.title for n in preorder_nodes([r1, r2])] == ["R1", "A", "A1", "B", "R2"]
+
+    def test_empty(self):
+        assert preorder_nodes([]) == []
+
+
 class TestWBSDocument:
     def test_all_nodes(self):
         child = WBSNode(title="Child", level=2)
@@ -223,3 +269,31 @@ class TestWBSProject:
         project = WBSProject(dir_path=".", documents=[doc])
         assert project.find_node_by_title("Target") is node
         assert project.find_node_by_title("Missing") is None
+
+    def test_find_node_by_title_follows_edits(self):
+        child = WBSNode(title="Old", level=2)
+        root = WBSNode(title="Root", level=1, children=(child,))
+        dup = WBSNode(title="Root", level=1)
+        doc = WBSDocument(file_path="a.md", root_nodes=[root, dup])
+        project = WBSProject(dir_path=".", documents=[doc])
+        assert project.find_node_by_title("Root") is root  # first occurrence wins
+        assert project.find_node_by_title("Old") is child
+
+        renamed = replace(child, title="New")
+        doc.root_nodes[0] = root.replace_child(child.id, renamed)
+        assert project.find_node_by_title("Old") is None
+        assert project.find_node_by_title("New") is renamed
+
+    def test_search_haystack_follows_edits(self):
+        child = WBSNode(title="Draft", level=2, assignee="Kim")
+        root = WBSNode(title="Root", level=1, memo="Notes", children=(child,))
+        doc = WBSDocument(file_path="a.md", root_nodes=[root])
+        project = WBSProject(dir_path=".", documents=[doc])
+        assert project.search_haystack() == [
+            ("root\n\nnotes", root.id),
+            ("draft\nkim\n", child.id),
+        ]
+        assert project.search_haystack() is project.search_haystack()
+
+        doc.root_nodes[0] = root.replace_child(child.id, replace(child, assignee="Lee"))
+        assert [text for text, _ in project.search_haystack()] == ["root\n\nnotes", "draft\nlee\n"]
@@ -118,6 +118,17 @@ class TestMetadataParsing:
         assert node.custom_fields["team"] == "Backend"
         assert node.custom_fields["risk"] == "High"
 
+    def test_repeated_values_are_shared(self):
+        md = "".join(
+            f"# Task {i}\n| assignee | duration | team |\n| --- | --- | --- |\n| Jane | 2d | Core |\n"
+            for i in range(2)
+        )
+        a, b = parse_markdown(md, "test.md").root_nodes
+        assert a.assignee is b.assignee
+        assert a.duration is b.duration
+        (key_a,), (key_b,) = a.custom_fields, b.custom_fields
+        assert key_a is key_b
+
 
 class TestMemo:
     def test_memo_parsing(self):
@@ -0,0 +1,292 @@
+"""Tests for the WBS table widget."""
+
+import pytest
+
+from tests._helpers import loaded, wait_for
+from tui_wbs.models import WBSNode
+from tui_wbs.widgets.wbs_table import SyncedDataTable, WBSTable
+
+
+def _tree() -> list[WBSNode]:
+    return [
+        WBSNode(title="Root", level=1, id="root", children=(
+            WBSNode(title="A", level=2, id="a", children=(
+                WBSNode(title="A1", level=3, id="a1"),
+                WBSNode(title="A2", level=3, id="a2"),
+            )),
+            WBSNode(title="B", level=2, id="b"),
+        )),
+        WBSNode(title="Other", level=1, id="other"),
+    ]
+
+
+class TestFlattenRows:
+    def test_preorder_with_hierarchical_ids(self):
+        table = WBSTable(_tree())
+        rows = [(node.id, depth, hier_id) for node, depth, hier_id in table._flatten_rows()]
+        assert rows == [
+            ("root", 0, "1"),
+            ("a", 1, "1.1"),
+            ("a1", 2, "1.1.1"),
+            ("a2", 2, "1.1.2"),
+            ("b", 1, "1.2"),
+            ("other", 0, "2"),
+        ]
+
+    def test_collapsed_children_are_skipped(self):
+        table = WBSTable(_tree())
+        table._collapsed.add("a")
+        ids = [node.id for node, _, _ in table._flatten_rows()]
+        assert ids == ["root", "a", "b", "other"]
+
+    def test_deep_tree_does_not_recurse(self):
+        node = WBSNode(title="leaf", level=1)
+        for i in range(3000):
+            node = WBSNode(title=f"n{i}", level=1, children=(node,))
+        rows = WBSTable([node])._flatten_rows()
+        assert len(rows) == 3001
+        assert rows[-1][1] == 3000
+
+    def test_visible_rows_reflattened_only_on_tree_change(self):
+        tree = _tree()
+        table = WBSTable(tree)
+        rows = table._visible_rows()
+        assert table._visible_rows() is rows
+        table.update_data(list(tree))  # same roots, new list
+        assert table._visible_rows() is rows
+        table.toggle_collapse("a")
+        assert [node.id for node, _, _ in table._visible_rows()] == ["root", "a", "b", "other"]
+        table.update_data(_tree())
+        assert table._visible_rows() is not rows
+
+    def test_row_lookup_by_id(self):
+        table = WBSTable(_tree())
+        table._visible_rows()
+        node, depth, hier_id = table.get_row_by_id("a2")
+        assert (node.title, depth, hier_id) == ("A2", 2, "1.1.2")
+        assert table.row_index("b") == 4
+        table.toggle_collapse("a")
+        table._visible_rows()
+        assert table.get_row_by_id("a2") is None
+        assert table.row_index("b") == 2
+
+
+class TestRowCache:
+    def _table(self) -> WBSTable:
+        from tui_wbs.models import ViewConfig
+
+        return WBSTable(_tree(), ViewConfig(columns=["id", "title", "status"]))
+
+    def test_same_node_reuses_row(self):
+        table = self._table()
+        root = table._wbs_nodes[0]
+        row = table._make_row(root, 0, "1")
+        assert table._make_row(root, 0, "1") is row
+
+    def test_replaced_node_builds_new_row(self):
+        from dataclasses import replace
+
+        table = self._table()
+        root = table._wbs_nodes[0]
+        row = table._make_row(root, 0, "1")
+        renamed = replace(root, title="Renamed")
+        new_row = table._make_row(renamed, 0, "1")
+        assert new_row is not row
+        assert "Renamed" in new_row[1].plain
+
+    def test_collapsed_state_is_part_of_key(self):
+        table = self._table()
+        root = table._wbs_nodes[0]
+        expanded = table._make_row(root, 0, "1")
+        table._collapsed.add(root.id)
+        collapsed = table._make_row(root, 0, "1")
+        assert "▼" in expanded[1].plain
+        assert "▶" in collapsed[1].plain
+
+    def test_update_data_clears_cache(self):
+        table = self._table()
+        table._make_row(table._wbs_nodes[0], 0, "1")
+        table.update_data(_tree())
+        assert table._row_cache == {}
+
+
+class TestProgressCell:
+    def test_none_is_blank(self):
+        from tui_wbs.widgets.wbs_table import _make_progress_cell
+
+        assert _make_progress_cell(None) == ""
+
+    def test_cells_are_shared_and_clamped(self):
+        from tui_wbs.widgets.wbs_table import _make_progress_cell
+
+        assert _make_progress_cell(40) is _make_progress_cell(40)
+        assert _make_progress_cell(150) is _make_progress_cell(100)
+        assert _make_progress_cell(50).plain == " 50% ████░░░░"
+
+    def test_rebuilt_when_theme_thresholds_change(self, monkeypatch):
+        from tui_wbs import theme
+        from tui_wbs.widgets.wbs_table import _make_progress_cell
+
+        before = _make_progress_cell(80)
+        monkeypatch.setattr(theme, "PROGRESS_THRESHOLDS", [(0, "red")])
+        after = _make_progress_cell(80)
+        assert after is not before
+        assert "red" in [str(span.style) for span in after.spans]
+
+    def test_custom_width_is_built_directly(self):
+        from tui_wbs.widgets.wbs_table import _make_progress_cell
+
+        assert _make_progress_cell(50, bar_width=4).plain == " 50% ██░░"
+
+
+class TestEnumCells:
+    def test_status_and_priority_cells_are_shared(self):
+        from tui_wbs.models import Priority, Status
+        from tui_wbs.widgets.wbs_table import _cell_priority, _cell_status
+
+        a = WBSNode(title="A", level=1, status=Status.DONE, priority=Priority.LOW)
+        b = WBSNode(title="B", level=1, status=Status.DONE, priority=Priority.LOW)
+        assert _cell_status(None, a, 0, "1") is _cell_status(None, b, 0, "2")
+        assert _cell_priority(None, a, 0, "1") is _cell_priority(None, b, 0, "2")
+        assert _cell_status(None, a, 0, "1").plain == f"{a.status_icon} DONE"
+
+    def test_restyled_when_theme_colors_change(self, monkeypatch):
+        from tui_wbs import theme
+        from tui_wbs.models import Status
+        from tui_wbs.widgets.wbs_table import _cell_status
+
+        node = WBSNode(title="A", level=1, status=Status.TODO)
+        before = _cell_status(None, node, 0, "1")
+        monkeypatch.setattr(theme, "STATUS_COLORS", {Status.TODO: "magenta"})
+        after = _cell_status(None, node, 0, "1")
+        assert after is not before
+        assert "magenta" in [str(span.style) for span in after.spans]
+
+    def test_label_cells_are_shared(self):
+        from tui_wbs.widgets.wbs_table import _cell_label
+
+        a = WBSNode(title="A", level=1, custom_fields={"label": "ui, api"})
+        b = WBSNode(title="B", level=1, custom_fields={"label": "ui, api"})
+        assert _cell_label(None, a, 0, "1") is _cell_label(None, b, 0, "2")
+        assert _cell_label(None, WBSNode(title="C", level=1), 0, "3") == ""
+
+
+def test_row_renderers_are_resolved_once_per_layout():
+    from tui_wbs.widgets.wbs_table import _COLUMN_RENDERERS, _row_renderers
+
+    renderers = _row_renderers(("id", "team"))
+    assert renderers is _row_renderers(("id", "team"))
+    assert renderers[0] is _COLUMN_RENDERERS["id"]
+    node = WBSNode(title="T", level=1, custom_fields={"team": "Core"})
+    assert renderers[1](None, node, 0, "1") == "Core"
+
+
+def test_make_row_dispatches_builtin_and_custom_columns():
+    from tui_wbs.models import Priority, ViewConfig
+
+    node = WBSNode(
+        title="Task",
+        level=2,
+        priority=Priority.HIGH,
+        assignee="Alice",
+        milestone=True,
+        custom_fields={"team": "Backend", "label": "ui, api"},
+    )
+    table = WBSTable([node], ViewConfig(columns=["id", "assignee", "priority", "team", "label", "nope"]))
+    row = table._make_row(node, 0, "3")
+    assert row[0] == "3"
+    assert row[1] == "Alice"
+    assert row[2].plain.endswith("HIGH")
+    assert row[3] == "Backend"
+    assert row[4].plain == "[ui] [api]"
+    assert row[5] == ""
+
+
+class TestLockIcon:
+    def test_title_uses_precomputed_lock_state(self):
+        from tui_wbs.models import LOCK_ICON, ViewConfig
+
+        node = WBSNode(title="Task", level=1)
+        table = WBSTable([node], ViewConfig(columns=["title"]))
+        table._lock_states[node.id] = True
+        assert table._make_row(node, 0, "1")[0].plain.endswith(LOCK_ICON)
+
+    def test_title_falls_back_to_dependency_check(self):
+        from tui_wbs.models import LOCK_ICON, Status, ViewConfig
+
+        dep = WBSNode(title="Dep", level=1, status=Status.TODO)
+        node = WBSNode(title="Task", level=1, depends="Dep")
+        table = WBSTable([dep, node], ViewConfig(columns=["title"]), title_map={"Dep": dep})
+        assert table._make_row(node, 0, "2")[0].plain.endswith(LOCK_ICON)
+        assert not table._make_row(dep, 0, "1")[0].plain.endswith(LOCK_ICON)
+
+
+@pytest.mark.asyncio
+async def test_toggle_collapse_patches_rows(tmp_path):
+    from tui_wbs.app import WBSApp
+
+    body = "".join(
+        f"\n## Phase {i}\n" + "".join(f"\n### Task {i}.{j}\n" for j in range(3))
+        for i in range(3)
+    )
+    (tmp_path / "project.wbs.md").write_text("# Project\n" + body, encoding="utf-8")
+    app = WBSApp(project_dir=tmp_path)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for(pilot, lambda: loaded(app))
+        table = app.query_one(WBSTable)
+        data_table = table.query_one(SyncedDataTable)
+
+        def displayed_keys():
+            return [
+                data_table.coordinate_to_cell_key((i, 0)).row_key.value
+                for i in range(data_table.row_count)
+            ]
+
+        phase = next(node for node, _, _ in table._flat_rows if node.title == "Phase 1")
+        root_row = data_table.rows[table._flat_rows[0][0].id]
+
+        table.toggle_collapse(phase.id)
+        await pilot.pause()
+        assert displayed_keys() == [node.id for node, _, _ in table._flat_rows]
+        assert not any(node.title.startswith("Task 1.") for node, _, _ in table._flat_rows)
+        assert "▶" in data_table.get_cell(phase.id, "title").plain
+        # Untouched rows are kept as-is: no full rebuild happened
+        assert data_table.rows[table._flat_rows[0][0].id] is root_row
+
+        table.toggle_collapse(phase.id)
+        await pilot.pause()
+        assert displayed_keys() == [node.id for node, _, _ in table._flat_rows]
+        assert [node.title for node, _, _ in table._flat_rows][6:9] == ["Task 1.0", "Task 1.1", "Task 1.2"]
+        assert "▼" in data_table.get_cell(phase.id, "title").plain
+
+
+def test_overdue_highlight_uses_rebuild_date():
+    from datetime import date, timedelta
+    from tui_wbs.models import ViewConfig
+
+    node = WBSNode(title="Task", level=1, start=date.today() + timedelta(days=1))
+    table = WBSTable([node], ViewConfig(columns=["title"]))
+    assert table._make_row(node, 0, "1")[0].spans == []
+
+    table._today = date.today() + timedelta(days=2)
+    table._row_cache.clear()
+    assert table._make_row(node, 0, "1")[0].spans != []
+
+    # A new day drops cached rows so the highlight is re-evaluated
+    assert table._refresh_today() is True
+    assert table._row_cache == {}
+    assert table._refresh_today() is False
+
+
+def test_overdue_title_span_uses_shared_style():
+    from datetime import date, timedelta
+    from tui_wbs.models import ViewConfig
+
+    yesterday = date.today() - timedelta(days=1)
+    nodes = [WBSNode(title=f"Late {i}", level=1, start=yesterday) for i in range(2)]
+    table = WBSTable(nodes, ViewConfig(columns=["title"]))
+    first, second = (table._make_row(node, 0, str(i))[0] for i, node in enumerate(nodes))
+    (span,) = first.spans
+    assert first.plain[span.start:span.end] == "Late 0"
+    assert "bold" in str(span.style)
+    assert second.spans[0].style is span.style
@@ -1,14 +1,20 @@
 """Tests for Markdown writer."""
 
+import os
 from dataclasses import replace
 from datetime import date
 from pathlib import Path
 
 import pytest
 
-from tui_wbs.models import Priority, Status, WBSDocument, WBSNode
+from tui_wbs.models import Priority, Status, WBSDocument, WBSNode, WBSProject
 from tui_wbs.parser import parse_markdown
-from tui_wbs.writer import serialize_document, write_document
+from tui_wbs.writer import (
+    iter_serialize_document,
+    serialize_document,
+    write_document,
+    write_project,
+)
 
 
 class TestSerializeUnmodified:
@@ -106,6 +112,91 @@ class TestSerializeModified:
         assert "Backend" in result
         assert "IN_PROGRESS" in result
 
+    def test_modified_child_keeps_document_order(self):
+        md = (
+            "# Root\n"
+            "## A\n"
+            "### A1\n"
+            "## B\n"
+        )
+        doc = parse_markdown(md, "test.md")
+        doc.modified = True
+        root = doc.root_nodes[0]
+        a, b = root.children
+        a = replace(a, children=(replace(a.children[0], _meta_modified=True),))
+        doc.root_nodes[0] = replace(root, children=(a, b))
+
+        headings = [line for line in serialize_document(doc).splitlines() if line.startswith("#")]
+        assert headings == ["# Root", "## A", "### A1", "## B"]
+
+    def test_deeply_nested_document(self):
+        node = WBSNode(title="Leaf", level=1, _meta_modified=True)
+        for i in range(3000):
+            node = WBSNode(title=f"N{i}", level=1, children=(node,), _meta_modified=True)
+        doc = WBSDocument(file_path=Path("deep.md"), root_nodes=[node], modified=True)
+        result = serialize_document(doc)
+        assert result.count("# ") == 3001
+        assert result.rstrip().endswith("| MEDIUM |")
+
+    def test_meta_table_rows_align(self):
+        node = WBSNode(
+            title="Task", level=1, status=Status.DONE, assignee="Kim",
+            progress=40, custom_fields={"team": "Core"}, _meta_modified=True,
+        )
+        doc = WBSDocument(file_path=Path("t.md"), root_nodes=[node], modified=True)
+        header, sep, values = serialize_document(doc).splitlines()[1:4]
+        assert header == "| status | assignee | priority | progress | team |"
+        assert sep == "| --- | --- | --- | --- | --- |"
+        assert values == "| DONE | Kim | MEDIUM | 40 | Core |"
+
+
+class TestIterSerializeDocument:
+    @pytest.mark.parametrize("raw", ["", "# Root\n", "# Root"])
+    def test_chunks_match_serialize_document(self, raw):
+        md = "# Root\n## Child\nbody\n"
+        doc = parse_markdown(md, "test.md")
+        doc.raw_content = raw
+        doc.modified = True
+        root = doc.root_nodes[0]
+        doc.root_nodes[0] = replace(root, memo="note", _meta_modified=True)
+
+        expected = "\n".join(
+            ["# Root", "| status | priority |", "| --- | --- |", "| TODO | MEDIUM |",
+             "", "note", "", "## Child", "body", ""]
+        )
+        assert serialize_document(doc) == expected
+        assert "".join(iter_serialize_document(doc)) == expected
+
+    def test_write_streams_modified_document(self, tmp_path):
+        target = tmp_path / "test.wbs.md"
+        node = WBSNode(title="Task", level=1, memo="line1\nline2", _meta_modified=True)
+        doc = WBSDocument(file_path=target, root_nodes=[node], raw_content="x\n", modified=True)
+        expected = serialize_document(doc)
+
+        write_document(doc, backup=False)
+        assert target.read_text(encoding="utf-8") == expected
+
+    def test_reserialize_after_edit_reuses_unchanged_subtrees(self):
+        md = "# Root\n## A\nbody a\n## B\nbody b\n# Other\ntext\n"
+        doc = parse_markdown(md, "test.md")
+        doc.modified = True
+        assert serialize_document(doc) == md
+
+        root = doc.root_nodes[0]
+        child_a, child_b = root.children
+        new_b = replace(child_b, status=Status.DONE, _meta_modified=True)
+        doc.root_nodes[0] = root.replace_child(child_b.id, new_b)
+        cached = dict(doc._subtree_text)
+
+        result = serialize_document(doc)
+        assert result == (
+            "# Root\n## A\nbody a\n## B\n| status | priority |\n| --- | --- |\n"
+            "| DONE | MEDIUM |\n\nbody b\n\n# Other\ntext\n"
+        )
+        assert doc._subtree_text[id(child_a)] is cached[id(child_a)]
+        assert doc._subtree_text[id(doc.root_nodes[1])] is cached[id(doc.root_nodes[1])]
+        assert id(child_b) not in doc._subtree_text
+
 
 class TestWriteDocument:
     def test_write_creates_file(self, tmp_path):
@@ -135,6 +226,34 @@ class TestWriteDocument:
         assert bak.exists()
         assert bak.read_text(encoding="utf-8") == "original"
 
+    def test_backup_replaces_previous_backup(self, tmp_path):
+        target = tmp_path / "test.wbs.md"
+        target.write_text("v1", encoding="utf-8")
+        write_document(WBSDocument(file_path=target, raw_content="v2"), backup=True)
+        write_document(WBSDocument(file_path=target, raw_content="v3"), backup=True)
+
+        assert target.read_text(encoding="utf-8") == "v3"
+        assert (tmp_path / "test.wbs.md.bak").read_text(encoding="utf-8") == "v2"
+
+    def test_failed_backup_keeps_previous_backup(self, tmp_path, monkeypatch):
+        from tui_wbs import writer
+
+        def fail(*args, **kwargs):
+            raise OSError("no space")
+
+        target = tmp_path / "test.wbs.md"
+        target.write_text("v2", encoding="utf-8")
+        bak = tmp_path / "test.wbs.md.bak"
+        bak.write_text("v1", encoding="utf-8")
+        monkeypatch.setattr(writer, "_O_TMPFILE", 0)  # write via a named temp file
+        monkeypatch.setattr(writer.os, "link", fail)
+        monkeypatch.setattr(writer.shutil, "copyfile", fail)
+        write_document(WBSDocument(file_path=target, raw_content="v3"), backup=True)
+
+        assert target.read_text(encoding="utf-8") == "v3"
+        assert bak.read_text(encoding="utf-8") == "v1"
+        assert list(tmp_path.glob(".tui-wbs-*")) == []
+
     def test_atomic_write(self, tmp_path):
         """Test that write is atomic (no partial writes)."""
         target = tmp_path / "test.wbs.md"
@@ -147,3 +266,66 @@ class TestWriteDocument:
         # No temp files should remain
         tmp_files = list(tmp_path.glob(".tui-wbs-*"))
         assert len(tmp_files) == 0
+
+    def test_named_temp_file_fallback(self, tmp_path, monkeypatch):
+        from tui_wbs import writer
+
+        monkeypatch.setattr(writer, "_O_TMPFILE", 0)
+        target = tmp_path / "test.wbs.md"
+        target.write_text("old", encoding="utf-8")
+        node = WBSNode(title="Task", level=1, _meta_modified=True)
+        doc = WBSDocument(file_path=target, root_nodes=[node], modified=True)
+        write_document(doc, backup=False)
+
+        assert target.read_text(encoding="utf-8").startswith("# Task\n")
+        assert list(tmp_path.glob(".tui-wbs-*")) == []
+
+    @pytest.mark.skipif(not hasattr(os, "O_TMPFILE"), reason="Linux only")
+    def test_unlinkable_tmpfile_falls_back(self, tmp_path, monkeypatch):
+        from tui_wbs import writer
+
+        def fail_link(*args, **kwargs):
+            raise OSError("no linkat")
+
+        monkeypatch.setattr(writer, "_O_TMPFILE", os.O_TMPFILE)
+        monkeypatch.setattr(writer.os, "link", fail_link)
+        target = tmp_path / "test.wbs.md"
+        node = WBSNode(title="Task", level=1, _meta_modified=True)
+        doc = WBSDocument(file_path=target, root_nodes=[node], modified=True)
+        write_document(doc, backup=False)
+
+        assert target.read_text(encoding="utf-8").startswith("# Task\n")
+        assert list(tmp_path.glob(".tui-wbs-*")) == []
+        assert writer._O_TMPFILE == 0
+
+
+class TestWriteProject:
+    def test_writes_only_modified_documents(self, tmp_path):
+        docs = []
+        for i in range(5):
+            target = tmp_path / f"d{i}.wbs.md"
+            target.write_text("old", encoding="utf-8")
+            node = WBSNode(title=f"New {i}", level=1, _meta_modified=True)
+            docs.append(WBSDocument(file_path=target, root_nodes=[node], modified=i != 2))
+        write_project(WBSProject(dir_path=tmp_path, documents=docs), backup=False)
+
+        for i, doc in enumerate(docs):
+            content = doc.file_path.read_text(encoding="utf-8")
+            if i == 2:
+                assert content == "old"
+                assert doc.modified is False  # untouched, never written
+            else:
+                assert content.startswith(f"# New {i}\n")
+                assert doc.modified is False
+
+    def test_failure_is_raised(self, tmp_path):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+        node = WBSNode(title="X", level=1, _meta_modified=True)
+        ok = WBSDocument(file_path=tmp_path / "ok.wbs.md", root_nodes=[node], modified=True)
+        bad = WBSDocument(file_path=blocker / "bad.wbs.md", root_nodes=[node], modified=True)
+        with pytest.raises(OSError):
+            write_project(WBSProject(dir_path=tmp_path, documents=[ok, bad]), backup=False)
+        assert ok.file_path.read_text(encoding="utf-8").startswith("# X\n")
+        assert ok.modified is False
+        assert bad.modified is True